@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Local HTTP API for blog generation
+
+A standalone asyncio HTTP/1.1 server (standard library only) in front of
+the job queue and the workflow catalog:
+
+    POST /jobs                                 queue a blog post (JSON body of
+                                               create_blog_post arguments) -> 202
+    GET  /jobs/<job_id>                        job status and phase progress
+    GET  /workflows?limit=&sort_by=&search=    one page of workflows; pass the
+                                               returned "next" back as ?after=
+    GET  /workflows/<id>                       workflow summary
+    GET  /workflows/<id>/status                get_workflow_status
+    GET  /workflows/<id>/artifacts/<kind>      rendered artifact (see ARTIFACT_FILES)
+    GET  /workflows/<id>/files/<name>          any workflow file, streamed
+    GET  /workflows/<id>/bundle.zip            all files as a streamed ZIP
+    GET  /health                               queue depth and live workers
+
+Generation runs in a bounded pool of worker processes fed by the job
+queue. When max_queue jobs are already waiting, POST /jobs answers 429
+with Retry-After; beyond max_connections open connections new ones get
+503. Connections are kept alive between requests (HTTP/1.1 default), and
+blocking catalog and file work runs on a bounded thread pool so the event
+loop only parses and writes.
+
+    python api_server.py --port 8080 --workers 4 --max-queue 100
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+import argparse
+import asyncio
+import base64
+import json
+import os
+import re
+import signal
+import sys
+import threading
+
+from blog_logging import configure_console_logging, get_logger
+from blog_team_coordinator import ARTIFACT_FILES, BlogTeamCoordinator
+from job_queue import JobWorkerPool, validate_job_params
+from workflow_catalog import SORT_COLUMNS
+
+logger = get_logger("api")
+
+SERVER_NAME = "blog-team-api"
+
+# Largest request head and body accepted
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024
+
+# Seconds an idle keep-alive connection is kept open
+KEEP_ALIVE_TIMEOUT = 15
+
+# Largest job ID SQLite can store
+MAX_JOB_ID = 2 ** 63 - 1
+
+# Largest page of GET /workflows
+MAX_PAGE_SIZE = 200
+
+# Listing pages and match counts kept per catalog version (a new version drops them)
+LISTING_CACHE_ENTRIES = 1024
+
+# Seconds suggested to clients turned away with 429 / 503
+RETRY_AFTER = 5
+
+ARTIFACT_TYPES = {
+    "markdown": "text/markdown; charset=utf-8",
+    "seo_html": "text/html; charset=utf-8",
+    "blog_page": "text/html; charset=utf-8",
+    "content_brief": "text/markdown; charset=utf-8",
+    "optimization_report": "text/plain; charset=utf-8"
+}
+
+FILE_TYPES = {
+    ".json": "application/json",
+    ".md": "text/markdown; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+    ".txt": "text/plain; charset=utf-8"
+}
+
+REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 411: "Length Required", 413: "Payload Too Large",
+    429: "Too Many Requests", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 501: "Not Implemented", 503: "Service Unavailable"
+}
+
+class HttpError(Exception):
+    """
+    Ends a request with an error status and a JSON error body
+    """
+
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+class Request:
+    def __init__(self, method: str, target: str, version: str, headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.version = version
+        self.headers = headers
+        self.body = body
+        url = urlsplit(target)
+        self.path = unquote(url.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+class Response:
+    """
+    A status, headers and either a body or an iterator of body chunks
+    Iterators are produced on the worker threads and sent with chunked
+    transfer encoding unless the length is known.
+    """
+
+    def __init__(self, status: int = 200, body: bytes = b"",
+                 content_type: str = "application/json",
+                 headers: Optional[Dict[str, str]] = None,
+                 chunks: Optional[Iterator[bytes]] = None,
+                 length: Optional[int] = None):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or {}
+        self.chunks = chunks
+        self.length = length
+
+def json_response(data, status: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    body = json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+    return Response(status, body, headers=headers)
+
+def encode_cursor(sort_by: str, row: Dict) -> str:
+    token = json.dumps([sort_by, row[sort_by], row["workflow_id"]], separators=(',', ':'))
+    return base64.urlsafe_b64encode(token.encode('utf-8')).decode('ascii').rstrip("=")
+
+def decode_cursor(token: str, sort_by: str) -> Dict:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        cursor_sort, value, workflow_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise HttpError(400, "invalid after cursor")
+    if cursor_sort != sort_by:
+        raise HttpError(400, "after cursor belongs to another sort order")
+    return {sort_by: value, "workflow_id": workflow_id}
+
+class ApiServer:
+    """
+    HTTP front end for one output directory
+    """
+
+    def __init__(self, output_dir: str = "blog_output", workers: int = 2,
+                 max_queue: int = 100, max_connections: int = 1000,
+                 threads: int = 16, coordinator_options: Optional[Dict] = None,
+                 start_workers: bool = True):
+        self.coordinator = BlogTeamCoordinator(output_dir=output_dir, **(coordinator_options or {}))
+        self.pool = JobWorkerPool(output_dir, workers, coordinator_options=coordinator_options)
+        self.queue = self.pool.queue
+        self.max_queue = max_queue
+        self.max_connections = max_connections
+        self.start_workers = start_workers
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="api")
+        self._connections = 0
+        self._open = {}
+        self._listings = OrderedDict()
+        self._listings_version = None
+        self._listings_lock = threading.Lock()
+        self._submit_lock = None
+        self._server = None
+        # Workflow IDs are word characters, so a path segment can never leave the output directory
+        self._routes = [
+            ("POST", re.compile(r"^/jobs$"), self.submit_job),
+            ("GET", re.compile(r"^/jobs/(\d+)$"), self.job_status),
+            ("GET", re.compile(r"^/workflows$"), self.list_workflows),
+            ("GET", re.compile(r"^/workflows/([\w-]+)$"), self.workflow_summary),
+            ("GET", re.compile(r"^/workflows/([\w-]+)/status$"), self.workflow_status),
+            ("GET", re.compile(r"^/workflows/([\w-]+)/artifacts/([a-z_]+)$"), self.workflow_artifact),
+            ("GET", re.compile(r"^/workflows/([\w-]+)/files/([^/]+)$"), self.workflow_file),
+            ("GET", re.compile(r"^/workflows/([\w-]+)/bundle\.zip$"), self.workflow_bundle),
+            ("GET", re.compile(r"^/health$"), self.health)
+        ]
+
+    async def _blocking(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # Endpoints
+
+    async def submit_job(self, request: Request) -> Response:
+        try:
+            params = json.loads(request.body or b"{}")
+        except ValueError:
+            raise HttpError(400, "body must be JSON")
+        if not isinstance(params, dict):
+            raise HttpError(400, "body must be a JSON object")
+        try:
+            validate_job_params(params)
+        except ValueError as e:
+            raise HttpError(400, str(e))
+
+        # One submission at a time, so the depth check and the insert can't interleave
+        async with self._submit_lock:
+            queued = await self._blocking(self.queue.queued_count)
+            if queued >= self.max_queue:
+                raise HttpError(429, f"job queue is full ({queued} waiting)",
+                                {"Retry-After": str(RETRY_AFTER)})
+            job_id = await self._blocking(self.queue.enqueue, params)
+        return json_response({"job_id": job_id, "status": "queued", "href": f"/jobs/{job_id}"},
+                             202, {"Location": f"/jobs/{job_id}"})
+
+    async def job_status(self, request: Request, job_id: str) -> Response:
+        # The route only matches digits; IDs past SQLite's integer range can't exist
+        job_id = int(job_id)
+        if job_id > MAX_JOB_ID:
+            raise HttpError(404, "job not found")
+        job = await self._blocking(self.queue.get, job_id)
+        if job is None:
+            raise HttpError(404, "job not found")
+        if job["status"] == "queued":
+            job["ahead"] = await self._blocking(self.queue.position, job["job_id"])
+        if job["workflow_id"]:
+            job["href"] = f"/workflows/{job['workflow_id']}"
+        return json_response(job)
+
+    async def list_workflows(self, request: Request) -> Response:
+        query = request.query
+        try:
+            limit = min(int(query.get("limit", 20)), MAX_PAGE_SIZE)
+            offset = int(query.get("offset", 0))
+        except ValueError:
+            raise HttpError(400, "limit and offset must be integers")
+        if limit < 1 or offset < 0:
+            raise HttpError(400, "limit must be positive and offset not negative")
+        sort_by = query.get("sort_by", "creation_date")
+        if sort_by not in SORT_COLUMNS:
+            raise HttpError(400, f"sort_by must be one of {', '.join(SORT_COLUMNS)}")
+        descending = query.get("order", "desc") != "asc"
+        search = query.get("search") or None
+        after = decode_cursor(query["after"], sort_by) if query.get("after") else None
+
+        def page():
+            version = self.coordinator.catalog_version()
+            after_key = tuple(after.values()) if after else None
+            rows = self._cached_listing(
+                version, ("page", limit, 0 if after else offset, sort_by, descending, search, after_key),
+                lambda: self.coordinator.list_workflows(limit=limit, offset=0 if after else offset,
+                                                        sort_by=sort_by, descending=descending,
+                                                        search=search, after=after))
+            # Counting scans every match, so one count serves all pages of a search
+            total = self._cached_listing(version, ("count", search),
+                                         lambda: self.coordinator.count_workflows(search))
+            return rows, total
+
+        rows, total = await self._blocking(page)
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = encode_cursor(sort_by, rows[-1])
+        return json_response({"workflows": rows, "total": total, "next": next_cursor})
+
+    def _cached_listing(self, version: int, key: tuple, compute):
+        """
+        Result of compute for key, reused until the catalog version changes
+        """
+        with self._listings_lock:
+            if version != self._listings_version:
+                self._listings.clear()
+                self._listings_version = version
+            elif key in self._listings:
+                self._listings.move_to_end(key)
+                return self._listings[key]
+
+        result = compute()
+        with self._listings_lock:
+            if version == self._listings_version:
+                self._listings[key] = result
+                if len(self._listings) > LISTING_CACHE_ENTRIES:
+                    self._listings.popitem(last=False)
+        return result
+
+    async def workflow_summary(self, request: Request, workflow_id: str) -> Response:
+        summary = await self._blocking(self.coordinator.load_workflow_summary, workflow_id)
+        if summary is None:
+            raise HttpError(404, "workflow not found")
+        return json_response(summary)
+
+    async def workflow_status(self, request: Request, workflow_id: str) -> Response:
+        status = await self._blocking(self.coordinator.get_workflow_status, workflow_id)
+        if "error" in status and "status" not in status:
+            raise HttpError(404, status["error"])
+        return json_response(status)
+
+    async def workflow_artifact(self, request: Request, workflow_id: str, kind: str) -> Response:
+        if kind not in ARTIFACT_FILES:
+            raise HttpError(404, f"artifact must be one of {', '.join(ARTIFACT_FILES)}")
+        try:
+            path = await self._blocking(self.coordinator.get_artifact, workflow_id, kind)
+            size = await self._blocking(os.path.getsize, path)
+        except FileNotFoundError:
+            raise HttpError(404, "workflow not found")
+        return await self._file_response(workflow_id, os.path.basename(path), ARTIFACT_TYPES[kind], size)
+
+    async def workflow_file(self, request: Request, workflow_id: str, name: str) -> Response:
+        files = await self._blocking(self.coordinator.workflow_files, workflow_id)
+        file = next((file for file in files if file["name"] == name), None)
+        if file is None:
+            raise HttpError(404, "file not found")
+        content_type = FILE_TYPES.get(os.path.splitext(name)[1], "application/octet-stream")
+        # Records are re-encoded, so only plain files have a known length
+        return await self._file_response(workflow_id, name, content_type,
+                                         None if file["record"] else file["size"])
+
+    async def _file_response(self, workflow_id: str, name: str, content_type: str,
+                             size: Optional[int]) -> Response:
+        try:
+            chunks = await self._blocking(self.coordinator.iter_workflow_file, workflow_id, name)
+        except FileNotFoundError:
+            raise HttpError(404, "file not found")
+        return Response(200, content_type=content_type, chunks=chunks, length=size)
+
+    async def workflow_bundle(self, request: Request, workflow_id: str) -> Response:
+        try:
+            chunks = await self._blocking(self.coordinator.iter_workflow_bundle, workflow_id)
+        except FileNotFoundError:
+            raise HttpError(404, "workflow not found")
+        return Response(200, content_type="application/zip", chunks=chunks,
+                        headers={"Content-Disposition": f'attachment; filename="{workflow_id}.zip"'})
+
+    async def health(self, request: Request) -> Response:
+        counts = await self._blocking(self.queue.counts)
+        return json_response({
+            "status": "ok",
+            "queue": counts,
+            "max_queue": self.max_queue,
+            "workers": self.pool.alive(),
+            "connections": self._connections
+        })
+
+    # HTTP
+
+    def _route(self, request: Request):
+        allowed = []
+        for method, pattern, handler in self._routes:
+            match = pattern.match(request.path)
+            if match:
+                if method == request.method:
+                    return handler, match.groups()
+                allowed.append(method)
+        if allowed:
+            raise HttpError(405, "method not allowed", {"Allow": ", ".join(allowed)})
+        raise HttpError(404, "not found")
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        """
+        Next request on a connection, or None when the client is done
+        """
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            return None
+        except asyncio.LimitOverrunError:
+            raise HttpError(431, "request head too large")
+
+        lines = head.decode('latin-1').split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise HttpError(400, "malformed request line")
+        if version not in ("HTTP/1.1", "HTTP/1.0"):
+            raise HttpError(400, "unsupported HTTP version")
+
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise HttpError(400, "malformed header")
+            headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(501, "chunked request bodies are not supported")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HttpError(400, "invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, f"body larger than {MAX_BODY_BYTES} bytes")
+        if method == "POST" and "content-length" not in headers:
+            raise HttpError(411, "Content-Length required")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method, target, version, headers, body)
+
+    def _head(self, response: Response, keep_alive: bool, length: Optional[int]) -> bytes:
+        headers = {
+            "Server": SERVER_NAME,
+            "Date": format_datetime(datetime.now(timezone.utc), usegmt=True),
+            "Content-Type": response.content_type,
+            "Connection": "keep-alive" if keep_alive else "close"
+        }
+        if keep_alive:
+            headers["Keep-Alive"] = f"timeout={KEEP_ALIVE_TIMEOUT}"
+        if length is None:
+            headers["Transfer-Encoding"] = "chunked"
+        else:
+            headers["Content-Length"] = str(length)
+        headers.update(response.headers)
+        lines = [f"HTTP/1.1 {response.status} {REASONS.get(response.status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+    async def _send(self, writer: asyncio.StreamWriter, response: Response, keep_alive: bool) -> None:
+        if response.chunks is None:
+            writer.write(self._head(response, keep_alive, len(response.body)) + response.body)
+            await writer.drain()
+            return
+
+        writer.write(self._head(response, keep_alive, response.length))
+        chunked = response.length is None
+        try:
+            while True:
+                chunk = await self._blocking(next, response.chunks, None)
+                if chunk is None:
+                    break
+                if chunked:
+                    writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                else:
+                    writer.write(chunk)
+                # Wait for slow clients instead of buffering the whole body
+                await writer.drain()
+        finally:
+            close = getattr(response.chunks, "close", None)
+            if close is not None:
+                await self._blocking(close)
+        if chunked:
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        self._connections += 1
+        self._open[asyncio.current_task()] = writer
+        try:
+            if self._connections > self.max_connections:
+                await self._send(writer, json_response(
+                    {"error": "server is at its connection limit"}, 503,
+                    {"Retry-After": str(RETRY_AFTER)}), keep_alive=False)
+                return
+
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        return
+                    keep_alive = request.keep_alive
+                    handler, args = self._route(request)
+                    response = await handler(request, *args)
+                except HttpError as e:
+                    response = json_response({"error": e.message}, e.status, e.headers)
+                except Exception:
+                    logger.exception("Request failed")
+                    response = json_response({"error": "internal error"}, 500)
+                    keep_alive = False
+
+                await self._send(writer, response, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections -= 1
+            self._open.pop(asyncio.current_task(), None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        self._submit_lock = asyncio.Lock()
+        if self.start_workers:
+            await self._blocking(self.pool.start)
+        self._server = await asyncio.start_server(self._handle_connection, host, port,
+                                                  limit=MAX_HEADER_BYTES, backlog=1024)
+
+    @property
+    def addresses(self) -> List[Tuple]:
+        return [sock.getsockname() for sock in self._server.sockets] if self._server else []
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # Closing idle keep-alive connections ends their handlers
+        handlers = list(self._open)
+        for writer in list(self._open.values()):
+            writer.close()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        if self.start_workers:
+            await self._blocking(self.pool.stop)
+        self._executor.shutdown(wait=False)
+
+async def serve(args) -> None:
+    server = ApiServer(output_dir=args.output_dir, workers=args.workers,
+                       max_queue=args.max_queue, max_connections=args.max_connections,
+                       threads=args.threads, start_workers=not args.no_workers)
+    await server.start(args.host, args.port)
+    for address in server.addresses:
+        logger.info("Serving %s on http://%s:%s", args.output_dir, address[0], address[1])
+
+    # SIGTERM stops the server like Ctrl+C: workers finish their jobs first
+    serving = asyncio.ensure_future(server.serve_forever())
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serving.cancel)
+    except (NotImplementedError, AttributeError):
+        pass
+    try:
+        await serving
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await server.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP API for blog generation")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--output-dir", default="blog_output")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Worker processes generating queued posts")
+    parser.add_argument("--no-workers", action="store_true",
+                        help="Only queue jobs; run workers with 'python job_queue.py work'")
+    parser.add_argument("--max-queue", type=int, default=100,
+                        help="Waiting jobs beyond which POST /jobs answers 429")
+    parser.add_argument("--max-connections", type=int, default=1000,
+                        help="Open connections beyond which new ones get 503")
+    parser.add_argument("--threads", type=int, default=16,
+                        help="Threads for catalog queries and file reads")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    configure_console_logging(verbose=args.verbose)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
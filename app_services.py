@@ -0,0 +1,255 @@
+"""
+Process-wide resources shared by the Streamlit pages
+
+Every session and page of one Streamlit server uses the same coordinator
+and job worker pool, created on first use. Workflow listings and summaries
+are cached across sessions: listings are keyed on the catalog version and
+summaries on their file's signature, so a new or regenerated post shows up
+on the next rerun without sessions re-reading unchanged files.
+
+The shared coordinator is only used for reads and lazy artifact rendering
+(which takes its own lock); generation runs in the job queue's workers.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import math
+import os
+import tempfile
+import threading
+import time
+
+import streamlit as st
+
+from blog_team_coordinator import BlogTeamCoordinator
+from job_queue import JobWorkerPool, ensure_worker_pool
+from markdown_renderer import render_post_body, render_seo_html
+
+OUTPUT_DIR = os.environ.get("BLOG_OUTPUT_DIR", "blog_output")
+
+# Worker processes generating queued blogs, shared by every session of this server
+JOB_WORKERS = int(os.environ.get("BLOG_JOB_WORKERS", min(4, os.cpu_count() or 1)))
+
+# Cached listing pages and summaries kept per server process
+LISTING_CACHE_ENTRIES = 256
+SUMMARY_CACHE_ENTRIES = 64
+TEXT_FILE_CACHE_ENTRIES = 16
+
+# Where ZIP bundles and decoded records are streamed to for download,
+# and how long they are kept (seconds)
+BUNDLE_DIR = os.path.join(tempfile.gettempdir(), "blog_bundles")
+BUNDLE_MAX_AGE = 3600
+
+# Orderings offered by workflow_browser: label -> (sort_by, descending)
+BROWSER_SORTS = {
+    "Newest first": ("creation_date", True),
+    "Oldest first": ("creation_date", False),
+    "Highest SEO score": ("seo_score", True),
+    "Lowest SEO score": ("seo_score", False)
+}
+
+@st.cache_resource(show_spinner=False)
+def get_coordinator(output_dir: str = OUTPUT_DIR) -> BlogTeamCoordinator:
+    """
+    The server's coordinator for output_dir, created once
+    """
+    return BlogTeamCoordinator(output_dir=output_dir)
+
+def get_job_pool(output_dir: str = OUTPUT_DIR) -> JobWorkerPool:
+    """
+    Worker pool for output_dir, started on first use
+    """
+    return ensure_worker_pool(output_dir, workers=JOB_WORKERS)
+
+@st.cache_data(max_entries=LISTING_CACHE_ENTRIES, show_spinner=False)
+def _cached_listing(output_dir: str, catalog_version: int, limit: Optional[int], offset: int,
+                    sort_by: str, descending: bool, search: Optional[str],
+                    after: Optional[Dict]) -> List[Dict]:
+    return get_coordinator(output_dir).list_workflows(limit=limit, offset=offset, sort_by=sort_by,
+                                                      descending=descending, search=search, after=after)
+
+@st.cache_data(max_entries=LISTING_CACHE_ENTRIES, show_spinner=False)
+def _cached_count(output_dir: str, catalog_version: int, search: Optional[str]) -> int:
+    return get_coordinator(output_dir).count_workflows(search=search)
+
+@st.cache_data(max_entries=SUMMARY_CACHE_ENTRIES, show_spinner=False)
+def _cached_summary(output_dir: str, workflow_id: str, signature: tuple) -> Optional[Dict]:
+    return get_coordinator(output_dir).load_workflow_summary(workflow_id)
+
+@st.cache_data(max_entries=TEXT_FILE_CACHE_ENTRIES, show_spinner=False)
+def _cached_seo_html(output_dir: str, workflow_id: str, signature: tuple) -> str:
+    summary = _cached_summary(output_dir, workflow_id, signature)
+    return "".join(render_seo_html(summary, render_post_body(summary)))
+
+@st.cache_data(max_entries=TEXT_FILE_CACHE_ENTRIES, show_spinner=False)
+def _cached_text_file(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def list_workflows(limit: Optional[int] = None, offset: int = 0,
+                   sort_by: str = "creation_date", descending: bool = True,
+                   search: Optional[str] = None, after: Optional[Dict] = None,
+                   output_dir: str = OUTPUT_DIR) -> List[Dict]:
+    """
+    coordinator.list_workflows, cached until the catalog changes
+    """
+    version = get_coordinator(output_dir).catalog_version()
+    return _cached_listing(output_dir, version, limit, offset, sort_by, descending, search, after)
+
+def count_workflows(search: Optional[str] = None, output_dir: str = OUTPUT_DIR) -> int:
+    """
+    coordinator.count_workflows, cached until the catalog changes
+    """
+    version = get_coordinator(output_dir).catalog_version()
+    return _cached_count(output_dir, version, search)
+
+def load_workflow_summary(workflow_id: str, output_dir: str = OUTPUT_DIR) -> Optional[Dict]:
+    """
+    coordinator.load_workflow_summary, cached until the summary file changes
+    """
+    signature = get_coordinator(output_dir).workflow_summary_signature(workflow_id)
+    if signature is None:
+        return None
+    return _cached_summary(output_dir, workflow_id, signature)
+
+def seo_html(workflow_id: str, output_dir: str = OUTPUT_DIR) -> Optional[str]:
+    """
+    SEO HTML page of a post for download, rendered once per summary file version
+    """
+    signature = get_coordinator(output_dir).workflow_summary_signature(workflow_id)
+    if signature is None:
+        return None
+    return _cached_seo_html(output_dir, workflow_id, signature)
+
+def workflow_browser(key: str, page_size: int = 20) -> Tuple[List[Dict], int]:
+    """
+    Topic search and sort controls over the catalog, in the current container
+    Returns the rows of the page being viewed and the number of matches;
+    render workflow_browser_nav(key, ...) to move between pages. Pages are
+    fetched by keyset, so only one page of rows is queried and rendered.
+    """
+    search = st.text_input("Search topics", key=f"{key}_search",
+                           placeholder="e.g. machine learning").strip() or None
+    sort_label = st.selectbox("Sort by", list(BROWSER_SORTS), key=f"{key}_sort")
+    sort_by, descending = BROWSER_SORTS[sort_label]
+
+    # Start positions of the pages up to the current one; reset when the query changes
+    query = (search, sort_label, page_size)
+    state = st.session_state.get(f"{key}_pages")
+    if state is None or state["query"] != query:
+        state = st.session_state[f"{key}_pages"] = {"query": query, "starts": [{"after": None, "offset": 0}]}
+
+    def fetch_page():
+        start = state["starts"][-1]
+        return list_workflows(limit=page_size, offset=0 if start["after"] else start["offset"],
+                              sort_by=sort_by, descending=descending, search=search, after=start["after"])
+
+    rows = fetch_page()
+    if not rows and len(state["starts"]) > 1:
+        # Posts were removed behind the current page
+        del state["starts"][1:]
+        rows = fetch_page()
+    return rows, count_workflows(search)
+
+def _next_page(key: str, rows: List[Dict]) -> None:
+    starts = st.session_state[f"{key}_pages"]["starts"]
+    starts.append({"after": rows[-1], "offset": starts[-1]["offset"] + len(rows)})
+
+def _previous_page(key: str) -> None:
+    starts = st.session_state[f"{key}_pages"]["starts"]
+    if len(starts) > 1:
+        starts.pop()
+
+def _first_page(key: str) -> None:
+    starts = st.session_state[f"{key}_pages"]["starts"]
+    del starts[1:]
+
+def workflow_browser_nav(key: str, rows: List[Dict], total: int) -> None:
+    """
+    First / previous / next buttons and the page position for workflow_browser
+    """
+    state = st.session_state[f"{key}_pages"]
+    page_size = state["query"][2]
+    page = len(state["starts"])
+    pages = max(1, math.ceil(total / page_size))
+
+    col1, col2, col3, col4 = st.columns([1, 1, 2, 1])
+    with col1:
+        st.button("⏮", key=f"{key}_first", disabled=page == 1,
+                  on_click=_first_page, args=(key,), help="First page")
+    with col2:
+        st.button("◀", key=f"{key}_previous", disabled=page == 1,
+                  on_click=_previous_page, args=(key,), help="Previous page")
+    with col3:
+        st.caption(f"Page {min(page, pages)} of {pages} ({total:,} posts)")
+    with col4:
+        st.button("▶", key=f"{key}_next", disabled=not rows or page >= pages,
+                  on_click=_next_page, args=(key, rows),
+                  help="Next page")
+
+def read_text_file(path: str) -> str:
+    """
+    Contents of a text file such as a blog page, cached until the file changes
+    """
+    stat = os.stat(path)
+    return _cached_text_file(path, stat.st_mtime_ns, stat.st_size)
+
+def prepare_bundle(workflow_id: str, output_dir: str = OUTPUT_DIR) -> str:
+    """
+    Path of a ZIP bundle of a workflow, streamed to disk on first request
+    The bundle is reused by every session until a file of the workflow
+    changes; bundles older than BUNDLE_MAX_AGE are removed.
+    """
+    coordinator = get_coordinator(output_dir)
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    _remove_old_bundles()
+
+    bundle_path = os.path.join(BUNDLE_DIR, f"{workflow_id}.zip")
+    newest = max((file["modified"].timestamp() for file in coordinator.workflow_files(workflow_id)),
+                 default=None)
+    if newest is None:
+        raise FileNotFoundError(f"Workflow {workflow_id} not found")
+    if os.path.exists(bundle_path) and os.path.getmtime(bundle_path) >= newest:
+        return bundle_path
+
+    _stream_to_file(bundle_path, coordinator.iter_workflow_bundle(workflow_id))
+    return bundle_path
+
+def prepare_file(workflow_id: str, name: str, output_dir: str = OUTPUT_DIR) -> str:
+    """
+    Path of a workflow file (from workflow_files) as it is downloaded
+    Files stored as named are served from the workflow directory; records
+    kept in another format (pack files) are streamed to JSON on first request.
+    """
+    coordinator = get_coordinator(output_dir)
+    for file in coordinator.workflow_files(workflow_id):
+        if file["name"] == name:
+            break
+    else:
+        raise FileNotFoundError(f"{name} is not a file of workflow {workflow_id}")
+    if os.path.basename(file["path"]) == name:
+        return file["path"]
+
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    _remove_old_bundles()
+    decoded_path = os.path.join(BUNDLE_DIR, f"{workflow_id}.{name}")
+    if os.path.exists(decoded_path) and os.path.getmtime(decoded_path) >= file["modified"].timestamp():
+        return decoded_path
+    _stream_to_file(decoded_path, coordinator.iter_workflow_file(workflow_id, name))
+    return decoded_path
+
+def _stream_to_file(path: str, chunks) -> None:
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+def _remove_old_bundles() -> None:
+    cutoff = time.time() - BUNDLE_MAX_AGE
+    with os.scandir(BUNDLE_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
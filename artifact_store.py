@@ -0,0 +1,191 @@
+"""
+Content-addressed storage for workflow artifacts
+
+Each workflow used to store the post body several times over: in
+content_data.json, again inside seo_data.json (original_content and
+final_content), in workflow_summary.json and in final_blog_post.md.
+With deduplication enabled, large strings are written once to a shared
+blob store under ``<output_dir>/blobs/<aa>/<sha256>`` and records refer
+to them by hash:
+
+- ``{"$blob": hash}``: the whole blob, as text
+- ``{"$blob": hash, "offset": n, "length": m}``: a slice of a blob's text,
+  used for sections that already appear in the full post
+- ``{"$json": hash}``: a whole record stored as its own blob
+
+Artifact files in the workflow directory are hard links to their blobs
+(copies where links are not supported), so they stay readable as before.
+"""
+
+from typing import Dict, Iterable, List, Optional
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+BLOBS_DIRNAME = "blobs"
+
+# mkstemp creates files readable by the owner only; blobs are shared artifacts
+BLOB_MODE = 0o644
+
+# Strings shorter than this stay inline in their record
+INLINE_LIMIT = 256
+
+class BlobStore:
+    """
+    Immutable blobs keyed by the SHA-256 of their bytes
+    Writes are atomic and idempotent, so any number of processes can share
+    one store.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def __contains__(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def put(self, data: bytes) -> str:
+        """
+        Store bytes and return their hash; existing blobs are not rewritten
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self:
+            self._write(digest, data)
+        return digest
+
+    def put_text(self, text: str) -> str:
+        return self.put(text.encode('utf-8'))
+
+    def put_chunks(self, chunks: Iterable[str]) -> str:
+        """
+        Stream text chunks into the store (e.g. a rendered HTML page),
+        hashing as they are written
+        """
+        os.makedirs(self.root, exist_ok=True)
+        sha = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.chmod(tmp_path, BLOB_MODE)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    data = chunk.encode('utf-8')
+                    sha.update(data)
+                    f.write(data)
+            digest = sha.hexdigest()
+            if digest in self:
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(self.path(digest)), exist_ok=True)
+                os.replace(tmp_path, self.path(digest))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return digest
+
+    def _write(self, digest: str, data: bytes) -> None:
+        directory = os.path.dirname(self.path(digest))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.chmod(tmp_path, BLOB_MODE)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path(digest))
+
+    def get(self, digest: str) -> bytes:
+        with open(self.path(digest), 'rb') as f:
+            return f.read()
+
+    def get_text(self, digest: str) -> str:
+        return self.get(digest).decode('utf-8')
+
+    def link(self, digest: str, dest: str) -> None:
+        """
+        Expose a blob at dest as a hard link, or a copy if linking fails
+        An existing dest is replaced rather than written through, so a blob
+        is never modified via one of its links.
+        """
+        if os.path.lexists(dest):
+            os.remove(dest)
+        try:
+            os.link(self.path(digest), dest)
+        except OSError:
+            shutil.copyfile(self.path(digest), dest)
+
+def dedup_record(value, store: BlobStore, shared_texts: Optional[List[str]] = None):
+    """
+    Copy of a JSON-compatible record with large strings moved into the store
+
+    shared_texts are stored first; any other large string that equals one of
+    them, or is a slice of one, becomes a reference into it instead of a new
+    blob.
+    """
+    shared = []
+    for text in shared_texts or []:
+        if isinstance(text, str) and len(text) >= INLINE_LIMIT:
+            shared.append((text, store.put_text(text)))
+    return _dedup(value, store, shared)
+
+def _dedup(value, store: BlobStore, shared: List):
+    if isinstance(value, dict):
+        return {key: _dedup(item, store, shared) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_dedup(item, store, shared) for item in value]
+    if not isinstance(value, str) or len(value) < INLINE_LIMIT:
+        return value
+
+    for text, digest in shared:
+        if value == text:
+            return {"$blob": digest}
+        offset = text.find(value)
+        if offset != -1:
+            return {"$blob": digest, "offset": offset, "length": len(value)}
+
+    digest = store.put_text(value)
+    shared.append((value, digest))
+    return {"$blob": digest}
+
+def store_record(record: Dict, store: BlobStore, shared_texts: Optional[List[str]] = None) -> str:
+    """
+    Deduplicate a record and store it as a compact JSON blob; returns its hash
+    Equal records always produce the same blob.
+    """
+    packed = dedup_record(record, store, shared_texts)
+    return store.put_text(json.dumps(packed, separators=(',', ':'), default=str))
+
+def resolve_record(value, store: BlobStore, _texts: Optional[Dict] = None):
+    """
+    Inverse of dedup_record: replace every reference with its content
+    Records without references are returned unchanged.
+    """
+    texts = {} if _texts is None else _texts
+    if isinstance(value, list):
+        return [resolve_record(item, store, texts) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    if "$json" in value:
+        return resolve_record(json.loads(_blob_text(value["$json"], store, texts)), store, texts)
+    if "$blob" in value:
+        text = _blob_text(value["$blob"], store, texts)
+        if "offset" in value:
+            return text[value["offset"]:value["offset"] + value["length"]]
+        return text
+    return {key: resolve_record(item, store, texts) for key, item in value.items()}
+
+def _blob_text(digest: str, store: BlobStore, texts: Dict) -> str:
+    # Blobs referenced many times in one record (sections) are read once
+    if digest not in texts:
+        texts[digest] = store.get_text(digest)
+    return texts[digest]
+
+def load_record(path: str, store: BlobStore) -> Dict:
+    """
+    Read a JSON record written with or without deduplication
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return resolve_record(json.load(f), store)
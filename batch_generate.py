@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Batch blog generation from the command line
+
+Reads a list of jobs (JSON array or JSON lines, one object of
+create_blog_post arguments per job) and runs them across a process pool:
+
+    python batch_generate.py jobs.jsonl --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from blog_team_coordinator import BlogTeamCoordinator
+from pipeline_metrics import JsonLinesSink, PrometheusTextfileSink
+from blog_logging import configure_console_logging
+
+def load_jobs(path):
+    """Load jobs from a JSON array file or a JSON lines file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    stripped = text.lstrip()
+    if stripped.startswith('['):
+        return json.loads(stripped)
+
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate many blog posts in parallel")
+    parser.add_argument("jobs", nargs="?", help="JSON or JSON lines file with one job per entry")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--output-dir", default="blog_output",
+                        help="Directory to write workflows into")
+    parser.add_argument("--results", help="Optional JSON lines file to append each result to")
+    parser.add_argument("--resume", action="store_true",
+                        help="Also finish workflows an earlier run left incomplete")
+    parser.add_argument("--dedup-artifacts", action="store_true",
+                        help="Store post bodies and records once in a shared blob store")
+    parser.add_argument("--lazy-artifacts", action="store_true",
+                        help="Only save workflow records; render HTML, briefs and reports on demand")
+    parser.add_argument("--record-format", choices=["json", "pack"], default="json",
+                        help="Format of phase records and summaries")
+    parser.add_argument("--layout", choices=["flat", "id_prefix", "date", "hash"],
+                        help="Directory layout for new workflows (default: the one recorded in the output dir)")
+    parser.add_argument("--metrics-jsonl", help="Append each workflow's timings to this JSON lines file")
+    parser.add_argument("--metrics-prom", help="Keep running totals in this Prometheus textfile (*.prom)")
+    parser.add_argument("--profile-cpu", action="store_true",
+                        help="Save a cProfile capture (profile.pstats) with each workflow")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Trace allocations and save memory_profile.txt with each workflow")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Also log each workflow's phase progress (noisy under load)")
+    parser.add_argument("--echo-content", action="store_true",
+                        help="Print every generated post in full")
+    args = parser.parse_args(argv)
+
+    if not args.jobs and not args.resume:
+        parser.error("a jobs file is required unless --resume is given")
+
+    # The per-job lines below report progress; workflow logs are warnings-only by default
+    configure_console_logging(quiet=not args.verbose)
+
+    metrics_sinks = []
+    if args.metrics_jsonl:
+        metrics_sinks.append(JsonLinesSink(args.metrics_jsonl))
+    if args.metrics_prom:
+        metrics_sinks.append(PrometheusTextfileSink(args.metrics_prom))
+
+    coordinator = BlogTeamCoordinator(output_dir=args.output_dir,
+                                      dedup_artifacts=args.dedup_artifacts,
+                                      lazy_artifacts=args.lazy_artifacts,
+                                      record_format=args.record_format,
+                                      layout=args.layout,
+                                      metrics_sinks=metrics_sinks,
+                                      profile_cpu=args.profile_cpu,
+                                      trace_memory=args.trace_memory,
+                                      echo_content=args.echo_content)
+
+    jobs = []
+    if args.resume:
+        jobs += [{"resume_workflow": workflow_id} for workflow_id in coordinator.incomplete_workflows()]
+        print(f"Resuming {len(jobs)} incomplete workflows")
+    if args.jobs:
+        jobs += load_jobs(args.jobs)
+    print(f"Running {len(jobs)} jobs on {args.workers} workers")
+    results_file = open(args.results, 'a', encoding='utf-8') if args.results else None
+
+    completed = failed = 0
+    start = time.perf_counter()
+    try:
+        for outcome in coordinator.create_blog_posts_batch(jobs, workers=args.workers):
+            topic = outcome["job"].get("topic") or outcome["job"].get("resume_workflow", "<missing topic>")
+            if outcome["status"] == "completed":
+                completed += 1
+                result = outcome["result"]
+                print(f"[ok]     #{outcome['index']} {topic} -> {result['workflow_id']} "
+                      f"(SEO: {result['seo_score']}%)")
+            else:
+                failed += 1
+                print(f"[failed] #{outcome['index']} {topic}: {outcome['error']}")
+
+            if results_file:
+                results_file.write(json.dumps(outcome, default=str) + "\n")
+                results_file.flush()
+    finally:
+        if results_file:
+            results_file.close()
+
+    elapsed = time.perf_counter() - start
+    rate = len(jobs) / elapsed if elapsed > 0 else 0
+    print(f"\n{completed} completed, {failed} failed in {elapsed:.1f}s ({rate:.2f} posts/s)")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
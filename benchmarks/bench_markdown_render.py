@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Peak memory and time of blog page rendering on very long posts
+
+Compares the previous exporter (full-document str.replace chains) with the
+streaming renderer writing straight to a file:
+
+    python benchmarks/bench_markdown_render.py --words 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markdown_renderer import render_blog_page, render_sections, write_html_file
+
+PARAGRAPH = ("This **strategy** helps teams plan, execute and measure their work "
+             "with clear goals and consistent implementation. ")
+
+def synthetic_post(words: int) -> dict:
+    """
+    Writer-shaped content_data with roughly the requested word count
+    """
+    words_per_paragraph = len(PARAGRAPH.split()) * 4
+    paragraphs = max(1, words // words_per_paragraph)
+    sections = []
+    per_section = 20
+    for index in range(0, paragraphs, per_section):
+        body = "\n\n".join(PARAGRAPH * 4 for _ in range(min(per_section, paragraphs - index)))
+        sections.append({"heading": f"Section {index // per_section + 1}", "content": body})
+
+    content_data = {
+        "title": "A Very Long Guide",
+        "introduction": PARAGRAPH,
+        "main_content": sections,
+        "conclusion": "## Conclusion\n\n" + PARAGRAPH
+    }
+    parts = [f"# {content_data['title']}", content_data["introduction"]]
+    for section in sections:
+        parts += [f"## {section['heading']}", section["content"]]
+    parts.append(content_data["conclusion"])
+    content_data["full_text"] = "\n\n".join(parts)
+
+    result = {
+        "final_title": content_data["title"],
+        "final_meta_description": "Benchmark post",
+        "final_content": content_data["full_text"],
+        "word_count": len(content_data["full_text"].split()),
+        "seo_score": 70.0,
+        "target_audience": "general",
+        "creation_date": "2025-01-01T00:00:00"
+    }
+    return content_data, result
+
+def legacy_blog_page(path: str, result: dict) -> None:
+    """
+    The conversion exporters used before the streaming renderer
+    """
+    content_html = result['final_content'].replace('\n\n', '</p><p>')
+    content_html = content_html.replace('\n', '<br>')
+    content_html = content_html.replace('# ', '<h1>').replace('</p><p><h1>', '</p><h1>')
+    content_html = content_html.replace('## ', '<h2>').replace('</p><p><h2>', '</p><h2>')
+    content_html = content_html.replace('### ', '<h3>').replace('</p><p><h3>', '</p><h3>')
+    content_html = content_html.replace('**', '<strong>').replace('**', '</strong>')
+    content_html = f"<p>{content_html}</p>"
+    content_html = content_html.replace('<p><h1>', '<h1>').replace('</p><p>', '</p>\n<p>')
+    content_html = content_html.replace('<p><h2>', '<h2>').replace('<p><h3>', '<h3>')
+    html = f"<html><head><title>{result['final_title']}</title></head><body>{content_html}</body></html>"
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+def streaming_blog_page(path: str, result: dict, content_data: dict) -> None:
+    write_html_file(path, render_blog_page(result, render_sections(content_data)))
+
+def measure(func, *args) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--words", type=int, default=50000)
+    args = parser.parse_args(argv)
+
+    content_data, result = synthetic_post(args.words)
+    post_bytes = len(result["final_content"].encode("utf-8"))
+    print(f"Post: {result['word_count']:,} words, {post_bytes / 1024:.0f} KiB of Markdown")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "blog_page.html")
+        for name, func, func_args in (
+            ("legacy str.replace", legacy_blog_page, (path, result)),
+            ("streaming renderer", streaming_blog_page, (path, result, content_data)),
+        ):
+            elapsed, peak = measure(func, *func_args)
+            print(f"{name:<20} {elapsed * 1000:8.1f} ms   peak {peak / 1024:8.0f} KiB")
+
+if __name__ == "__main__":
+    main()
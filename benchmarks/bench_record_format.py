@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Size and load time of workflow records: indented JSON vs pack files
+
+Writes the phase records and summaries of generated workflows in each
+format, then measures a full load of every record and a single-field read
+(seo_score from each summary, as a listing would do):
+
+    python benchmarks/bench_record_format.py --workflows 200
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blog_team_coordinator import BlogTeamCoordinator
+from workflow_pack import load_pack, read_pack_field, write_pack, zstandard
+
+TOPICS = ["Python Programming Tips", "Docker", "Enterprise Data Security",
+          "AI in Healthcare", "Remote Work", "Digital Marketing Strategies"]
+
+def generate_records(count: int) -> list:
+    """
+    Records (research, content, seo, summary) of count workflows
+    """
+    records = []
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        coordinator = BlogTeamCoordinator(output_dir=tmp)
+        for index in range(count):
+            topic = f"{TOPICS[index % len(TOPICS)]} {index}"
+            research = coordinator.researcher.research_topic(topic, "general")
+            content = coordinator.writer.write_blog_post(research, "conversational", 1500)
+            seo = coordinator.seo_editor.optimize_content(content, research)
+            summary = coordinator._compile_final_output(f"workflow_{index}", research, content, seo)
+            records.append({"research_data": research, "content_data": content,
+                            "seo_data": seo, "workflow_summary": summary})
+    return records
+
+def write_json(path: str, record: dict) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=2, default=str)
+
+def load_json(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_json_field(path: str, name: str):
+    return load_json(path).get(name)
+
+def run_format(root: str, records: list, suffix: str, write, load, load_field) -> dict:
+    os.makedirs(root)
+    start = time.perf_counter()
+    for index, workflow in enumerate(records):
+        workflow_dir = os.path.join(root, str(index))
+        os.mkdir(workflow_dir)
+        for name, record in workflow.items():
+            write(os.path.join(workflow_dir, name + suffix), record)
+    write_time = time.perf_counter() - start
+
+    paths = [os.path.join(root, str(index), name + suffix)
+             for index in range(len(records)) for name in records[index]]
+    size = sum(os.path.getsize(path) for path in paths)
+
+    start = time.perf_counter()
+    for path in paths:
+        load(path)
+    load_time = time.perf_counter() - start
+
+    summaries = [os.path.join(root, str(index), "workflow_summary" + suffix)
+                 for index in range(len(records))]
+    start = time.perf_counter()
+    for path in summaries:
+        load_field(path, "seo_score")
+    field_time = time.perf_counter() - start
+
+    return {"size": size, "write": write_time, "load": load_time, "field": field_time}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    records = generate_records(args.workflows)
+    formats = [
+        ("json (indent=2)", ".json", write_json, load_json, load_json_field),
+        ("pack", ".pack", lambda path, record: write_pack(path, record, None), load_pack, read_pack_field),
+        ("pack + gzip", ".pack", lambda path, record: write_pack(path, record, "gzip"), load_pack, read_pack_field),
+    ]
+    if zstandard is not None:
+        formats.append(("pack + zstd", ".pack", lambda path, record: write_pack(path, record, "zstd"),
+                        load_pack, read_pack_field))
+
+    print(f"{args.workflows} workflows, {args.workflows * 4} records")
+    print(f"{'format':<16} {'size':>10} {'write':>10} {'full load':>10} {'seo_score':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for index, (name, suffix, write, load, load_field) in enumerate(formats):
+            result = run_format(os.path.join(tmp, str(index)), records, suffix, write, load, load_field)
+            print(f"{name:<16} {result['size'] / 1024:8.0f} KiB {result['write'] * 1000:7.0f} ms "
+                  f"{result['load'] * 1000:7.0f} ms {result['field'] * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
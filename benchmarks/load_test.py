@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Sustained load test for the HTTP API (api_server.py)
+
+Opens a number of keep-alive connections and sends requests back to back
+on each for a fixed time, then reports requests per second, latency
+percentiles and the status codes seen:
+
+    python benchmarks/load_test.py --spawn 100000 --connections 64 --duration 20
+    python benchmarks/load_test.py --url http://127.0.0.1:8080 --submit-every 50
+
+--spawn starts a server (without generation workers) on a temporary output
+directory whose catalog holds that many synthetic workflows. --submit-every
+mixes in POST /jobs, so with no workers the queue fills and the
+backpressure path (429) is measured too.
+"""
+
+from collections import Counter
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import percentile, synthetic_summaries
+from workflow_catalog import CATALOG_FILENAME, WorkflowCatalog
+
+DEFAULT_PATHS = [
+    "/health",
+    "/workflows?limit=20",
+    "/workflows?limit=20&sort_by=seo_score",
+    "/workflows?limit=20&search=docker"
+]
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    """
+    Read one response (Content-Length or chunked body); returns its status
+    """
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode('latin-1').split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return status
+
+async def client(host: str, port: int, paths: list, submit_every: int,
+                 deadline: float, latencies: list, statuses: Counter, offset: int) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    sent = offset
+    try:
+        while time.perf_counter() < deadline:
+            sent += 1
+            if submit_every and sent % submit_every == 0:
+                body = json.dumps({"topic": f"Load Test {sent}", "word_count": 800}).encode('utf-8')
+                request = (f"POST /jobs HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                           f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body
+            else:
+                path = paths[sent % len(paths)]
+                request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1')
+
+            started = time.perf_counter()
+            writer.write(request)
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+    except (ConnectionError, asyncio.IncompleteReadError) as e:
+        statuses[type(e).__name__] += 1
+    finally:
+        writer.close()
+
+async def run_load(host: str, port: int, connections: int, duration: float,
+                   paths: list, submit_every: int) -> dict:
+    latencies = []
+    statuses = Counter()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(client(host, port, paths, submit_every, deadline, latencies, statuses, index)
+                           for index in range(connections)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 2),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3) if ordered else None,
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3) if ordered else None,
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else None,
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)}
+    }
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def spawn_server(output_dir: str, workflows: int, max_connections: int) -> tuple:
+    """
+    Seed a catalog and start api_server.py on it; returns (process, port)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    WorkflowCatalog(os.path.join(output_dir, CATALOG_FILENAME)).upsert_many(synthetic_summaries(workflows))
+    port = free_port()
+    server = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api_server.py")
+    process = subprocess.Popen([sys.executable, server, "--port", str(port), "--output-dir", output_dir,
+                                "--no-workers", "--max-connections", str(max_connections)],
+                               stdout=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("API server did not start")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the blog API server")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="Server to test")
+    parser.add_argument("--spawn", type=int, metavar="WORKFLOWS",
+                        help="Start a server on a temporary catalog of this many workflows")
+    parser.add_argument("--connections", type=int, default=32, help="Concurrent keep-alive connections")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to run")
+    parser.add_argument("--path", action="append", dest="paths",
+                        help="Path to request (repeatable; default: health and listing pages)")
+    parser.add_argument("--submit-every", type=int, default=0,
+                        help="Make every Nth request on a connection a POST /jobs")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or DEFAULT_PATHS
+    with tempfile.TemporaryDirectory() as tmp:
+        process = None
+        if args.spawn is not None:
+            process, port = spawn_server(tmp, args.spawn, max(1000, args.connections * 2))
+            host = "127.0.0.1"
+        else:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        try:
+            result = asyncio.run(run_load(host, port, args.connections, args.duration,
+                                          paths, args.submit_every))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(f"{result['requests']} requests in {result['elapsed_s']}s over {args.connections} connections: "
+          f"{result['rps']} req/s")
+    print(f"latency p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, max {result['max_ms']} ms")
+    print("statuses: " + ", ".join(f"{status} x{count}" for status, count in result["statuses"].items()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the blog pipeline and each agent
+
+Every case is timed over repeated runs (p50/p99 latency and throughput),
+then run once more under tracemalloc for its peak allocation. Results can
+be saved as a baseline, and later runs compared against it:
+
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --quick --filter optimize_content
+
+Inputs are synthetic and seeded, and every case works in a temporary
+directory, so runs are reproducible and never touch blog_output.
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blog_team_coordinator import BlogTeamCoordinator
+from content_researcher_agent import ContentResearcherAgent
+from content_writer_agent import ContentWriterAgent
+from pipeline_metrics import peak_rss_bytes
+from seo_editor_agent import SEOEditorAgent
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+TOPICS = ["Python Programming Tips", "Docker", "Enterprise Data Security",
+          "AI in Healthcare", "Remote Work", "Digital Marketing Strategies"]
+
+VOCABULARY = ("strategy teams plan execute measure work clear goals consistent "
+              "implementation data security cloud growth customers results process "
+              "tools automation quality performance insight research market value "
+              "platform workflow engagement content audience trends experts").split()
+
+SEED = 1234
+
+# Latency differences below this are treated as noise when comparing
+NOISE_FLOOR_MS = 0.05
+
+class Case:
+    """
+    One benchmark: run(state) is timed, prepare() (untimed) builds its state
+    units is the work done per run (words, rows, posts), or a function of
+    the first run's result
+    """
+
+    def __init__(self, name, run, prepare=None, units=1, unit="ops",
+                 min_runs=5, max_runs=500, min_time=1.0, trace_memory=True):
+        self.name = name
+        self.run = run
+        self.prepare = prepare or (lambda: None)
+        self.units = units
+        self.unit = unit
+        self.min_runs = min_runs
+        self.max_runs = max_runs
+        self.min_time = min_time
+        self.trace_memory = trace_memory
+
+def percentile(ordered: list, pct: float) -> float:
+    """
+    Nearest-rank percentile of sorted samples
+    """
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def run_case(case: Case) -> dict:
+    # Warm-up run; also fixes the unit count for callable units
+    result = case.run(case.prepare())
+    units = case.units(result) if callable(case.units) else case.units
+
+    gc.collect()
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < case.max_runs and (
+            len(samples) < case.min_runs or time.perf_counter() - started < case.min_time):
+        state = case.prepare()
+        start = time.perf_counter()
+        case.run(state)
+        samples.append(time.perf_counter() - start)
+
+    peak_alloc = None
+    if case.trace_memory:
+        state = case.prepare()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            case.run(state)
+            peak_alloc = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    ordered = sorted(samples)
+    total = sum(samples)
+    return {
+        "runs": len(samples),
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "mean_ms": total / len(samples) * 1000,
+        "throughput": units * len(samples) / total if total > 0 else 0.0,
+        "unit": f"{case.unit}/s",
+        "peak_alloc_kib": peak_alloc / 1024 if peak_alloc is not None else None
+    }
+
+def synthetic_content(words: int, seed: int = SEED) -> tuple:
+    """
+    Writer-shaped (content_data, research_data) of roughly the given word count
+    Starts from a real post and adds seeded sections of varied sentences.
+    """
+    rng = random.Random(seed)
+    writer = ContentWriterAgent()
+    research = ContentResearcherAgent().research_topic("Benchmark Strategy", "general")
+    content = writer.write_blog_post(research, "conversational", words)
+
+    keywords = [kw["keyword"] for kw in research["keywords"]]
+    missing = words - content["word_count"]
+    section_index = 0
+    while missing > 0:
+        paragraphs = []
+        for _ in range(min(8, max(1, missing // 60))):
+            sentences = []
+            for _ in range(4):
+                sentence = rng.choices(VOCABULARY, k=rng.randint(8, 18))
+                if rng.random() < 0.3:
+                    sentence.insert(rng.randrange(len(sentence)), rng.choice(keywords))
+                sentences.append(" ".join(sentence).capitalize() + ".")
+            paragraphs.append(" ".join(sentences))
+        section_index += 1
+        body = "\n\n".join(paragraphs)
+        content["main_content"].append({"heading": f"Deep Dive {section_index}",
+                                        "content": body, "type": "educational"})
+        missing -= len(body.split()) + 3
+
+    document = writer._build_document(content)
+    content["full_text"] = document.render()
+    content["word_count"] = document.word_count
+    return content, research
+
+def topic_stream():
+    """
+    Endless distinct topics, so research and workflows never repeat
+    """
+    for index in itertools.count():
+        yield f"{TOPICS[index % len(TOPICS)]} {index}"
+
+def synthetic_summaries(count: int, seed: int = SEED) -> list:
+    rng = random.Random(seed)
+    return [{
+        "workflow_id": f"bench_{index:07d}",
+        "topic": f"{rng.choice(TOPICS)} {index}",
+        "target_audience": "general",
+        "creation_date": f"2025-{index % 12 + 1:02d}-{index % 28 + 1:02d}T{index % 24:02d}:00:{index % 60:02d}",
+        "seo_score": round(rng.uniform(40, 95), 1),
+        "word_count": rng.randint(500, 3000)
+    } for index in range(count)]
+
+def build_cases(tmp: str, quick: bool) -> list:
+    cases = []
+    document_sizes = [1000, 10000] if quick else [1000, 10000, 100000]
+    catalog_sizes = [10, 1000] if quick else [10, 1000, 100000]
+
+    researcher = ContentResearcherAgent()
+    topics = topic_stream()
+    cases.append(Case("research_topic",
+                      lambda topic: researcher.research_topic(topic, "general"),
+                      prepare=lambda: next(topics), unit="topics"))
+
+    writer = ContentWriterAgent()
+    research = ContentResearcherAgent().research_topic("Benchmark Strategy", "general")
+    for target in (500, 1500, 5000):
+        cases.append(Case(f"write_blog_post[target={target}]",
+                          lambda _, target=target: writer.write_blog_post(research, "conversational", target),
+                          units=lambda content: content["word_count"], unit="words"))
+
+    coordinator = BlogTeamCoordinator(output_dir=os.path.join(tmp, "coordinator"))
+    for words in document_sizes:
+        content, content_research = synthetic_content(words)
+        keywords = [kw["keyword"] for kw in content_research["keywords"]]
+        # A fresh agent per run, so memoized analyses are never reused
+        cases.append(Case(f"optimize_content[words={words}]",
+                          lambda editor, content=content, content_research=content_research, keywords=keywords:
+                              editor.optimize_content(content, content_research, keywords),
+                          prepare=SEOEditorAgent, units=content["word_count"], unit="words",
+                          min_runs=3 if words >= 100000 else 5))
+        cases.append(Case(f"markdown_to_html[words={words}]",
+                          lambda _, text=content["full_text"]: coordinator._markdown_to_html(text),
+                          units=content["word_count"], unit="words"))
+
+    archive = [synthetic_content(1000, seed=SEED + index)[0] for index in range(50 if quick else 500)]
+    archive_keywords = ["strategy", "benchmark strategy", "data"]
+    scorer = SEOEditorAgent()
+    cases.append(Case(f"score_batch[posts={len(archive)}]",
+                      lambda _: scorer.score_batch(archive, archive_keywords),
+                      units=len(archive), unit="posts"))
+
+    for count in catalog_sizes:
+        listing = BlogTeamCoordinator(output_dir=os.path.join(tmp, f"catalog_{count}"))
+        listing.catalog.upsert_many(synthetic_summaries(count))
+        cases.append(Case(f"list_workflows[n={count}]",
+                          lambda _, listing=listing: listing.list_workflows(),
+                          units=count, unit="rows", min_runs=3 if count >= 100000 else 5))
+        cases.append(Case(f"list_workflows_page[n={count}]",
+                          lambda _, listing=listing: listing.list_workflows(limit=20, offset=count // 2),
+                          unit="pages"))
+        middle = listing.list_workflows(limit=1, offset=count // 2)[0]
+        cases.append(Case(f"list_workflows_keyset[n={count}]",
+                          lambda _, listing=listing, middle=middle: listing.list_workflows(limit=20, after=middle),
+                          unit="pages"))
+
+    pipeline = BlogTeamCoordinator(output_dir=os.path.join(tmp, "pipeline"))
+    pipeline_topics = topic_stream()
+    cases.append(Case("create_blog_post",
+                      lambda topic: pipeline.create_blog_post(topic),
+                      prepare=lambda: next(pipeline_topics), unit="posts"))
+
+    jobs = 8 if quick else 32
+    workers = min(4, os.cpu_count() or 1)
+    batch = BlogTeamCoordinator(output_dir=os.path.join(tmp, "batch"))
+    batches = itertools.count()
+
+    def run_batch(batch_index):
+        results = list(batch.create_blog_posts_batch(
+            [{"topic": f"{TOPICS[index % len(TOPICS)]} {batch_index}-{index}"} for index in range(jobs)],
+            workers=workers))
+        if any(result["status"] != "completed" for result in results):
+            raise RuntimeError("batch job failed")
+        return results
+
+    # Worker processes allocate outside this process, so only time is measured
+    cases.append(Case(f"batch[jobs={jobs},workers={workers}]", run_batch,
+                      prepare=lambda: next(batches), units=jobs, unit="posts",
+                      min_runs=3, max_runs=10, min_time=0, trace_memory=False))
+    return cases
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "date": datetime.now().isoformat(timespec="seconds")
+    }
+
+def print_results(results: dict, baseline: dict = None) -> None:
+    header = f"{'benchmark':<40} {'runs':>5} {'p50 ms':>10} {'p99 ms':>10} {'throughput':>18} {'peak KiB':>10}"
+    if baseline is not None:
+        header += f" {'p50 vs base':>12}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        peak = f"{result['peak_alloc_kib']:10.0f}" if result["peak_alloc_kib"] is not None else f"{'-':>10}"
+        line = (f"{name:<40} {result['runs']:>5} {result['p50_ms']:10.3f} {result['p99_ms']:10.3f} "
+                f"{result['throughput']:10.1f} {result['unit']:<7} {peak}")
+        if baseline is not None:
+            base = baseline.get(name)
+            line += f" {(result['p50_ms'] / base['p50_ms'] - 1) * 100:+11.1f}%" if base else f" {'new':>12}"
+        print(line)
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Benchmarks whose p50 latency or peak allocation grew by more than threshold
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if (result["p50_ms"] > base["p50_ms"] * (1 + threshold)
+                and result["p50_ms"] - base["p50_ms"] > NOISE_FLOOR_MS):
+            regressions.append(f"{name}: p50 {base['p50_ms']:.3f} -> {result['p50_ms']:.3f} ms")
+        if (result["peak_alloc_kib"] is not None and base.get("peak_alloc_kib")
+                and result["peak_alloc_kib"] > base["peak_alloc_kib"] * (1 + threshold)):
+            regressions.append(f"{name}: peak {base['peak_alloc_kib']:.0f} -> "
+                               f"{result['peak_alloc_kib']:.0f} KiB")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true",
+                        help="Skip the 100k-word and 100k-workflow sizes; smaller batch")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Relative slowdown (or memory growth) counted as a regression")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = build_cases(tmp, args.quick)
+        if args.filter:
+            cases = [case for case in cases if args.filter in case.name]
+        for case in cases:
+            print(f"running {case.name} ...", file=sys.stderr)
+            results[case.name] = run_case(case)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+
+    print_results(results, baseline)
+    rss = peak_rss_bytes()
+    if rss is not None:
+        print(f"\npeak RSS: {rss / 1024 ** 2:.0f} MiB", end="")
+        if resource is not None:
+            children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            children *= 1 if sys.platform == "darwin" else 1024
+            print(f" (largest batch worker: {children / 1024 ** 2:.0f} MiB)", end="")
+        print()
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Logging for the blog team modules
+
+Library code logs progress to loggers under ``blog_team`` and never adds
+console handlers, so a coordinator used as a library or inside the
+Streamlit app writes nothing to stdout. Scripts opt in to console output:
+
+    configure_console_logging()              # progress messages
+    configure_console_logging(quiet=True)    # warnings and errors only
+    configure_console_logging(verbose=True)  # everything, with logger names
+
+Messages use lazy %-formatting, so disabled levels cost almost nothing.
+"""
+
+from typing import Optional, TextIO
+import logging
+import sys
+
+LOGGER_NAME = "blog_team"
+
+# Silent by default: without this, warnings would reach stderr through
+# logging's last-resort handler
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+_console_handler = None
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger for one module, e.g. get_logger("coordinator") -> blog_team.coordinator
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+def configure_console_logging(quiet: bool = False, verbose: bool = False,
+                              stream: Optional[TextIO] = None) -> logging.Handler:
+    """
+    Send blog_team log messages to the console (stdout by default)
+    Calling it again replaces the earlier console handler.
+    """
+    global _console_handler
+    logger = logging.getLogger(LOGGER_NAME)
+    if _console_handler is not None:
+        logger.removeHandler(_console_handler)
+
+    if quiet:
+        level = logging.WARNING
+    elif verbose:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    if verbose:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    else:
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    _console_handler = handler
+    return handler
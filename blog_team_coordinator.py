@@ -1,12 +1,65 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+import hashlib
 import json
 from datetime import datetime
+import asyncio
 import os
-import re
+import traceback
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from content_researcher_agent import ContentResearcherAgent
 from content_writer_agent import ContentWriterAgent
 from seo_editor_agent import SEOEditorAgent
+from markdown_renderer import (iter_text_lines, render_blog_page, render_markdown,
+                               render_post_body, render_seo_html, write_chunks)
+from artifact_store import (BLOBS_DIRNAME, BlobStore, dedup_record, load_record,
+                            resolve_record, store_record)
+from workflow_pack import PACK_SUFFIX, PackReader, encode_pack, load_pack, pack_path
+from workflow_journal import JOURNAL_FILENAME, WorkflowJournal
+from workflow_ids import new_workflow_id
+from output_layout import (DEFAULT_LAYOUT, get_layout, is_new_output_dir, read_layout_name,
+                           resolve_workflow_dir, write_layout_name)
+from blog_logging import configure_console_logging, get_logger
+from pipeline_metrics import (MetricsSink, WorkflowMetrics, collect, current_metrics,
+                              record_bytes, save_profiles, span)
+from research_cache import ResearchCache
+from workflow_catalog import CATALOG_FILENAME, WorkflowCatalog
+from workflow_export import chunk_size_for, iter_file_chunks, iter_json_chunks, iter_zip
+
+logger = get_logger("coordinator")
+
+PHASES = ("research", "content", "seo")
+
+# Steps reported to progress callbacks: progress(workflow_id, step, completed_steps,
+# total_steps) is called as each step starts, then with "completed" at the end
+PROGRESS_STEPS = PHASES + ("export",)
+
+ProgressCallback = Callable[[str, str, int, int], None]
+
+# Files derived from a workflow's records, by artifact kind
+ARTIFACT_FILES = {
+    "markdown": "final_blog_post.md",
+    "seo_html": "seo_ready.html",
+    "blog_page": "blog_page.html",
+    "content_brief": "content_brief.md",
+    "optimization_report": "optimization_report.txt"
+}
+
+# Records each artifact is rendered from; a change to any of them invalidates it
+ARTIFACT_SOURCES = {
+    "markdown": ("workflow_summary.json",),
+    "seo_html": ("workflow_summary.json", "content_data.json"),
+    "blog_page": ("workflow_summary.json", "content_data.json"),
+    "content_brief": ("workflow_summary.json",),
+    "optimization_report": ("seo_data.json",)
+}
+
+# Per-workflow record of which source version each rendered artifact came from
+ARTIFACT_MANIFEST = "artifacts.json"
+
+# Saved records; downloads and bundles export them as plain JSON under these names
+RECORD_FILES = tuple(f"{phase}_data.json" for phase in PHASES) + ("workflow_summary.json",)
 
 class BlogTeamCoordinator:
     """
@@ -14,84 +67,547 @@ class BlogTeamCoordinator:
     Manages the complete blog creation process from topic to published content
     """
     
-    def __init__(self, output_dir: str = "blog_output"):
-        self.researcher = ContentResearcherAgent()
+    def __init__(self, output_dir: str = "blog_output",
+                 research_cache: Optional[ResearchCache] = None,
+                 dedup_artifacts: bool = False,
+                 lazy_artifacts: bool = False,
+                 record_format: str = "json",
+                 pack_compression: Optional[str] = "gzip",
+                 layout: Optional[str] = None,
+                 metrics_sinks: Optional[List[MetricsSink]] = None,
+                 profile_cpu: bool = False,
+                 trace_memory: bool = False,
+                 echo_content: bool = False):
+        self.researcher = ContentResearcherAgent(cache=research_cache)
         self.writer = ContentWriterAgent()
         self.seo_editor = SEOEditorAgent()
         self.output_dir = output_dir
         self.workflow_data = {}
         
+        # Progress goes to the blog_team loggers (silent unless a script
+        # configures them); echo_content also prints each finished post
+        self.echo_content = echo_content
+        
+        # Shared content-addressed blobs; always readable, written when deduplicating
+        self.dedup_artifacts = dedup_artifacts
+        self.blobs = BlobStore(os.path.join(output_dir, BLOBS_DIRNAME))
+        
+        # Render derived files (HTML, brief, report) on first get_artifact
+        self.lazy_artifacts = lazy_artifacts
+        self._artifact_lock = threading.Lock()
+        
+        # Phase records and summaries as indented JSON or compact pack files
+        if record_format not in ("json", "pack"):
+            raise ValueError("record_format must be 'json' or 'pack'")
+        self.record_format = record_format
+        self.pack_compression = pack_compression
+        
+        # Per-workflow timings go into each summary and to these sinks;
+        # cProfile / tracemalloc captures are saved next to the workflow's files
+        self.metrics_sinks = list(metrics_sinks or [])
+        self.profile_cpu = profile_cpu
+        self.trace_memory = trace_memory
+        
         # Create output directory if it doesn't exist
+        new_output_dir = is_new_output_dir(output_dir)
         os.makedirs(output_dir, exist_ok=True)
+        
+        # Directory layout for new workflows; defaults to the one recorded in output_dir.
+        # Only a new output directory gets a layout marker: opening an existing one
+        # (e.g. to view it) leaves it as it is; migrate changes it explicitly
+        recorded_layout = read_layout_name(output_dir)
+        self.layout = get_layout(layout or recorded_layout or DEFAULT_LAYOUT)
+        if new_output_dir:
+            write_layout_name(output_dir, self.layout.name)
+        
+        # Phase progress, for get_workflow_status and resume_workflow
+        self.journal = WorkflowJournal(os.path.join(output_dir, JOURNAL_FILENAME))
+        
+        # Index of completed workflows; index existing output on first use
+        self.catalog = WorkflowCatalog(os.path.join(output_dir, CATALOG_FILENAME))
+        if self.catalog.created:
+            self.catalog.rebuild(output_dir)
     
     def create_blog_post(self, topic: str, target_audience: str = "general", 
                         tone: str = "conversational", word_count: int = 1500,
-                        custom_keywords: Optional[list] = None) -> Dict:
+                        custom_keywords: Optional[list] = None,
+                        progress: Optional[ProgressCallback] = None) -> Dict:
         """
         Complete workflow: Research → Write → Optimize
+        progress, if given, is told as each step starts (see PROGRESS_STEPS)
         """
-        print(f"Starting blog creation workflow for: {topic}")
-        print("=" * 50)
+        logger.info("Starting blog creation workflow for: %s", topic)
         
         workflow_id = self._generate_workflow_id(topic)
+        params = {
+            "topic": topic,
+            "target_audience": target_audience,
+            "tone": tone,
+            "word_count": word_count,
+            "custom_keywords": custom_keywords
+        }
+        self.journal.record_start(workflow_id, params)
+        
+        return self._run_workflow(workflow_id, params, progress=progress)
+    
+    def resume_workflow(self, workflow_id: str,
+                        progress: Optional[ProgressCallback] = None) -> Dict:
+        """
+        Finish an interrupted or failed workflow from its last completed phase
+        Phases whose saved record is missing or fails its journal checksum
+        are run again, along with every phase after them
+        """
+        state = self.journal.workflow_state(workflow_id)
+        if state is None:
+            # Finished workflows leave the journal; their summary is the result
+            summary = self.load_workflow_summary(workflow_id)
+            if summary is not None:
+                return summary
+            raise ValueError(f"Workflow {workflow_id} has no journal entries to resume from")
+        
+        saved = self._verified_phases(workflow_id, state)
+        logger.info("Resuming workflow %s: %d/%d phases already saved",
+                    workflow_id, len(saved), len(PHASES))
+        
+        return self._run_workflow(workflow_id, state["params"], saved, progress)
+    
+    def incomplete_workflows(self) -> List[str]:
+        """
+        IDs of workflows that were interrupted or failed, for resume_workflow
+        """
+        return self.journal.incomplete_workflows()
+    
+    def _run_workflow(self, workflow_id: str, params: Dict,
+                      saved: Optional[Dict] = None,
+                      progress: Optional[ProgressCallback] = None) -> Dict:
+        """
+        Research → Write → Optimize → Export, skipping phases in saved
+        The returned output carries the run's final metrics; the saved
+        summary holds them as of its own write
+        """
+        saved = saved or {}
+        with collect(workflow_id, self.profile_cpu, self.trace_memory) as metrics:
+            final_output = self._run_phases(workflow_id, params, saved, progress)
+        final_output["metrics"] = metrics.to_dict()
+        self._finish_metrics(workflow_id, final_output["metrics"], metrics)
+        
+        logger.info("Blog post creation completed: %s/", self.workflow_dir(workflow_id))
+        
+        # Print the generated blog content
+        if self.echo_content:
+            self._print_blog_content(final_output)
+        
+        return final_output
+    
+    def _run_phases(self, workflow_id: str, params: Dict, saved: Dict,
+                    progress: Optional[ProgressCallback] = None) -> Dict:
+        """
+        The phases and export of _run_workflow, run under its metrics collector
+        """
+        topic = params["topic"]
+        target_audience = params.get("target_audience", "general")
         
         # Phase 1: Research
-        print("\nPHASE 1: RESEARCH")
-        research_data = self.researcher.research_topic(topic, target_audience)
-        self._save_phase_data(workflow_id, "research", research_data)
-        print(f"Research completed: {len(research_data['trends'])} trends, {len(research_data['statistics'])} stats")
+        logger.info("PHASE 1: RESEARCH")
+        self._report_progress(progress, workflow_id, "research")
+        research_data = self._run_phase(workflow_id, "research", saved,
+                                        lambda: self.researcher.research_topic(topic, target_audience))
+        logger.info("Research completed: %d trends, %d stats",
+                    len(research_data['trends']), len(research_data['statistics']))
         
         # Phase 2: Content Writing
-        print("\nPHASE 2: CONTENT WRITING")
-        content_data = self.writer.write_blog_post(research_data, tone, word_count)
-        self._save_phase_data(workflow_id, "content", content_data)
-        print(f"Content written: {content_data['word_count']} words, {len(content_data['main_content'])} sections")
+        logger.info("PHASE 2: CONTENT WRITING")
+        self._report_progress(progress, workflow_id, "content")
+        content_data = self._run_phase(workflow_id, "content", saved,
+                                       lambda: self.writer.write_blog_post(research_data,
+                                                                          params.get("tone", "conversational"),
+                                                                          params.get("word_count", 1500)))
+        logger.info("Content written: %d words, %d sections",
+                    content_data['word_count'], len(content_data['main_content']))
         
         # Phase 3: SEO Optimization
-        print("\nPHASE 3: SEO OPTIMIZATION")
-        keywords = custom_keywords or [kw["keyword"] for kw in research_data.get("keywords", [])]
-        optimized_data = self.seo_editor.optimize_content(content_data, research_data, keywords)
-        self._save_phase_data(workflow_id, "seo", optimized_data)
-        print(f"SEO optimization completed: {optimized_data['seo_score']['percentage']}% score")
+        logger.info("PHASE 3: SEO OPTIMIZATION")
+        self._report_progress(progress, workflow_id, "seo")
+        keywords = params.get("custom_keywords") or [kw["keyword"] for kw in research_data.get("keywords", [])]
+        optimized_data = self._run_phase(workflow_id, "seo", saved,
+                                         lambda: self.seo_editor.optimize_content(content_data, research_data, keywords))
+        logger.info("SEO optimization completed: %s%% score", optimized_data['seo_score']['percentage'])
         
         # Compile final results
         final_output = self._compile_final_output(workflow_id, research_data, 
                                                 content_data, optimized_data)
         
         # Export everything
-        self._export_complete_workflow(workflow_id, final_output)
+        self._report_progress(progress, workflow_id, "export")
+        self.journal.record_phase_start(workflow_id, "export")
+        try:
+            self._export_complete_workflow(workflow_id, final_output, optimized_data, content_data)
+        except Exception as e:
+            self.journal.record_phase_failed(workflow_id, "export", f"{type(e).__name__}: {e}")
+            raise
+        
+        self.journal.record_done(workflow_id)
+        self._report_progress(progress, workflow_id, "completed")
+        return final_output
+    
+    def _report_progress(self, progress: Optional[ProgressCallback],
+                         workflow_id: str, step: str) -> None:
+        if progress is None:
+            return
+        completed = PROGRESS_STEPS.index(step) if step in PROGRESS_STEPS else len(PROGRESS_STEPS)
+        progress(workflow_id, step, completed, len(PROGRESS_STEPS))
+    
+    async def acreate_blog_post(self, topic: str, target_audience: str = "general",
+                                tone: str = "conversational", word_count: int = 1500,
+                                custom_keywords: Optional[list] = None) -> Dict:
+        """
+        Asyncio version of create_blog_post: Research → Write → Optimize
+        Agents are awaited and every file write runs in a worker thread, so
+        many workflows can interleave on one event loop
+        """
+        logger.info("Starting blog creation workflow for: %s", topic)
         
-        # Create blog page HTML file
-        self._create_blog_page_file(workflow_id, final_output)
+        workflow_id = self._generate_workflow_id(topic)
+        # Journal writes may fsync, so like every other write they stay off the loop
+        await asyncio.to_thread(self.journal.record_start, workflow_id, {
+            "topic": topic,
+            "target_audience": target_audience,
+            "tone": tone,
+            "word_count": word_count,
+            "custom_keywords": custom_keywords
+        })
         
-        print(f"\nBlog post creation completed!")
-        print(f"All files saved to: {self.output_dir}/{workflow_id}/")
+        # cProfile would mix in every task on the loop, so only tracemalloc is offered here
+        with collect(workflow_id, trace_memory=self.trace_memory) as metrics:
+            final_output = await self._arun_phases(workflow_id, topic, target_audience,
+                                                   tone, word_count, custom_keywords)
+        final_output["metrics"] = metrics.to_dict()
+        await asyncio.to_thread(self._finish_metrics, workflow_id, final_output["metrics"], metrics)
         
-        # Print the generated blog content
-        self._print_blog_content(final_output)
+        logger.info("Blog post creation completed: %s/", self.workflow_dir(workflow_id))
+        if self.echo_content:
+            self._print_blog_content(final_output)
+        
+        return final_output
+    
+    async def _arun_phases(self, workflow_id: str, topic: str, target_audience: str,
+                           tone: str, word_count: int, custom_keywords: Optional[list]) -> Dict:
+        """
+        The phases and export of acreate_blog_post, run under its metrics collector
+        """
+        # Phase 1: Research
+        research_data = await self._arun_phase(
+            workflow_id, "research", self.researcher.aresearch_topic(topic, target_audience))
+        
+        # Phase 2: Content Writing
+        content_data = await self._arun_phase(
+            workflow_id, "content", self.writer.awrite_blog_post(research_data, tone, word_count))
         
+        # Phase 3: SEO Optimization
+        keywords = custom_keywords or [kw["keyword"] for kw in research_data.get("keywords", [])]
+        optimized_data = await self._arun_phase(
+            workflow_id, "seo", self.seo_editor.aoptimize_content(content_data, research_data, keywords))
+        
+        final_output = self._compile_final_output(workflow_id, research_data,
+                                                content_data, optimized_data)
+        
+        await asyncio.to_thread(self.journal.record_phase_start, workflow_id, "export")
+        try:
+            await asyncio.to_thread(self._export_complete_workflow, workflow_id, final_output,
+                                    optimized_data, content_data)
+        except Exception as e:
+            await asyncio.to_thread(self.journal.record_phase_failed, workflow_id, "export",
+                                    f"{type(e).__name__}: {e}")
+            raise
+        await asyncio.to_thread(self.journal.record_done, workflow_id)
         return final_output
     
+    def create_blog_posts_batch(self, jobs: List[Dict],
+                                workers: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Run many Research → Write → Optimize workflows across a process pool
+        
+        Each job is a dict of create_blog_post keyword arguments (``topic`` is
+        required), or ``{"resume_workflow": workflow_id}``. Results are yielded
+        in completion order, one per job, so callers can stream them; a
+        failing job is reported on its own and does not abort the rest of the
+        batch.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+        
+        workers = workers or os.cpu_count() or 1
+        workers = max(1, min(workers, len(jobs)))
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_batch_worker,
+                                 initargs=(self.output_dir, self.researcher.cache,
+                                           self._worker_options())) as pool:
+            futures = {
+                pool.submit(_run_batch_job, index, job): index
+                for index, job in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. BrokenProcessPool)
+                    yield {
+                        "index": index,
+                        "job": jobs[index],
+                        "status": "failed",
+                        "error": f"{type(e).__name__}: {e}"
+                    }
+                    continue
+                if result["status"] == "completed":
+                    self._emit_metrics(result["result"]["workflow_id"], result["result"].get("metrics"))
+                yield result
+    
+    def _run_phase(self, workflow_id: str, phase: str, saved: Dict, compute) -> Dict:
+        """
+        Run one phase and save its record, journaling start and finish
+        A phase already in saved (verified on resume) is not run again
+        """
+        if phase in saved:
+            logger.info("Using %s data saved by an earlier run", phase)
+            return saved[phase]
+        
+        self.journal.record_phase_start(workflow_id, phase)
+        try:
+            with span(phase):
+                data = compute()
+                filename, checksum = self._save_phase_data(workflow_id, phase, data)
+        except Exception as e:
+            self.journal.record_phase_failed(workflow_id, phase, f"{type(e).__name__}: {e}")
+            raise
+        self.journal.record_phase_done(workflow_id, phase, filename, checksum)
+        return data
+    
+    async def _arun_phase(self, workflow_id: str, phase: str, compute) -> Dict:
+        """
+        Asyncio version of _run_phase: awaits compute, saves and journals in worker threads
+        """
+        await asyncio.to_thread(self.journal.record_phase_start, workflow_id, phase)
+        try:
+            # Sub-step CPU times are exact; the phase's own CPU time is the event loop thread's
+            with span(phase):
+                data = await compute
+                filename, checksum = await asyncio.to_thread(self._save_phase_data, workflow_id, phase, data)
+        except Exception as e:
+            await asyncio.to_thread(self.journal.record_phase_failed, workflow_id, phase,
+                                    f"{type(e).__name__}: {e}")
+            raise
+        await asyncio.to_thread(self.journal.record_phase_done, workflow_id, phase, filename, checksum)
+        return data
+    
+    def _verified_phases(self, workflow_id: str, state: Dict) -> Dict:
+        """
+        Data of the leading phases whose saved records match their journal checksums
+        """
+        workflow_dir = self.workflow_dir(workflow_id)
+        saved = {}
+        for phase in PHASES:
+            entry = state["phases"].get(phase)
+            if entry is None:
+                break
+            filepath = os.path.join(workflow_dir, entry["file"])
+            if self._file_checksum(filepath) != entry["sha256"]:
+                logger.warning("Saved %s data of %s is missing or damaged; running it again",
+                               phase, workflow_id)
+                break
+            saved[phase] = self._read_record_file(filepath)
+        return saved
+    
+    def _file_checksum(self, filepath: str) -> Optional[str]:
+        try:
+            with open(filepath, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+    
+    def _finish_metrics(self, workflow_id: str, metrics_data: Dict,
+                        metrics: WorkflowMetrics) -> None:
+        """
+        Save any captured profiles and send a finished workflow's metrics to the sinks
+        """
+        save_profiles(metrics, self.workflow_dir(workflow_id))
+        self._emit_metrics(workflow_id, metrics_data)
+    
+    def _emit_metrics(self, workflow_id: str, metrics_data: Optional[Dict]) -> None:
+        if not metrics_data:
+            return
+        for sink in self.metrics_sinks:
+            try:
+                sink.emit(workflow_id, metrics_data)
+            except OSError as e:
+                logger.warning("Could not write metrics to %s: %s", type(sink).__name__, e)
+    
+    def _worker_options(self) -> Dict:
+        """
+        Coordinator options batch workers are created with: storage and profiling
+        (workers report metrics back with their results, so sinks stay here)
+        """
+        return {
+            "dedup_artifacts": self.dedup_artifacts,
+            "lazy_artifacts": self.lazy_artifacts,
+            "record_format": self.record_format,
+            "pack_compression": self.pack_compression,
+            "layout": self.layout.name,
+            "profile_cpu": self.profile_cpu,
+            "trace_memory": self.trace_memory
+        }
+    
     def _generate_workflow_id(self, topic: str) -> str:
         """
         Generate unique workflow ID
+        Time-sortable and unique across processes and hosts (see workflow_ids),
+        followed by a slug of the topic
         """
         # Clean topic for filename
         clean_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
         clean_topic = clean_topic.replace(' ', '_').lower()[:30]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{clean_topic}_{timestamp}"
+        return new_workflow_id(clean_topic)
+    
+    def workflow_dir(self, workflow_id: str) -> str:
+        """
+        Directory holding a workflow's files, in whichever layout it was written
+        """
+        return resolve_workflow_dir(self.output_dir, workflow_id, self.layout)
     
-    def _save_phase_data(self, workflow_id: str, phase: str, data: Dict) -> None:
+    def _save_phase_data(self, workflow_id: str, phase: str, data: Dict) -> tuple:
         """
         Save data from each phase
+        Returns the saved file's name and SHA-256 for the journal
         """
-        workflow_dir = os.path.join(self.output_dir, workflow_id)
+        workflow_dir = self.workflow_dir(workflow_id)
         os.makedirs(workflow_dir, exist_ok=True)
         
         filepath = os.path.join(workflow_dir, f"{phase}_data.json")
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        filepath, checksum = self._write_record(filepath, data)
+        return os.path.basename(filepath), checksum
+    
+    def _write_record(self, filepath: str, record: Dict) -> tuple:
+        """
+        Atomically write a record to filepath (a .json path) as JSON, or next
+        to it as a pack file in the "pack" record format
+        When deduplicating, the post body, sections and embedded content
+        record are references to shared blobs, and a JSON file is a link to
+        its record blob
+        Returns the path written and the SHA-256 of its contents
+        """
+        if self.dedup_artifacts:
+            record = self._dedup_record(record)
+        
+        if self.record_format == "pack":
+            filepath = pack_path(filepath)
+            data = encode_pack(record, self.pack_compression)
+        elif self.dedup_artifacts:
+            packed = json.dumps(record, separators=(',', ':'), default=str)
+            digest = self.blobs.put_text(packed)
+            self.blobs.link(digest, filepath)
+            record_bytes(os.path.basename(filepath), len(packed.encode('utf-8')))
+            return filepath, digest
+        else:
+            data = json.dumps(record, indent=2, default=str).encode('utf-8')
+        
+        self._write_bytes(filepath, data)
+        record_bytes(os.path.basename(filepath), len(data))
+        return filepath, hashlib.sha256(data).hexdigest()
+    
+    def _write_bytes(self, filepath: str, data: bytes) -> None:
+        # Write next to the target and swap in, so a crash never leaves a truncated record
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    
+    def _dedup_record(self, record: Dict) -> Dict:
+        record = dict(record)
+        if isinstance(record.get("original_content"), dict):
+            # The SEO phase embeds the whole content record: store it once
+            record["original_content"] = {"$json": self._store_record(record["original_content"])}
+        return dedup_record(record, self.blobs, [self._record_body(record)])
+    
+    def _store_record(self, record: Dict) -> str:
+        return store_record(record, self.blobs, [self._record_body(record)])
+    
+    def _record_body(self, record: Dict) -> Optional[str]:
+        # The post body is the text every section and copy is a slice of
+        return record.get("full_text") or record.get("final_content")
+    
+    def _write_file(self, filepath: str, chunks: Iterable[str]) -> None:
+        """
+        Stream text into an artifact file (through the blob store when deduplicating)
+        """
+        if self.dedup_artifacts:
+            self.blobs.link(self.blobs.put_chunks(chunks), filepath)
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                write_chunks(chunks, f)
+        record_bytes(os.path.basename(filepath), os.path.getsize(filepath))
+    
+    def load_phase_data(self, workflow_id: str, phase: str) -> Optional[Dict]:
+        """
+        Saved data of one phase (research, content or seo), or None
+        """
+        return self._load_record(workflow_id, f"{phase}_data.json")
+    
+    def load_workflow_summary(self, workflow_id: str) -> Optional[Dict]:
+        """
+        Final output of a completed workflow, or None
+        """
+        return self._load_record(workflow_id, "workflow_summary.json")
+    
+    def workflow_summary_signature(self, workflow_id: str) -> Optional[tuple]:
+        """
+        (path, mtime_ns, size) of a workflow's saved summary, or None
+        Changes whenever the summary is rewritten; a cache key for load_workflow_summary
+        """
+        filepath = self._record_path(self.workflow_dir(workflow_id), "workflow_summary.json")
+        if filepath is None:
+            return None
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return filepath, stat.st_mtime_ns, stat.st_size
+    
+    def read_workflow_field(self, workflow_id: str, field: str, default=None):
+        """
+        One field of a workflow summary (e.g. seo_score)
+        Pack files decode only that field, never the post body
+        """
+        filepath = self._record_path(self.workflow_dir(workflow_id),
+                                     "workflow_summary.json")
+        if filepath is None:
+            return default
+        if filepath.endswith(PACK_SUFFIX):
+            with PackReader(filepath) as reader:
+                return resolve_record(reader.read_field(field, default), self.blobs)
+        return load_record(filepath, self.blobs).get(field, default)
+    
+    def _record_path(self, workflow_dir: str, filename: str) -> Optional[str]:
+        """
+        Existing file holding a record: its pack file if there is one, else the JSON file
+        """
+        json_path = os.path.join(workflow_dir, filename)
+        for filepath in (pack_path(json_path), json_path):
+            if os.path.exists(filepath):
+                return filepath
+        return None
+    
+    def _load_record(self, workflow_id: str, filename: str) -> Optional[Dict]:
+        filepath = self._record_path(self.workflow_dir(workflow_id), filename)
+        if filepath is None:
+            return None
+        return self._read_record_file(filepath)
+    
+    def _read_record_file(self, filepath: str) -> Dict:
+        if filepath.endswith(PACK_SUFFIX):
+            return resolve_record(load_pack(filepath), self.blobs)
+        return load_record(filepath, self.blobs)
     
     def _compile_final_output(self, workflow_id: str, research_data: Dict, 
                             content_data: Dict, optimized_data: Dict) -> Dict:
@@ -124,91 +640,70 @@ class BlogTeamCoordinator:
             }
         }
     
-    def _export_complete_workflow(self, workflow_id: str, final_output: Dict) -> None:
+    def _export_complete_workflow(self, workflow_id: str, final_output: Dict,
+                                  optimized_data: Optional[Dict] = None,
+                                  content_data: Optional[Dict] = None) -> None:
         """
         Export all final files
+        Derived files come first and the workflow summary last, so the
+        metrics stored in the summary cover them; in lazy mode only the
+        summary is written here
         """
-        workflow_dir = os.path.join(self.output_dir, workflow_id)
-        
-        # Export final blog post (markdown)
-        blog_path = os.path.join(workflow_dir, "final_blog_post.md")
-        with open(blog_path, 'w', encoding='utf-8') as f:
-            f.write(final_output["final_content"])
-        
-        # Export SEO-ready HTML version
-        html_path = os.path.join(workflow_dir, "seo_ready.html")
-        self._create_html_version(final_output, html_path)
+        workflow_dir = self.workflow_dir(workflow_id)
         
-        # Export workflow summary
-        summary_path = os.path.join(workflow_dir, "workflow_summary.json")
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(final_output, f, indent=2, default=str)
-        
-        # Export optimization report
-        report_path = os.path.join(workflow_dir, "optimization_report.txt")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(self.seo_editor.generate_optimization_report())
+        with span("export"):
+            if not self.lazy_artifacts:
+                # Export final blog post (markdown)
+                blog_path = os.path.join(workflow_dir, "final_blog_post.md")
+                self._write_file(blog_path, [final_output["final_content"]])
+                
+                # Export SEO-ready HTML version
+                html_path = os.path.join(workflow_dir, "seo_ready.html")
+                self._create_html_version(final_output, html_path, content_data)
+                
+                # Export optimization report
+                report_path = os.path.join(workflow_dir, "optimization_report.txt")
+                self._write_file(report_path, [self.seo_editor.generate_optimization_report(optimized_data)])
+                
+                # Export content brief for client/team
+                brief_path = os.path.join(workflow_dir, "content_brief.md")
+                self._create_content_brief(final_output, brief_path)
+                
+                # Create blog page HTML file
+                self._create_blog_page_file(workflow_id, final_output, content_data)
+            
+            metrics = current_metrics()
+            if metrics is not None:
+                final_output["metrics"] = metrics.to_dict()
+            
+            # Export workflow summary
+            summary_path = os.path.join(workflow_dir, "workflow_summary.json")
+            self._write_record(summary_path, final_output)
         
-        # Export content brief for client/team
-        brief_path = os.path.join(workflow_dir, "content_brief.md")
-        self._create_content_brief(final_output, brief_path)
+        # Make the workflow visible to list_workflows
+        self.catalog.upsert(final_output)
     
-    def _create_html_version(self, final_output: Dict, filepath: str) -> None:
+    def _create_html_version(self, final_output: Dict, filepath: str,
+                             content_data: Optional[Dict] = None) -> None:
         """
         Create SEO-ready HTML version
         """
-        html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{final_output['final_title']}</title>
-    <meta name="description" content="{final_output['final_meta_description']}">
-    <meta name="robots" content="index, follow">
-    <meta property="og:title" content="{final_output['final_title']}">
-    <meta property="og:description" content="{final_output['final_meta_description']}">
-    <meta property="og:type" content="article">
-</head>
-<body>
-    <article>
-        {self._markdown_to_html(final_output['final_content'])}
-    </article>
-</body>
-</html>"""
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_template)
+        self._write_file(filepath, self._artifact_chunks("seo_html", final_output, content_data))
     
     def _markdown_to_html(self, markdown_content: str) -> str:
         """
         Simple markdown to HTML conversion
         """
-        html = markdown_content
-        
-        # Convert headers
-        html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        
-        # Convert bold text
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-        
-        # Convert paragraphs
-        paragraphs = html.split('\n\n')
-        html_paragraphs = []
-        for para in paragraphs:
-            if para.strip() and not para.startswith('<h'):
-                html_paragraphs.append(f'<p>{para.strip()}</p>')
-            else:
-                html_paragraphs.append(para)
-        
-        return '\n'.join(html_paragraphs)
+        return "".join(render_markdown(iter_text_lines(markdown_content)))
     
     def _create_content_brief(self, final_output: Dict, filepath: str) -> None:
         """
         Create content brief for team/client review
         """
-        brief = f"""# Content Brief: {final_output['topic']}
+        self._write_file(filepath, [self._content_brief_text(final_output)])
+    
+    def _content_brief_text(self, final_output: Dict) -> str:
+        return f"""# Content Brief: {final_output['topic']}
 
 ## Overview
 - **Topic**: {final_output['topic']}
@@ -243,25 +738,190 @@ class BlogTeamCoordinator:
 ---
 *Generated by Blog Team AI on {final_output['creation_date']}*
 """
+    
+    def _artifact_chunks(self, kind: str, final_output: Dict,
+                         content_data: Optional[Dict] = None,
+                         optimized_data: Optional[Dict] = None) -> Iterable[str]:
+        """
+        Render one derived artifact from the workflow records
+        """
+        if kind == "markdown":
+            return [final_output["final_content"]]
+        if kind == "seo_html":
+            return render_seo_html(final_output, render_post_body(final_output, content_data))
+        if kind == "blog_page":
+            return render_blog_page(final_output, render_post_body(final_output, content_data))
+        if kind == "content_brief":
+            return [self._content_brief_text(final_output)]
+        return [self.seo_editor.generate_optimization_report(optimized_data)]
+    
+    def get_artifact(self, workflow_id: str, kind: str) -> str:
+        """
+        Path of a derived artifact (see ARTIFACT_FILES), rendering it on first request
+        A rendered file is reused until a record it was rendered from changes
+        """
+        if kind not in ARTIFACT_FILES:
+            raise ValueError(f"kind must be one of {', '.join(ARTIFACT_FILES)}")
+        
+        workflow_dir = self.workflow_dir(workflow_id)
+        filepath = os.path.join(workflow_dir, ARTIFACT_FILES[kind])
+        source_hash = self._artifact_source_hash(workflow_dir, kind)
+        if source_hash is None:
+            raise FileNotFoundError(f"Workflow {workflow_id} has no records to render {kind} from")
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(brief)
+        with self._artifact_lock:
+            manifest = self._read_artifact_manifest(workflow_dir)
+            rendered_from = manifest.get(kind)
+            # Files without a manifest entry were written by an eager export
+            if os.path.exists(filepath) and rendered_from in (None, source_hash):
+                return filepath
+            
+            summary = self.load_workflow_summary(workflow_id)
+            content_data = self.load_phase_data(workflow_id, "content")
+            optimized_data = self.load_phase_data(workflow_id, "seo") if kind == "optimization_report" else None
+            
+            # Render next to the target and swap in, so readers never see a partial file
+            tmp_path = f"{filepath}.{os.getpid()}.tmp"
+            self._write_file(tmp_path, self._artifact_chunks(kind, summary, content_data, optimized_data))
+            os.replace(tmp_path, filepath)
+            
+            manifest[kind] = source_hash
+            self._write_artifact_manifest(workflow_dir, manifest)
+        
+        return filepath
+    
+    def workflow_files(self, workflow_id: str) -> List[Dict]:
+        """
+        Downloadable files of a workflow, by name: path, size on disk, modification
+        time and whether it is a record
+        Nothing is read; records are listed under their JSON name in any storage format
+        """
+        workflow_dir = self.workflow_dir(workflow_id)
+        if not os.path.isdir(workflow_dir):
+            return []
+        
+        record_names = {pack_path(name): name for name in RECORD_FILES}
+        record_names.update((name, name) for name in RECORD_FILES)
+        files = {}
+        with os.scandir(workflow_dir) as entries:
+            for entry in entries:
+                if (not entry.is_file() or entry.name == ARTIFACT_MANIFEST
+                        or entry.name.endswith(".tmp")):
+                    continue
+                stat = entry.stat()
+                name = record_names.get(entry.name, entry.name)
+                # A pack file stands in for its JSON file when both exist
+                if name in files and not entry.name.endswith(PACK_SUFFIX):
+                    continue
+                files[name] = {
+                    "name": name,
+                    "path": entry.path,
+                    "size": stat.st_size,
+                    "modified": datetime.fromtimestamp(stat.st_mtime),
+                    "record": name in RECORD_FILES
+                }
+        return [files[name] for name in sorted(files)]
+    
+    def iter_workflow_file(self, workflow_id: str, name: str,
+                           chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Bytes of one file from workflow_files, streamed in chunks
+        Records are decoded (packs expanded, blob references resolved) and
+        re-encoded as JSON on the fly; other files are read straight from disk
+        """
+        for file in self.workflow_files(workflow_id):
+            if file["name"] == name:
+                return self._iter_file(file, chunk_size)
+        raise FileNotFoundError(f"Workflow {workflow_id} has no file {name}")
+    
+    def _iter_file(self, file: Dict, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        if file["record"]:
+            return iter_json_chunks(self._read_record_file(file["path"]),
+                                    chunk_size or chunk_size_for(file["size"]))
+        return iter_file_chunks(file["path"], chunk_size, file["size"])
+    
+    def iter_workflow_bundle(self, workflow_id: str, render_artifacts: bool = True) -> Iterator[bytes]:
+        """
+        Zip archive of a workflow's files under <workflow_id>/, streamed as it is built
+        With render_artifacts, derived files a lazy coordinator has not
+        rendered yet are rendered first, so the bundle is complete
+        """
+        if not os.path.isdir(self.workflow_dir(workflow_id)):
+            raise FileNotFoundError(f"Workflow {workflow_id} not found")
+        if render_artifacts:
+            for kind in ARTIFACT_FILES:
+                try:
+                    self.get_artifact(workflow_id, kind)
+                except FileNotFoundError:
+                    pass
+        
+        entries = [
+            (f"{workflow_id}/{file['name']}", file["modified"],
+             lambda file=file: self._iter_file(file),
+             # Re-encoded records may differ in size from the stored file
+             None if file["record"] else file["size"])
+            for file in self.workflow_files(workflow_id)
+        ]
+        return iter_zip(entries)
+    
+    def _artifact_source_hash(self, workflow_dir: str, kind: str) -> Optional[str]:
+        """
+        Hash of the saved records an artifact is rendered from
+        None when a required record is missing (content data is optional)
+        """
+        sha = hashlib.sha256()
+        for filename in ARTIFACT_SOURCES[kind]:
+            filepath = self._record_path(workflow_dir, filename)
+            if filepath is None:
+                if filename != "content_data.json":
+                    return None
+                continue
+            sha.update(os.path.basename(filepath).encode('utf-8'))
+            with open(filepath, 'rb') as f:
+                sha.update(hashlib.sha256(f.read()).digest())
+        return sha.hexdigest()
+    
+    def _read_artifact_manifest(self, workflow_dir: str) -> Dict:
+        try:
+            with open(os.path.join(workflow_dir, ARTIFACT_MANIFEST), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_artifact_manifest(self, workflow_dir: str, manifest: Dict) -> None:
+        manifest_path = os.path.join(workflow_dir, ARTIFACT_MANIFEST)
+        tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, manifest_path)
     
     def get_workflow_status(self, workflow_id: str) -> Dict:
         """
         Get status of a specific workflow
         """
-        workflow_dir = os.path.join(self.output_dir, workflow_id)
+        state = self.journal.workflow_state(workflow_id)
+        if state is not None:
+            status = {
+                "workflow_id": workflow_id,
+                "completed_phases": [phase for phase in PHASES if phase in state["phases"]],
+                "total_phases": len(PHASES),
+                "status": state["status"]
+            }
+            if state["error"]:
+                status["error"] = state["error"]
+            return status
+        
+        # Workflows from before the journal: check which records exist
+        workflow_dir = self.workflow_dir(workflow_id)
         if not os.path.exists(workflow_dir):
             return {"error": "Workflow not found"}
         
         # Check which phases are complete
-        phases = ["research", "content", "seo"]
+        phases = list(PHASES)
         completed_phases = []
         
         for phase in phases:
-            phase_file = os.path.join(workflow_dir, f"{phase}_data.json")
-            if os.path.exists(phase_file):
+            if self._record_path(workflow_dir, f"{phase}_data.json"):
                 completed_phases.append(phase)
         
         return {
@@ -271,64 +931,62 @@ class BlogTeamCoordinator:
             "status": "completed" if len(completed_phases) == len(phases) else "in_progress"
         }
     
-    def list_workflows(self) -> List[Dict]:
+    def list_workflows(self, limit: Optional[int] = None, offset: int = 0,
+                       sort_by: str = "creation_date", descending: bool = True,
+                       search: Optional[str] = None,
+                       after: Optional[Dict] = None) -> List[Dict]:
         """
-        List all completed workflows
+        List completed workflows from the catalog, newest first by default
+        Supports pagination (limit/offset, or after: the previous page's last
+        row), sorting and topic search
         """
-        workflows = []
-        
-        if not os.path.exists(self.output_dir):
-            return workflows
-        
-        for item in os.listdir(self.output_dir):
-            item_path = os.path.join(self.output_dir, item)
-            if os.path.isdir(item_path):
-                summary_file = os.path.join(item_path, "workflow_summary.json")
-                if os.path.exists(summary_file):
-                    try:
-                        with open(summary_file, 'r', encoding='utf-8') as f:
-                            summary = json.load(f)
-                            workflows.append({
-                                "workflow_id": summary["workflow_id"],
-                                "topic": summary["topic"],
-                                "creation_date": summary["creation_date"],
-                                "seo_score": summary["seo_score"],
-                                "word_count": summary["word_count"]
-                            })
-                    except Exception as e:
-                        continue
-        
-        return sorted(workflows, key=lambda x: x["creation_date"], reverse=True)
+        return self.catalog.list(limit=limit, offset=offset, sort_by=sort_by,
+                                 descending=descending, search=search, after=after)
+    
+    def catalog_version(self) -> int:
+        """
+        Changes whenever the set of listed workflows does; a cache key for listings
+        """
+        return self.catalog.version()
+    
+    def count_workflows(self, search: Optional[str] = None) -> int:
+        """
+        Number of completed workflows, optionally matching a topic search
+        """
+        return self.catalog.count(search=search)
+    
+    def rebuild_catalog(self) -> int:
+        """
+        Re-index every workflow in the output directory
+        """
+        return self.catalog.rebuild(self.output_dir)
     
     def _print_blog_content(self, final_output: Dict) -> None:
         """
-        Print the generated blog content to the console
+        Print the generated blog content to the console, in a single write
         """
-        print("\n" + "="*80)
-        print("GENERATED BLOG CONTENT")
-        print("="*80)
-        print(f"Title: {final_output['final_title']}")
-        print(f"Meta Description: {final_output['final_meta_description']}")
-        print(f"Word Count: {final_output['word_count']} words")
-        print(f"SEO Score: {final_output['seo_score']}%")
-        print("-"*80)
-        print(final_output['final_content'])
-        print("="*80)
+        print("\n".join([
+            "\n" + "="*80,
+            "GENERATED BLOG CONTENT",
+            "="*80,
+            f"Title: {final_output['final_title']}",
+            f"Meta Description: {final_output['final_meta_description']}",
+            f"Word Count: {final_output['word_count']} words",
+            f"SEO Score: {final_output['seo_score']}%",
+            "-"*80,
+            final_output['final_content'],
+            "="*80
+        ]))
     
     def print_workflow_content(self, workflow_id: str) -> None:
         """
         Print content from an existing workflow
         """
-        workflow_dir = os.path.join(self.output_dir, workflow_id)
-        summary_file = os.path.join(workflow_dir, "workflow_summary.json")
-        
-        if not os.path.exists(summary_file):
-            print(f"Workflow {workflow_id} not found")
-            return
-        
         try:
-            with open(summary_file, 'r', encoding='utf-8') as f:
-                summary = json.load(f)
+            summary = self.load_workflow_summary(workflow_id)
+            if summary is None:
+                print(f"Workflow {workflow_id} not found")
+                return
             self._print_blog_content(summary)
         except Exception as e:
             print(f"Error reading workflow: {str(e)}")
@@ -344,154 +1002,55 @@ class BlogTeamCoordinator:
         else:
             print("No workflows found")
     
-    def _create_blog_page_file(self, workflow_id: str, result: Dict) -> str:
+    def _create_blog_page_file(self, workflow_id: str, result: Dict,
+                               content_data: Optional[Dict] = None) -> str:
         """Create a standalone HTML blog page"""
-        blog_dir = os.path.join(self.output_dir, workflow_id)
+        blog_dir = self.workflow_dir(workflow_id)
         blog_page_path = os.path.join(blog_dir, "blog_page.html")
         
-        # Convert markdown content to HTML
-        content_html = result['final_content'].replace('\n\n', '</p><p>')
-        content_html = content_html.replace('\n', '<br>')
-        content_html = content_html.replace('# ', '<h1>').replace('</p><p><h1>', '</p><h1>')
-        content_html = content_html.replace('## ', '<h2>').replace('</p><p><h2>', '</p><h2>')
-        content_html = content_html.replace('### ', '<h3>').replace('</p><p><h3>', '</p><h3>')
-        content_html = content_html.replace('**', '<strong>').replace('**', '</strong>')
-        content_html = f"<p>{content_html}</p>"
-        
-        # Handle headings properly
-        content_html = content_html.replace('<p><h1>', '<h1>').replace('</p><p>', '</p>\n<p>')
-        content_html = content_html.replace('<p><h2>', '<h2>').replace('<p><h3>', '<h3>')
-        
-        html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{result['final_title']}</title>
-    <meta name="description" content="{result['final_meta_description']}">
-    <meta name="robots" content="index, follow">
-    
-    <!-- Open Graph / Facebook -->
-    <meta property="og:type" content="article">
-    <meta property="og:title" content="{result['final_title']}">
-    <meta property="og:description" content="{result['final_meta_description']}">
-    
-    <!-- Twitter -->
-    <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:title" content="{result['final_title']}">
-    <meta property="twitter:description" content="{result['final_meta_description']}">
-    
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 2rem;
-            background-color: #f8f9fa;
-        }}
-        
-        .article-container {{
-            background: white;
-            padding: 3rem;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }}
-        
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 0.5rem;
-            margin-bottom: 2rem;
-        }}
-        
-        h2 {{
-            color: #34495e;
-            margin-top: 2rem;
-            margin-bottom: 1rem;
-            border-left: 4px solid #3498db;
-            padding-left: 1rem;
-        }}
-        
-        h3 {{
-            color: #2c3e50;
-            margin-top: 1.5rem;
-        }}
-        
-        p {{
-            margin-bottom: 1.5rem;
-            text-align: justify;
-        }}
-        
-        strong {{
-            color: #2c3e50;
-            font-weight: 600;
-        }}
-        
-        .meta-info {{
-            background: #ecf0f1;
-            padding: 1rem;
-            border-radius: 4px;
-            margin-bottom: 2rem;
-            font-size: 0.9rem;
-            color: #7f8c8d;
-        }}
-        
-        .meta-info span {{
-            margin-right: 2rem;
-        }}
-        
-        .generated-by {{
-            text-align: center;
-            margin-top: 3rem;
-            padding-top: 2rem;
-            border-top: 1px solid #ecf0f1;
-            color: #95a5a6;
-            font-size: 0.8rem;
-        }}
-        
-        @media (max-width: 768px) {{
-            body {{
-                padding: 1rem;
-            }}
-            
-            .article-container {{
-                padding: 1.5rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="article-container">
-        <div class="meta-info">
-            <span><strong>Word Count:</strong> {result['word_count']} words</span>
-            <span><strong>SEO Score:</strong> {result['seo_score']}%</span>
-            <span><strong>Target Audience:</strong> {result['target_audience']}</span>
-            <span><strong>Created:</strong> {datetime.now().strftime('%B %d, %Y')}</span>
-        </div>
-        
-        {content_html}
-        
-        <div class="generated-by">
-            <p>Generated by AI Blog Writing Team<br>
-            Powered by Multi-Agent Content Creation System</p>
-        </div>
-    </div>
-</body>
-</html>"""
-        
-        with open(blog_page_path, 'w', encoding='utf-8') as f:
-            f.write(html_template)
+        self._write_file(blog_page_path, self._artifact_chunks("blog_page", result, content_data))
         
         return blog_page_path
 
+# Batch worker state: one coordinator per pool process, reused across jobs
+_batch_coordinator = None
+
+def _init_batch_worker(output_dir: str, research_cache: Optional[ResearchCache],
+                       options: Dict) -> None:
+    """
+    Process pool initializer for create_blog_posts_batch
+    """
+    global _batch_coordinator
+    _batch_coordinator = BlogTeamCoordinator(output_dir=output_dir,
+                                             research_cache=research_cache,
+                                             **options)
+
+def _run_batch_job(index: int, job: Dict) -> Dict:
+    """
+    Run a single batch job inside a pool process and report its outcome
+    """
+    try:
+        if "resume_workflow" in job:
+            result = _batch_coordinator.resume_workflow(job["resume_workflow"])
+        else:
+            result = _batch_coordinator.create_blog_post(**job)
+        return {"index": index, "job": job, "status": "completed", "result": result}
+    except Exception as e:
+        return {
+            "index": index,
+            "job": job,
+            "status": "failed",
+            "error": f"{type(e).__name__}: {e}",
+            "traceback": traceback.format_exc()
+        }
+
 # Example usage and testing functions
 def example_usage():
     """
     Example of how to use the BlogTeamCoordinator
     """
-    coordinator = BlogTeamCoordinator()
+    configure_console_logging()
+    coordinator = BlogTeamCoordinator(echo_content=True)
     
     # Create a blog post about "Digital Marketing"
     result = coordinator.create_blog_post(
@@ -508,7 +1067,7 @@ def example_usage():
     print(f"Final Title: {result['final_title']}")
     print(f"Word Count: {result['word_count']}")
     print(f"SEO Score: {result['seo_score']}%")
-    print(f"Files saved to: blog_output/{result['workflow_id']}/")
+    print(f"Files saved to: {coordinator.workflow_dir(result['workflow_id'])}/")
 
 if __name__ == "__main__":
     # Run example
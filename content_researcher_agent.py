@@ -1,6 +1,18 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
+import asyncio
+import contextvars
+import inspect
 import json
+import threading
+import time
+
+from research_cache import ResearchCache, make_research_key
+from pipeline_metrics import timed
+from blog_logging import get_logger
+
+logger = get_logger("researcher")
 
 class ContentResearcherAgent:
     """
@@ -8,32 +20,184 @@ class ContentResearcherAgent:
     Gathers comprehensive information about topics including trends, data, and insights
     """
     
-    def __init__(self, api_keys: Optional[Dict[str, str]] = None):
+    def __init__(self, api_keys: Optional[Dict[str, str]] = None,
+                 source_timeout: float = 10.0,
+                 source_timeouts: Optional[Dict[str, float]] = None,
+                 cache: Optional[ResearchCache] = None):
         self.api_keys = api_keys or {}
         self.research_data = {}
+        # Optional cache shared across workflows; repeat topic/audience
+        # pairs skip the research sources entirely
+        self.cache = cache
+        # Seconds each research source may take before it is dropped from
+        # the result; source_timeouts overrides it per source name
+        self.source_timeout = source_timeout
+        self.source_timeouts = source_timeouts or {}
+        self._executor = None
+        self._executor_lock = threading.Lock()
         
     def research_topic(self, topic: str, target_audience: str = "general") -> Dict:
         """
         Main research function that orchestrates all research activities
+        Sources run concurrently; a source that fails or times out contributes
+        an empty result and is listed in "source_errors"
         """
-        print(f"Starting research on: {topic}")
+        logger.info("Starting research on: %s", topic)
+        
+        sources = self._research_sources(topic, target_audience)
+        cache_key = self._cache_key(topic, target_audience, sources)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached research for: %s", topic)
+                self.research_data = cached
+                return cached
+        
+        # Submit under the lock, so another thread can't retire the pool mid-submit
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=len(sources),
+                                                    thread_name_prefix="research")
+            executor = self._executor
+            # Each source runs in the caller's context so its timings land in this workflow
+            started = time.monotonic()
+            futures = {
+                name: executor.submit(contextvars.copy_context().run, func, *args)
+                for name, func, args in sources
+            }
+        
+        findings = {}
+        source_errors = {}
+        overdue = False
+        # Wait for each source only until its own deadline, soonest first
+        for name in sorted(futures, key=self._source_timeout):
+            future = futures[name]
+            remaining = started + self._source_timeout(name) - time.monotonic()
+            wait([future], timeout=max(0.0, remaining))
+            if not future.done():
+                future.cancel()
+                overdue = True
+                findings[name] = []
+                source_errors[name] = f"timed out after {self._source_timeout(name)}s"
+            elif future.exception() is not None:
+                findings[name] = []
+                source_errors[name] = f"{type(future.exception()).__name__}: {future.exception()}"
+            else:
+                findings[name] = future.result()
+        
+        if overdue:
+            # A running thread can't be stopped; leave it to finish in the old
+            # pool and give later calls a fresh one so they don't queue behind it
+            with self._executor_lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+        
+        findings = {name: findings[name] for name in futures}
+        research_results = self._build_results(topic, target_audience, findings, source_errors)
+        if cache_key and not source_errors:
+            self.cache.set(cache_key, research_results)
+        return research_results
+    
+    async def aresearch_topic(self, topic: str, target_audience: str = "general") -> Dict:
+        """
+        Awaitable version of research_topic
+        Sources are awaited concurrently, each under its own timeout; plain
+        functions run in worker threads so the event loop stays free
+        """
+        logger.info("Starting research on: %s", topic)
+        
+        sources = self._research_sources(topic, target_audience)
+        cache_key = self._cache_key(topic, target_audience, sources)
+        if cache_key:
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                logger.info("Using cached research for: %s", topic)
+                self.research_data = cached
+                return cached
+        
+        outcomes = await asyncio.gather(*(
+            asyncio.wait_for(self._acall_source(func, args), self._source_timeout(name))
+            for name, func, args in sources
+        ), return_exceptions=True)
+        
+        findings = {}
+        source_errors = {}
+        for (name, _, _), outcome in zip(sources, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                findings[name] = []
+                source_errors[name] = f"timed out after {self._source_timeout(name)}s"
+            elif isinstance(outcome, Exception):
+                findings[name] = []
+                source_errors[name] = f"{type(outcome).__name__}: {outcome}"
+            else:
+                findings[name] = outcome
         
+        research_results = self._build_results(topic, target_audience, findings, source_errors)
+        if cache_key and not source_errors:
+            await asyncio.to_thread(self.cache.set, cache_key, research_results)
+        return research_results
+    
+    def _research_sources(self, topic: str, target_audience: str) -> List[Tuple[str, Callable, tuple]]:
+        """
+        Independent research sources as (result key, function, arguments)
+        """
+        return [
+            ("trends", self._analyze_trends, (topic,)),
+            ("statistics", self._gather_statistics, (topic,)),
+            ("expert_opinions", self._find_expert_opinions, (topic,)),
+            ("competitor_analysis", self._analyze_competitors, (topic,)),
+            ("audience_pain_points", self._identify_pain_points, (topic, target_audience)),
+            ("content_angles", self._suggest_content_angles, (topic,)),
+            ("keywords", self._research_keywords, (topic,))
+        ]
+    
+    def _cache_key(self, topic: str, target_audience: str, sources: List[Tuple]) -> Optional[str]:
+        """
+        Cache key for this request, or None when caching is disabled
+        Configured API backends are part of the key since they change results
+        """
+        if self.cache is None:
+            return None
+        source_names = [name for name, _, _ in sources]
+        source_names += [f"api:{name}" for name in self.api_keys]
+        return make_research_key(topic, target_audience, source_names)
+    
+    def _source_timeout(self, name: str) -> float:
+        return self.source_timeouts.get(name, self.source_timeout)
+    
+    async def _acall_source(self, func: Callable, args: tuple):
+        """
+        Await a research source, whether it is a coroutine or a plain function
+        """
+        if inspect.iscoroutinefunction(func):
+            return await func(*args)
+        return await asyncio.to_thread(func, *args)
+    
+    @timed
+    def _build_results(self, topic: str, target_audience: str, findings: Dict,
+                       source_errors: Dict[str, str]) -> Dict:
+        """
+        Assemble the research record from the per-source findings
+        """
         research_results = {
             "topic": topic,
             "target_audience": target_audience,
             "timestamp": datetime.now().isoformat(),
-            "trends": self._analyze_trends(topic),
-            "statistics": self._gather_statistics(topic),
-            "expert_opinions": self._find_expert_opinions(topic),
-            "competitor_analysis": self._analyze_competitors(topic),
-            "audience_pain_points": self._identify_pain_points(topic, target_audience),
-            "content_angles": self._suggest_content_angles(topic),
-            "keywords": self._research_keywords(topic)
+            "trends": findings["trends"],
+            "statistics": findings["statistics"],
+            "expert_opinions": findings["expert_opinions"],
+            "competitor_analysis": findings["competitor_analysis"],
+            "audience_pain_points": findings["audience_pain_points"],
+            "content_angles": findings["content_angles"],
+            "keywords": findings["keywords"],
+            "source_errors": source_errors
         }
         
         self.research_data = research_results
         return research_results
     
+    @timed
     def _analyze_trends(self, topic: str) -> List[Dict]:
         """
         Analyze current trends related to the topic
@@ -52,6 +216,7 @@ class ContentResearcherAgent:
         ]
         return trends
     
+    @timed
     def _gather_statistics(self, topic: str) -> List[Dict]:
         """
         Collect relevant statistics and data points
@@ -70,6 +235,7 @@ class ContentResearcherAgent:
         ]
         return statistics
     
+    @timed
     def _find_expert_opinions(self, topic: str) -> List[Dict]:
         """
         Identify and collect expert opinions and quotes
@@ -84,6 +250,7 @@ class ContentResearcherAgent:
         ]
         return expert_opinions
     
+    @timed
     def _analyze_competitors(self, topic: str) -> List[Dict]:
         """
         Analyze competitor content and approaches
@@ -99,6 +266,7 @@ class ContentResearcherAgent:
         ]
         return competitor_analysis
     
+    @timed
     def _identify_pain_points(self, topic: str, audience: str) -> List[Dict]:
         """
         Identify audience pain points and challenges
@@ -119,6 +287,7 @@ class ContentResearcherAgent:
         ]
         return pain_points
     
+    @timed
     def _suggest_content_angles(self, topic: str) -> List[Dict]:
         """
         Suggest different angles and approaches for content
@@ -145,6 +314,7 @@ class ContentResearcherAgent:
         ]
         return content_angles
     
+    @timed
     def _research_keywords(self, topic: str) -> List[Dict]:
         """
         Research relevant keywords for SEO
@@ -177,7 +347,7 @@ class ContentResearcherAgent:
         """
         with open(filepath, 'w') as f:
             json.dump(self.research_data, f, indent=2)
-        print(f"Research exported to {filepath}")
+        logger.info("Research exported to %s", filepath)
     
     def get_research_summary(self) -> str:
         """
@@ -1,7 +1,68 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
+import asyncio
 import re
 from datetime import datetime
 
+from pipeline_metrics import timed
+from blog_logging import get_logger
+
+logger = get_logger("writer")
+
+class BlogDocument:
+    """
+    A post under construction, held as a flat list of text fragments
+    Words are counted as fragments are added and the text is produced by a
+    single join (or streamed fragment by fragment), so long posts never pay
+    for repeated string concatenation or a re-split to count words
+    """
+    
+    __slots__ = ("title", "fragments", "word_count", "section_count", "_open_word")
+    
+    def __init__(self, title: str):
+        self.title = title
+        self.fragments = []
+        self.word_count = 0
+        self.section_count = 0
+        # True when the last fragment ended mid-word
+        self._open_word = False
+        self.append(f"# {title}\n\n")
+    
+    def append(self, text: str) -> None:
+        """
+        Add a fragment, keeping the word count equal to len(render().split())
+        """
+        if not text:
+            return
+        self.fragments.append(text)
+        self.word_count += len(text.split())
+        if self._open_word and not text[0].isspace():
+            # The fragment continues the previous word
+            self.word_count -= 1
+        self._open_word = not text[-1].isspace()
+    
+    def add_introduction(self, text: str) -> None:
+        self.append(text)
+        self.append("\n\n")
+    
+    def add_section(self, heading: str, content: str) -> None:
+        self.append(f"## {heading}\n\n")
+        self.append(content)
+        self.append("\n\n")
+        self.section_count += 1
+    
+    def add_conclusion(self, text: str) -> None:
+        self.append(text)
+    
+    def render(self) -> str:
+        return "".join(self.fragments)
+    
+    def write_to(self, stream: TextIO) -> None:
+        """
+        Stream the post without building the full text
+        """
+        for fragment in self.fragments:
+            stream.write(fragment)
+
 class ContentWriterAgent:
     """
     Content Writer Agent for Blog Writing Team
@@ -22,7 +83,7 @@ class ContentWriterAgent:
         """
         Main function to create a complete blog post from research data
         """
-        print(f"Writing blog post: {research_data['topic']}")
+        logger.info("Writing blog post: %s", research_data['topic'])
         
         content = {
             "title": self._create_headline(research_data),
@@ -36,13 +97,22 @@ class ContentWriterAgent:
             "timestamp": datetime.now().isoformat()
         }
         
-        full_text = self._assemble_full_post(content)
-        content["full_text"] = full_text
-        content["word_count"] = len(full_text.split())
+        document = self._build_document(content)
+        content["full_text"] = document.render()
+        content["word_count"] = document.word_count
         
         self.content_data = content
         return content
     
+    async def awrite_blog_post(self, research_data: Dict, tone: str = "conversational",
+                               word_count_target: int = 1500) -> Dict:
+        """
+        Awaitable version of write_blog_post
+        Writing is CPU-bound, so it runs in a worker thread off the event loop
+        """
+        return await asyncio.to_thread(self.write_blog_post, research_data, tone, word_count_target)
+    
+    @timed
     def _create_headline(self, research_data: Dict) -> str:
         """
         Generate compelling headlines based on research
@@ -61,15 +131,17 @@ class ContentWriterAgent:
         
         return f"Master {topic}: A Comprehensive Guide for Success"
     
+    @timed
     def _create_meta_description(self, research_data: Dict) -> str:
         """
         Create SEO-optimized meta description
         """
         topic = research_data["topic"]
-        primary_keyword = research_data.get("keywords", [{}])[0].get("keyword", topic.lower())
+        primary_keyword = (research_data.get("keywords") or [{}])[0].get("keyword", topic.lower())
         
         return f"Discover everything about {primary_keyword} in this comprehensive guide. Learn best practices, avoid common mistakes, and stay ahead of trends. Read more!"
     
+    @timed
     def _write_introduction(self, research_data: Dict, tone: str) -> str:
         """
         Craft engaging introduction that hooks readers
@@ -111,6 +183,7 @@ Ready to become a {topic.lower()} pro? Let's get started."""
         
         return intro
     
+    @timed
     def _structure_main_content(self, research_data: Dict, tone: str, 
                               target_words: int) -> List[Dict]:
         """
@@ -164,6 +237,7 @@ Ready to become a {topic.lower()} pro? Let's get started."""
         
         return sections
     
+    @timed
     def _write_fundamentals_section(self, research_data: Dict, tone: str) -> str:
         """
         Write the fundamentals section
@@ -194,32 +268,35 @@ The fundamental principles include:
 
 Understanding these core concepts is essential for successful {topic.lower()} implementation."""
     
+    @timed
     def _write_trends_section(self, trends: List[Dict], tone: str) -> str:
         """
         Write the trends section
         """
-        content = "The landscape is constantly evolving. Here are the key trends you should know about:\n\n"
+        parts = ["The landscape is constantly evolving. Here are the key trends you should know about:\n\n"]
         
         for i, trend in enumerate(trends[:3], 1):
-            content += f"**{i}. {trend['trend']}**\n"
-            content += f"This trend is gaining traction because it addresses real market needs and offers tangible benefits. "
-            content += f"Organizations that adapt early are seeing significant advantages.\n\n"
+            parts.append(f"**{i}. {trend['trend']}**\n")
+            parts.append("This trend is gaining traction because it addresses real market needs and offers tangible benefits. ")
+            parts.append("Organizations that adapt early are seeing significant advantages.\n\n")
         
-        return content
+        return "".join(parts)
     
+    @timed
     def _write_challenges_section(self, pain_points: List[Dict], tone: str) -> str:
         """
         Write the challenges and solutions section
         """
-        content = "Let's be honest – there are real challenges you'll face. Here's how to tackle them:\n\n"
+        parts = ["Let's be honest – there are real challenges you'll face. Here's how to tackle them:\n\n"]
         
         for i, pain in enumerate(pain_points[:3], 1):
-            content += f"**Challenge {i}: {pain['pain_point']}**\n"
-            content += f"*Solution*: Start with small, manageable steps. Focus on building competency gradually rather than trying to solve everything at once. "
-            content += f"Consider getting expert guidance or training for your team.\n\n"
+            parts.append(f"**Challenge {i}: {pain['pain_point']}**\n")
+            parts.append("*Solution*: Start with small, manageable steps. Focus on building competency gradually rather than trying to solve everything at once. ")
+            parts.append("Consider getting expert guidance or training for your team.\n\n")
         
-        return content
+        return "".join(parts)
     
+    @timed
     def _write_best_practices_section(self, research_data: Dict, tone: str) -> str:
         """
         Write best practices section
@@ -243,19 +320,21 @@ Set up proper tracking from day one. You can't improve what you don't measure.
 **5. Build a Strong Team**
 Success in {topic.lower()} is rarely a solo effort. Invest in building capabilities across your team."""
     
+    @timed
     def _write_expert_section(self, expert_opinions: List[Dict], tone: str) -> str:
         """
         Write expert insights section
         """
-        content = "Industry leaders share their insights:\n\n"
+        parts = ["Industry leaders share their insights:\n\n"]
         
         for expert in expert_opinions[:2]:
-            content += f'**{expert["expert"]}, {expert["title"]}**\n'
-            content += f'"{expert["quote"]}"\n\n'
-            content += "This perspective highlights the importance of staying ahead of industry developments and maintaining a strategic mindset.\n\n"
+            parts.append(f'**{expert["expert"]}, {expert["title"]}**\n')
+            parts.append(f'"{expert["quote"]}"\n\n')
+            parts.append("This perspective highlights the importance of staying ahead of industry developments and maintaining a strategic mindset.\n\n")
         
-        return content
+        return "".join(parts)
     
+    @timed
     def _write_conclusion(self, research_data: Dict, tone: str) -> str:
         """
         Write compelling conclusion with call-to-action
@@ -292,20 +371,26 @@ Organizations that prioritize {topic.lower()} and invest in proper implementatio
 
 The path to {topic.lower()} excellence is well-defined. Success depends on commitment to the process and willingness to adapt based on results."""
     
-    def _assemble_full_post(self, content: Dict) -> str:
+    @timed
+    def _build_document(self, content: Dict) -> BlogDocument:
         """
-        Assemble the complete blog post
+        Lay out the post (title, introduction, sections, conclusion) as fragments
         """
-        full_post = f"# {content['title']}\n\n"
-        full_post += content['introduction'] + "\n\n"
+        document = BlogDocument(content['title'])
+        document.add_introduction(content['introduction'])
         
         for section in content['main_content']:
-            full_post += f"## {section['heading']}\n\n"
-            full_post += section['content'] + "\n\n"
+            document.add_section(section['heading'], section['content'])
         
-        full_post += content['conclusion']
+        document.add_conclusion(content['conclusion'])
         
-        return full_post
+        return document
+    
+    def _assemble_full_post(self, content: Dict) -> str:
+        """
+        Assemble the complete blog post
+        """
+        return self._build_document(content).render()
     
     def get_content_summary(self) -> str:
         """
@@ -329,4 +414,4 @@ Readability: {self.content_data['readability_score']}
         """
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(self.content_data['full_text'])
-        print(f"Content exported to {filepath}")
\ No newline at end of file
+        logger.info("Content exported to %s", filepath)
\ No newline at end of file
@@ -4,6 +4,7 @@ Demo script for the multiagent blog writing system
 """
 
 from blog_team_coordinator import BlogTeamCoordinator
+from blog_logging import configure_console_logging
 
 def run_demos():
     print("MULTIAGENT BLOG WRITING SYSTEM - DEMO")
@@ -57,4 +58,5 @@ def run_demos():
     print("Check the 'blog_output' directory for all generated content.")
 
 if __name__ == "__main__":
+    configure_console_logging()
     run_demos()
\ No newline at end of file
@@ -9,6 +9,7 @@ with various configurations and scenarios.
 import os
 import sys
 from blog_team_coordinator import BlogTeamCoordinator
+from blog_logging import configure_console_logging
 
 def demo_basic_workflow():
     """
@@ -30,7 +31,7 @@ def demo_basic_workflow():
     print(f"\nBlog post created successfully!")
     print(f"SEO Score: {result['seo_score']}%")
     print(f"Word Count: {result['word_count']}")
-    print(f"Output: blog_output/{result['workflow_id']}/")
+    print(f"Output: {coordinator.workflow_dir(result['workflow_id'])}/")
     
     return result
 
@@ -149,25 +150,30 @@ def performance_comparison():
         ("Cloud Computing Architecture", "software architects", "technical")
     ]
     
+    jobs = [
+        {"topic": topic, "target_audience": audience, "tone": tone, "word_count": 1500}
+        for topic, audience, tone in topics
+    ]
+    
     results = []
     
-    for topic, audience, tone in topics:
-        print(f"\n📝 Creating: {topic}")
-        result = coordinator.create_blog_post(
-            topic=topic,
-            target_audience=audience,
-            tone=tone,
-            word_count=1500
-        )
+    # Generate all posts in parallel; results arrive as each one finishes
+    for outcome in coordinator.create_blog_posts_batch(jobs):
+        topic = outcome["job"]["topic"]
+        if outcome["status"] != "completed":
+            print(f"\n❌ {topic} failed: {outcome['error']}")
+            continue
         
+        result = outcome["result"]
         results.append({
             "topic": topic,
             "seo_score": result["seo_score"],
             "word_count": result["word_count"],
             "readability": result["readability_score"],
-            "tone": tone
+            "tone": outcome["job"]["tone"]
         })
         
+        print(f"\n📝 Created: {topic}")
         print(f"  ✅ SEO: {result['seo_score']}% | Words: {result['word_count']} | Readability: {result['readability_score']}")
     
     # Show comparison
@@ -196,7 +202,7 @@ def export_sample_files():
         custom_keywords=["remote work", "productivity", "work from home", "remote productivity"]
     )
     
-    workflow_dir = f"blog_output/{result['workflow_id']}"
+    workflow_dir = coordinator.workflow_dir(result['workflow_id'])
     
     print(f"\n📁 Sample files created in: {workflow_dir}/")
     print("📄 Files included:")
@@ -224,6 +230,8 @@ def main():
     """
     Run all demonstrations
     """
+    configure_console_logging()
+    
     print("🚀 MULTIAGENT BLOG WRITING SYSTEM - DEMO SUITE")
     print("="*70)
     print("This demo showcases the complete blog writing workflow using AI agents.")
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Local job queue for blog generation
+
+Front ends enqueue create_blog_post jobs into ``<output_dir>/jobs.sqlite3``
+and poll them; worker processes claim jobs one at a time and record each
+workflow's phase-level progress (from the coordinator's progress callback)
+on the job row. Submitting never blocks on generation, and any number of
+clients can enqueue and poll concurrently.
+
+Run workers next to the app, or let the app start them in-process with
+ensure_worker_pool:
+
+    python job_queue.py work blog_output --workers 4
+    python job_queue.py submit "Machine Learning for Beginners"
+    python job_queue.py list
+
+A job whose worker died is queued again when a pool starts; if its
+workflow had begun, the next worker resumes it from its last saved phase.
+Each claim counts as an attempt, and a job whose worker died during
+max_attempts of them is marked failed instead, so a job that crashes its
+worker can't take down workers forever.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+import argparse
+import atexit
+import json
+import multiprocessing
+import os
+import sqlite3
+import sys
+import threading
+import traceback
+
+from blog_logging import configure_console_logging, get_logger
+
+logger = get_logger("jobs")
+
+JOBS_FILENAME = "jobs.sqlite3"
+
+JOB_STATUSES = ("queued", "running", "completed", "failed")
+
+# create_blog_post arguments a job may carry
+JOB_PARAMS = ("topic", "target_audience", "tone", "word_count", "custom_keywords")
+
+# Claims after which a job whose worker died is failed rather than requeued
+MAX_ATTEMPTS = 3
+
+def validate_job_params(params: Dict) -> None:
+    """
+    Raise ValueError unless params are usable create_blog_post arguments
+    Optional parameters may be left out or None.
+    """
+    if not isinstance(params, dict):
+        raise ValueError("job parameters must be a mapping")
+    unknown = set(params) - set(JOB_PARAMS)
+    if unknown:
+        raise ValueError(f"unknown job parameters: {', '.join(sorted(unknown))}")
+    topic = params.get("topic")
+    if not isinstance(topic, str) or not topic.strip():
+        raise ValueError("a job needs a topic")
+    for name in ("target_audience", "tone"):
+        if params.get(name) is not None and not isinstance(params[name], str):
+            raise ValueError(f"{name} must be a string")
+    word_count = params.get("word_count")
+    # bool is an int subclass, but True is not a word count
+    if word_count is not None and (isinstance(word_count, bool) or not isinstance(word_count, int)
+                                   or word_count <= 0):
+        raise ValueError("word_count must be a positive integer")
+    keywords = params.get("custom_keywords")
+    if keywords is not None and (not isinstance(keywords, list)
+                                 or not all(isinstance(keyword, str) for keyword in keywords)):
+        raise ValueError("custom_keywords must be a list of strings")
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill would terminate the process on Windows; assume it is alive
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+class JobQueue:
+    """
+    SQLite-backed queue of blog generation jobs
+    Like the workflow catalog, a connection is opened per operation, so a
+    queue can be shared across threads and processes.
+    """
+
+    def __init__(self, db_path: str, max_attempts: int = MAX_ATTEMPTS):
+        self.db_path = db_path
+        self.max_attempts = max(1, max_attempts)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    workflow_id TEXT,
+                    step TEXT,
+                    completed_steps INTEGER NOT NULL DEFAULT 0,
+                    total_steps INTEGER,
+                    error TEXT,
+                    worker_pid INTEGER,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    enqueued_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, job_id);
+            """)
+            # Queues created before attempts were counted
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "attempts" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+
+    @contextmanager
+    def _connect(self):
+        """
+        Open a connection for one transaction; commits on success
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _job(self, row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        return job
+
+    def enqueue(self, params: Dict) -> int:
+        """
+        Queue one create_blog_post job; returns its job ID
+        """
+        validate_job_params(params)
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (params, status, enqueued_at) VALUES (?, 'queued', ?)",
+                (json.dumps(params), _now()))
+            return cursor.lastrowid
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job(row) if row else None
+
+    def get_many(self, job_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Jobs by ID in one query, e.g. everything a client is polling
+        """
+        if not job_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in job_ids)
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT * FROM jobs WHERE job_id IN ({placeholders})",
+                                list(job_ids)).fetchall()
+        return {row["job_id"]: self._job(row) for row in rows}
+
+    def jobs(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """
+        Most recent jobs first, optionally only those in one status
+        """
+        where = " WHERE status = ?" if status else ""
+        params = [status] if status else []
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT * FROM jobs{where} ORDER BY job_id DESC LIMIT ?",
+                                params + [limit]).fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        with self._connect() as conn:
+            for row in conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+                counts[row[0]] = row[1]
+        return counts
+
+    def queued_count(self) -> int:
+        """
+        Number of jobs waiting to be claimed (answered from the status index)
+        """
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+
+    def position(self, job_id: int) -> int:
+        """
+        Number of queued jobs ahead of a queued job
+        """
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND job_id < ?",
+                                (job_id,)).fetchone()[0]
+
+    def claim(self, worker_pid: int) -> Optional[Dict]:
+        """
+        Mark the oldest queued job as running for a worker and return it
+        Every claim counts as one attempt at the job
+        """
+        # BEGIN IMMEDIATE takes the write lock before the SELECT, so two
+        # workers can never claim the same job
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' ORDER BY job_id LIMIT 1").fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET status = 'running', worker_pid = ?, started_at = ?, "
+                        "attempts = attempts + 1 WHERE job_id = ?", (worker_pid, _now(), row["job_id"]))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        job = self._job(row)
+        job["status"] = "running"
+        job["worker_pid"] = worker_pid
+        job["attempts"] += 1
+        return job
+
+    def report_progress(self, job_id: int, workflow_id: str, step: str,
+                        completed_steps: int, total_steps: int) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET workflow_id = ?, step = ?, completed_steps = ?, total_steps = ? "
+                "WHERE job_id = ?", (workflow_id, step, completed_steps, total_steps, job_id))
+
+    def complete(self, job_id: int, workflow_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'completed', workflow_id = ?, step = 'completed', "
+                "completed_steps = total_steps, finished_at = ? WHERE job_id = ?",
+                (workflow_id, _now(), job_id))
+
+    def fail(self, job_id: int, error: str) -> None:
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE job_id = ?",
+                         (error, _now(), job_id))
+
+    def requeue_orphans(self) -> int:
+        """
+        Queue running jobs whose worker process is gone again
+        Jobs that already used max_attempts claims are marked failed instead.
+        Returns the number requeued; only meaningful on the host that ran the workers
+        """
+        with self._connect() as conn:
+            orphans = [row for row in
+                       conn.execute("SELECT job_id, worker_pid, attempts FROM jobs WHERE status = 'running'")
+                       if row["worker_pid"] is None or not _pid_alive(row["worker_pid"])]
+            requeue = [(row["job_id"],) for row in orphans if row["attempts"] < self.max_attempts]
+            give_up = [(f"worker died during each of {row['attempts']} attempts", _now(), row["job_id"])
+                       for row in orphans if row["attempts"] >= self.max_attempts]
+            conn.executemany(
+                "UPDATE jobs SET status = 'queued', worker_pid = NULL WHERE job_id = ? AND status = 'running'",
+                requeue)
+            conn.executemany(
+                "UPDATE jobs SET status = 'failed', worker_pid = NULL, error = ?, finished_at = ? "
+                "WHERE job_id = ? AND status = 'running'", give_up)
+        for _, _, job_id in give_up:
+            logger.warning("Job %s failed: its worker died during %d attempts", job_id, self.max_attempts)
+        return len(requeue)
+
+def run_job(coordinator, queue: JobQueue, job: Dict) -> None:
+    """
+    Run one claimed job, recording progress and outcome on the queue
+    """
+    job_id = job["job_id"]
+
+    def progress(workflow_id: str, step: str, completed_steps: int, total_steps: int) -> None:
+        queue.report_progress(job_id, workflow_id, step, completed_steps, total_steps)
+
+    workflow_id = job["workflow_id"]
+    try:
+        if workflow_id and (coordinator.journal.workflow_state(workflow_id) is not None
+                            or coordinator.workflow_summary_signature(workflow_id) is not None):
+            # Claimed again after its worker died: continue (or return) the started workflow
+            result = coordinator.resume_workflow(job["workflow_id"], progress=progress)
+        else:
+            result = coordinator.create_blog_post(**job["params"], progress=progress)
+    except Exception as e:
+        logger.warning("Job %s failed: %s", job_id, e)
+        logger.debug("%s", traceback.format_exc())
+        queue.fail(job_id, f"{type(e).__name__}: {e}")
+        return
+    queue.complete(job_id, result["workflow_id"])
+
+def _worker_main(output_dir: str, options: Dict, stop, poll_interval: float) -> None:
+    """
+    Worker process: claim and run jobs until stop is set
+    """
+    # Imported here so the queue itself stays importable without the agents
+    from blog_team_coordinator import BlogTeamCoordinator
+
+    coordinator = BlogTeamCoordinator(output_dir=output_dir, **options)
+    queue = JobQueue(os.path.join(output_dir, JOBS_FILENAME))
+    pid = os.getpid()
+    while not stop.is_set():
+        job = queue.claim(pid)
+        if job is None:
+            stop.wait(poll_interval)
+            continue
+        run_job(coordinator, queue, job)
+
+class JobWorkerPool:
+    """
+    Worker processes serving the job queue of one output directory
+    Workers are spawned (not forked), so a pool can be started from a
+    multi-threaded server such as Streamlit.
+    """
+
+    def __init__(self, output_dir: str = "blog_output", workers: int = 2,
+                 poll_interval: float = 0.5, coordinator_options: Optional[Dict] = None):
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.coordinator_options = dict(coordinator_options or {})
+        self.queue = JobQueue(os.path.join(output_dir, JOBS_FILENAME))
+        self._context = multiprocessing.get_context("spawn")
+        # Created on start, so a pool that never starts holds no semaphores
+        self._stop = None
+        self._processes = []
+        self._lock = threading.Lock()
+
+    def start(self) -> "JobWorkerPool":
+        """
+        Start workers, replacing any that have exited
+        """
+        with self._lock:
+            if self._stop is None:
+                self._stop = self._context.Event()
+            self._processes = [process for process in self._processes if process.is_alive()]
+            if len(self._processes) < self.workers:
+                requeued = self.queue.requeue_orphans()
+                if requeued:
+                    logger.info("Requeued %d jobs of stopped workers", requeued)
+            while len(self._processes) < self.workers:
+                process = self._context.Process(
+                    target=_worker_main,
+                    args=(self.output_dir, self.coordinator_options, self._stop, self.poll_interval),
+                    daemon=True)
+                process.start()
+                self._processes.append(process)
+        return self
+
+    def alive(self) -> int:
+        return sum(1 for process in self._processes if process.is_alive())
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Let workers finish their current job and exit
+        """
+        if self._stop is None:
+            return
+        self._stop.set()
+        for process in self._processes:
+            process.join(timeout)
+        self._processes = []
+        self._stop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+# Pools started by ensure_worker_pool, by output directory
+_pools = {}
+_pools_lock = threading.Lock()
+
+def ensure_worker_pool(output_dir: str = "blog_output", workers: int = 2,
+                       coordinator_options: Optional[Dict] = None) -> JobWorkerPool:
+    """
+    This process's worker pool for output_dir, started on first use
+    Cheap to call on every request: later calls only restart dead workers.
+    """
+    key = os.path.abspath(output_dir)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = JobWorkerPool(output_dir, workers,
+                                               coordinator_options=coordinator_options)
+    return pool.start()
+
+@atexit.register
+def _stop_pools() -> None:
+    for pool in list(_pools.values()):
+        pool.stop(timeout=5)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Blog generation job queue")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    work_parser = commands.add_parser("work", help="Run workers until interrupted")
+    work_parser.add_argument("output_dir", nargs="?", default="blog_output")
+    work_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+    submit_parser = commands.add_parser("submit", help="Queue a blog post")
+    submit_parser.add_argument("topic")
+    submit_parser.add_argument("--output-dir", default="blog_output")
+    submit_parser.add_argument("--target-audience", default="general")
+    submit_parser.add_argument("--tone", default="conversational")
+    submit_parser.add_argument("--word-count", type=int, default=1500)
+
+    list_parser = commands.add_parser("list", help="Show recent jobs")
+    list_parser.add_argument("output_dir", nargs="?", default="blog_output")
+    list_parser.add_argument("--status", choices=JOB_STATUSES)
+    list_parser.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args(argv)
+    configure_console_logging()
+
+    if args.command == "work":
+        pool = JobWorkerPool(args.output_dir, args.workers).start()
+        print(f"{pool.workers} workers serving {pool.queue.db_path} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            print("Stopping after the current jobs...")
+            pool.stop()
+        return 0
+
+    if args.command == "submit":
+        os.makedirs(args.output_dir, exist_ok=True)
+        queue = JobQueue(os.path.join(args.output_dir, JOBS_FILENAME))
+        job_id = queue.enqueue({
+            "topic": args.topic,
+            "target_audience": args.target_audience,
+            "tone": args.tone,
+            "word_count": args.word_count
+        })
+        print(f"Queued job {job_id}")
+        return 0
+
+    db_path = os.path.join(args.output_dir, JOBS_FILENAME)
+    if not os.path.exists(db_path):
+        print(f"No job queue in {args.output_dir}")
+        return 1
+    queue = JobQueue(db_path)
+    for job in queue.jobs(args.status, args.limit):
+        step = f"{job['step'] or '-'} {job['completed_steps']}/{job['total_steps'] or '?'}"
+        print(f"#{job['job_id']:<6} {job['status']:<10} {step:<16} {job['params']['topic']}"
+              f"{' -> ' + job['workflow_id'] if job['workflow_id'] else ''}"
+              f"{': ' + job['error'] if job['error'] else ''}")
+    counts = queue.counts()
+    print(", ".join(f"{counts[status]} {status}" for status in JOB_STATUSES))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
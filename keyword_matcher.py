@@ -0,0 +1,157 @@
+from collections import deque
+from typing import Dict, Iterable, List
+
+def _is_word_char(ch: str) -> bool:
+    # Same definition as \w in Python's re module for str patterns
+    return ch.isalnum() or ch == '_'
+
+def keyword_variants(keyword: str) -> List[str]:
+    """
+    Common surface variants of a keyword: plural forms and
+    hyphen/space spellings ("data-driven" <-> "data driven")
+    """
+    keyword = keyword.lower()
+    variants = []
+    for form in (keyword, keyword.replace('-', ' '), keyword.replace(' ', '-')):
+        for candidate in (form, form + 's', form + 'es'):
+            if candidate != keyword and candidate not in variants:
+                variants.append(candidate)
+    return variants
+
+class KeywordHits:
+    """
+    Matches of one keyword: exact whole-word hits and variant hits,
+    as (start, end) offsets into the searched text
+    """
+
+    __slots__ = ("keyword", "positions", "variant_positions")
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.positions = []
+        self.variant_positions = []
+
+    @property
+    def count(self) -> int:
+        return len(self.positions)
+
+    @property
+    def variant_count(self) -> int:
+        return len(self.variant_positions)
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton that finds every keyword (and its variants) in
+    one pass over the text
+
+    Matching is case-insensitive (callers pass lowercased text) and
+    whole-word, with the same boundary and non-overlap semantics as
+    ``re.findall(rf'\\b{re.escape(keyword)}\\b', text)`` for each pattern.
+    """
+
+    def __init__(self, keywords: Iterable[str], include_variants: bool = True):
+        self.keywords = []
+        # pattern -> list of (keyword, is_variant); one pattern may serve several keywords
+        self._pattern_owners = {}
+        for keyword in keywords:
+            if keyword in self.keywords:
+                continue
+            self.keywords.append(keyword)
+            self._add_pattern(keyword.lower(), keyword, False)
+            if include_variants and keyword:
+                for variant in keyword_variants(keyword):
+                    self._add_pattern(variant, keyword, True)
+
+        self._patterns = [p for p in self._pattern_owners if p]
+        self._build()
+
+    def _add_pattern(self, pattern: str, keyword: str, is_variant: bool) -> None:
+        owners = self._pattern_owners.setdefault(pattern, [])
+        if (keyword, False) in owners or (keyword, is_variant) in owners:
+            return
+        owners.append((keyword, is_variant))
+
+    def _build(self) -> None:
+        goto = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(ch, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def _boundary_ok(self, text: str, start: int, end: int, pattern: str) -> bool:
+        """
+        Emulate \\b before and after the pattern
+        """
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        if before == _is_word_char(pattern[0]):
+            return False
+        if after == _is_word_char(pattern[-1]):
+            return False
+        return True
+
+    def search(self, text: str) -> Dict[str, KeywordHits]:
+        """
+        Scan lowercased text once and return hits for every keyword
+        """
+        hits = {keyword: KeywordHits(keyword) for keyword in self.keywords}
+        if not self._patterns:
+            return hits
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        patterns = self._patterns
+        last_end = [0] * len(patterns)
+        state = 0
+
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not outputs[state]:
+                continue
+
+            end = index + 1
+            for pattern_id in outputs[state]:
+                pattern = patterns[pattern_id]
+                start = end - len(pattern)
+                # Non-overlapping, leftmost-first like re.findall
+                if start < last_end[pattern_id] or not self._boundary_ok(text, start, end, pattern):
+                    continue
+                last_end[pattern_id] = end
+                for keyword, is_variant in self._pattern_owners[pattern]:
+                    target = hits[keyword].variant_positions if is_variant else hits[keyword].positions
+                    target.append((start, end))
+
+        for keyword_hits in hits.values():
+            keyword_hits.variant_positions.sort()
+        return hits
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Exact whole-word counts per keyword
+        """
+        return {keyword: keyword_hits.count for keyword, keyword_hits in self.search(text).items()}
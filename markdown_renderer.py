@@ -0,0 +1,299 @@
+"""
+Streaming Markdown to HTML renderer shared by every exporter
+
+Posts are rendered block by block straight from the writer's sections
+(title, introduction, main_content, conclusion), and HTML is produced as a
+stream of small chunks that exporters write directly to a file or socket.
+The whole document is never rebuilt as one HTML string.
+"""
+
+from datetime import datetime
+from html import escape
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+import re
+
+HEADING = re.compile(r'^(#{1,3}) (.+)$')
+BULLET_ITEM = re.compile(r'^(?:[•\-*]) (.+)$')
+NUMBERED_ITEM = re.compile(r'^\d+\. (.+)$')
+BOLD = re.compile(r'\*\*(.+?)\*\*')
+ITALIC = re.compile(r'(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])')
+
+def render_inline(text: str) -> str:
+    """
+    Escape one line of text and apply bold/italic markup
+    """
+    html = escape(text.strip(), quote=False)
+    html = BOLD.sub(r'<strong>\1</strong>', html)
+    return ITALIC.sub(r'<em>\1</em>', html)
+
+def iter_text_lines(text: str) -> Iterator[str]:
+    """
+    Lines of a string without splitting the whole document up front
+    """
+    start = 0
+    length = len(text)
+    while start <= length:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+class _BlockRenderer:
+    """
+    Line-driven block state machine: headings, paragraphs and lists
+    """
+
+    def __init__(self):
+        self.paragraph_open = False
+        self.list_tag = None
+
+    def close(self) -> Iterator[str]:
+        if self.paragraph_open:
+            self.paragraph_open = False
+            yield '</p>\n'
+        if self.list_tag:
+            yield f'</{self.list_tag}>\n'
+            self.list_tag = None
+
+    def feed(self, line: str) -> Iterator[str]:
+        stripped = line.strip()
+        if not stripped:
+            yield from self.close()
+            return
+
+        heading = HEADING.match(stripped)
+        if heading:
+            yield from self.close()
+            level = len(heading.group(1))
+            yield f'<h{level}>{render_inline(heading.group(2))}</h{level}>\n'
+            return
+
+        bullet = BULLET_ITEM.match(stripped)
+        numbered = None if bullet else NUMBERED_ITEM.match(stripped)
+        if bullet or numbered:
+            tag = 'ul' if bullet else 'ol'
+            if self.list_tag != tag:
+                yield from self.close()
+                yield f'<{tag}>\n'
+                self.list_tag = tag
+            yield f'<li>{render_inline((bullet or numbered).group(1))}</li>\n'
+            return
+
+        if self.list_tag:
+            yield from self.close()
+        if self.paragraph_open:
+            yield '<br>\n'
+        else:
+            yield '<p>'
+            self.paragraph_open = True
+        yield render_inline(stripped)
+
+def render_markdown(lines: Iterable[str]) -> Iterator[str]:
+    """
+    HTML chunks for Markdown arriving line by line (e.g. an open file)
+    """
+    renderer = _BlockRenderer()
+    for line in lines:
+        yield from renderer.feed(line.rstrip('\n'))
+    yield from renderer.close()
+
+def render_sections(content_data: Dict) -> Iterator[str]:
+    """
+    HTML chunks for a post built from the writer's sections
+    Headings come from the section structure; only section bodies are parsed
+    """
+    yield f'<h1>{render_inline(content_data["title"])}</h1>\n'
+    yield from render_markdown(iter_text_lines(content_data["introduction"]))
+    for section in content_data["main_content"]:
+        yield f'<h2>{render_inline(section["heading"])}</h2>\n'
+        yield from render_markdown(iter_text_lines(section["content"]))
+    yield from render_markdown(iter_text_lines(content_data["conclusion"]))
+
+def render_post_body(result: Dict, content_data: Optional[Dict] = None) -> Iterator[str]:
+    """
+    HTML chunks for a finished post: from sections when they match the final
+    content, otherwise from the final Markdown text
+    """
+    if content_data and content_data.get("full_text") == result["final_content"]:
+        return render_sections(content_data)
+    return render_markdown(iter_text_lines(result["final_content"]))
+
+def write_chunks(chunks: Iterable[str], stream: TextIO) -> int:
+    """
+    Write chunks to a text stream as they are produced; returns characters written
+    """
+    written = 0
+    for chunk in chunks:
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+def write_html_file(path: str, chunks: Iterable[str]) -> int:
+    """
+    Stream HTML chunks into a file
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        return write_chunks(chunks, f)
+
+def _created_label(result: Dict) -> str:
+    try:
+        created = datetime.fromisoformat(result["creation_date"])
+    except (KeyError, TypeError, ValueError):
+        created = datetime.now()
+    return created.strftime('%B %d, %Y')
+
+def render_seo_html(result: Dict, body_chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Minimal SEO-ready HTML document around the post body
+    """
+    title = escape(result['final_title'])
+    description = escape(result['final_meta_description'])
+    yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <meta name="description" content="{description}">
+    <meta name="robots" content="index, follow">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:type" content="article">
+</head>
+<body>
+    <article>
+"""
+    yield from body_chunks
+    yield """    </article>
+</body>
+</html>"""
+
+BLOG_PAGE_STYLE = """
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 2rem;
+            background-color: #f8f9fa;
+        }
+
+        .article-container {
+            background: white;
+            padding: 3rem;
+            border-radius: 8px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        }
+
+        h1 {
+            color: #2c3e50;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 0.5rem;
+            margin-bottom: 2rem;
+        }
+
+        h2 {
+            color: #34495e;
+            margin-top: 2rem;
+            margin-bottom: 1rem;
+            border-left: 4px solid #3498db;
+            padding-left: 1rem;
+        }
+
+        h3 {
+            color: #2c3e50;
+            margin-top: 1.5rem;
+        }
+
+        p {
+            margin-bottom: 1.5rem;
+            text-align: justify;
+        }
+
+        strong {
+            color: #2c3e50;
+            font-weight: 600;
+        }
+
+        .meta-info {
+            background: #ecf0f1;
+            padding: 1rem;
+            border-radius: 4px;
+            margin-bottom: 2rem;
+            font-size: 0.9rem;
+            color: #7f8c8d;
+        }
+
+        .meta-info span {
+            margin-right: 2rem;
+        }
+
+        .generated-by {
+            text-align: center;
+            margin-top: 3rem;
+            padding-top: 2rem;
+            border-top: 1px solid #ecf0f1;
+            color: #95a5a6;
+            font-size: 0.8rem;
+        }
+
+        @media (max-width: 768px) {
+            body {
+                padding: 1rem;
+            }
+
+            .article-container {
+                padding: 1.5rem;
+            }
+        }
+"""
+
+def render_blog_page(result: Dict, body_chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Standalone, styled blog page around the post body
+    """
+    title = escape(result['final_title'])
+    description = escape(result['final_meta_description'])
+    yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <meta name="description" content="{description}">
+    <meta name="robots" content="index, follow">
+
+    <!-- Open Graph / Facebook -->
+    <meta property="og:type" content="article">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+
+    <!-- Twitter -->
+    <meta property="twitter:card" content="summary_large_image">
+    <meta property="twitter:title" content="{title}">
+    <meta property="twitter:description" content="{description}">
+
+    <style>{BLOG_PAGE_STYLE}    </style>
+</head>
+<body>
+    <div class="article-container">
+        <div class="meta-info">
+            <span><strong>Word Count:</strong> {result['word_count']} words</span>
+            <span><strong>SEO Score:</strong> {result['seo_score']}%</span>
+            <span><strong>Target Audience:</strong> {escape(str(result['target_audience']))}</span>
+            <span><strong>Created:</strong> {_created_label(result)}</span>
+        </div>
+
+"""
+    yield from body_chunks
+    yield """
+        <div class="generated-by">
+            <p>Generated by AI Blog Writing Team<br>
+            Powered by Multi-Agent Content Creation System</p>
+        </div>
+    </div>
+</body>
+</html>"""
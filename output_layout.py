@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Where workflow directories live inside the output directory
+
+Layouts:
+
+- ``flat``: ``<output_dir>/<workflow_id>`` (the original layout)
+- ``id_prefix``: ``<output_dir>/<id[0:4]>/<id[4:7]>/<workflow_id>``; a top
+  shard covers about 3 days and holds at most 32768 leaves, and a leaf
+  covers about 8 seconds of sortable IDs, so it stays under 100k entries
+  up to roughly 12,000 posts per second
+- ``date``: ``<output_dir>/<yyyy>/<mm>/<dd>/<workflow_id>`` (UTC)
+- ``hash``: ``<output_dir>/<h[0:2]>/<h[2:4]>/<workflow_id>``, h being the
+  SHA-256 of the ID, for an even spread regardless of creation rate
+
+The layout for new workflows is recorded in ``<output_dir>/layout.json``
+when the output directory is created or migrated; opening an existing
+directory never changes it. Lookups try that layout first and then the
+others (including the briefly used ``<id[4:6]>`` id_prefix leaves), so a
+workflow is found with a few stat calls whatever layout it was written in.
+Move an existing tree to another layout with:
+
+    python output_layout.py migrate blog_output --to date
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+from blog_logging import configure_console_logging, get_logger
+from workflow_ids import WORKFLOW_ID_PATTERN, workflow_id_created
+
+logger = get_logger("layout")
+
+LAYOUT_FILENAME = "layout.json"
+DEFAULT_LAYOUT = "id_prefix"
+
+# Files that mark a directory as a workflow directory
+WORKFLOW_MARKERS = ("research_data.json", "research_data.pack",
+                    "workflow_summary.json", "workflow_summary.pack")
+
+# Shared directories at the top of the output directory, never workflows
+RESERVED_NAMES = ("blobs",)
+
+# Deepest nesting of any layout, below output_dir
+MAX_DEPTH = 4
+
+# Timestamp suffix of IDs from before sortable IDs: <slug>_YYYYmmdd_HHMMSS
+LEGACY_TIMESTAMP = re.compile(r'_(\d{8})_(\d{6})$')
+
+class OutputLayout:
+    """
+    Maps a workflow ID to its directory under the output directory
+    """
+
+    name = None
+
+    def buckets(self, workflow_id: str) -> Optional[Tuple[str, ...]]:
+        """
+        Bucket directories above the workflow directory, or None to store it flat
+        """
+        return ()
+
+    def path_for(self, output_dir: str, workflow_id: str) -> str:
+        buckets = self.buckets(workflow_id) or ()
+        return os.path.join(output_dir, *buckets, workflow_id)
+
+class FlatLayout(OutputLayout):
+    name = "flat"
+
+class IdPrefixLayout(OutputLayout):
+    name = "id_prefix"
+
+    def buckets(self, workflow_id: str) -> Optional[Tuple[str, ...]]:
+        if not WORKFLOW_ID_PATTERN.match(workflow_id):
+            return None
+        return workflow_id[:4], workflow_id[4:7]
+
+class CoarseIdPrefixLayout(OutputLayout):
+    """
+    id_prefix with ~4.4 minute leaves, as briefly released; only used for lookups
+    """
+    name = "id_prefix_coarse"
+
+    def buckets(self, workflow_id: str) -> Optional[Tuple[str, ...]]:
+        if not WORKFLOW_ID_PATTERN.match(workflow_id):
+            return None
+        return workflow_id[:4], workflow_id[4:6]
+
+class DateLayout(OutputLayout):
+    name = "date"
+
+    def buckets(self, workflow_id: str) -> Optional[Tuple[str, ...]]:
+        created = workflow_id_created(workflow_id)
+        if created is None:
+            legacy = LEGACY_TIMESTAMP.search(workflow_id)
+            if not legacy:
+                return None
+            try:
+                created = datetime.strptime(legacy.group(1), "%Y%m%d")
+            except ValueError:
+                return None
+        return f"{created.year:04d}", f"{created.month:02d}", f"{created.day:02d}"
+
+class HashLayout(OutputLayout):
+    name = "hash"
+
+    def buckets(self, workflow_id: str) -> Optional[Tuple[str, ...]]:
+        digest = hashlib.sha256(workflow_id.encode('utf-8')).hexdigest()
+        return digest[:2], digest[2:4]
+
+LAYOUTS = {layout.name: layout for layout in (FlatLayout(), IdPrefixLayout(), DateLayout(), HashLayout())}
+
+# Layouts workflows may still be found in but that new workflows never use
+LOOKUP_ONLY_LAYOUTS = (CoarseIdPrefixLayout(),)
+
+def get_layout(name: str) -> OutputLayout:
+    if name not in LAYOUTS:
+        raise ValueError(f"layout must be one of {', '.join(LAYOUTS)}")
+    return LAYOUTS[name]
+
+def read_layout_name(output_dir: str) -> Optional[str]:
+    try:
+        with open(os.path.join(output_dir, LAYOUT_FILENAME), 'r', encoding='utf-8') as f:
+            return json.load(f).get("layout")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def is_new_output_dir(output_dir: str) -> bool:
+    """
+    True if output_dir does not exist yet or is empty
+    """
+    try:
+        with os.scandir(output_dir) as it:
+            return next(it, None) is None
+    except FileNotFoundError:
+        return True
+
+def write_layout_name(output_dir: str, name: str) -> None:
+    get_layout(name)
+    path = os.path.join(output_dir, LAYOUT_FILENAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"layout": name}, f)
+    os.replace(tmp_path, path)
+
+def resolve_workflow_dir(output_dir: str, workflow_id: str, layout: OutputLayout) -> str:
+    """
+    Directory of a workflow: where it exists under any layout, trying the
+    given layout first; the given layout's path for workflows not yet written
+    """
+    preferred = layout.path_for(output_dir, workflow_id)
+    if os.path.isdir(preferred):
+        return preferred
+    for other in (*LAYOUTS.values(), *LOOKUP_ONLY_LAYOUTS):
+        if other is layout:
+            continue
+        candidate = other.path_for(output_dir, workflow_id)
+        if candidate != preferred and os.path.isdir(candidate):
+            return candidate
+    return preferred
+
+def _is_workflow_dir(path: str) -> bool:
+    return any(os.path.exists(os.path.join(path, marker)) for marker in WORKFLOW_MARKERS)
+
+def iter_workflow_dirs(output_dir: str) -> Iterator[Tuple[str, str]]:
+    """
+    (workflow_id, directory) of every workflow under output_dir, in any layout
+    """
+    if not os.path.isdir(output_dir):
+        return
+
+    def walk(directory: str, depth: int) -> Iterator[Tuple[str, str]]:
+        with os.scandir(directory) as it:
+            entries = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+        for entry in entries:
+            if depth == 0 and entry.name in RESERVED_NAMES:
+                continue
+            if _is_workflow_dir(entry.path):
+                yield entry.name, entry.path
+            elif depth < MAX_DEPTH - 1:
+                yield from walk(entry.path, depth + 1)
+
+    yield from walk(output_dir, 0)
+
+def _remove_empty_parents(directory: str, output_dir: str) -> None:
+    output_dir = os.path.abspath(output_dir)
+    directory = os.path.abspath(directory)
+    while directory != output_dir and directory.startswith(output_dir):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            return
+        directory = os.path.dirname(directory)
+
+def migrate(output_dir: str, target: str, dry_run: bool = False) -> Dict:
+    """
+    Move every workflow directory to its place in the target layout
+    Each move is a single rename; emptied bucket directories are removed.
+    Run it while no coordinator is writing to output_dir.
+    """
+    layout = get_layout(target)
+    stats = {"moved": 0, "unchanged": 0, "conflicts": 0}
+    for workflow_id, current in list(iter_workflow_dirs(output_dir)):
+        destination = layout.path_for(output_dir, workflow_id)
+        if os.path.abspath(destination) == os.path.abspath(current):
+            stats["unchanged"] += 1
+            continue
+        if os.path.exists(destination):
+            logger.warning("Not moving %s: %s already exists", current, destination)
+            stats["conflicts"] += 1
+            continue
+
+        if dry_run:
+            logger.info("%s -> %s", current, destination)
+        else:
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            os.rename(current, destination)
+            _remove_empty_parents(os.path.dirname(current), output_dir)
+        stats["moved"] += 1
+
+    if not dry_run:
+        write_layout_name(output_dir, target)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Workflow output directory layouts")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="Move workflows into another layout")
+    migrate_parser.add_argument("output_dir", nargs="?", default="blog_output")
+    migrate_parser.add_argument("--to", required=True, choices=list(LAYOUTS), dest="target")
+    migrate_parser.add_argument("--dry-run", action="store_true",
+                                help="Print the moves without making them")
+
+    show_parser = commands.add_parser("show", help="Print the layout and workflow count")
+    show_parser.add_argument("output_dir", nargs="?", default="blog_output")
+
+    args = parser.parse_args(argv)
+    configure_console_logging()
+
+    if args.command == "show":
+        count = sum(1 for _ in iter_workflow_dirs(args.output_dir))
+        print(f"{args.output_dir}: layout {read_layout_name(args.output_dir) or 'flat (unrecorded)'}, "
+              f"{count} workflows")
+        return 0
+
+    stats = migrate(args.output_dir, args.target, args.dry_run)
+    action = "Would move" if args.dry_run else "Moved"
+    print(f"{action} {stats['moved']} workflows to the {args.target} layout "
+          f"({stats['unchanged']} already in place, {stats['conflicts']} conflicts)")
+    return 1 if stats["conflicts"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,6 @@
 import streamlit as st
 import os
-import json
-from blog_team_coordinator import BlogTeamCoordinator
+from app_services import get_coordinator, load_workflow_summary, seo_html, workflow_browser, workflow_browser_nav
 
 st.set_page_config(
     page_title="Blog Viewer",
@@ -13,35 +12,39 @@ def main():
     st.title("📖 Blog Content Viewer")
     st.markdown("View and manage all your generated blog posts")
     
-    coordinator = BlogTeamCoordinator()
-    workflows = coordinator.list_workflows()
+    # Shared with the main app and every other session; listings are cached per catalog version
+    coordinator = get_coordinator()
     
-    if not workflows:
-        st.info("No blog posts found. Create some blogs first!")
-        return
-    
-    # Sidebar for blog selection
+    # Sidebar for blog selection, one page of posts at a time
     with st.sidebar:
         st.header("📚 Select Blog Post")
         
+        workflows, total = workflow_browser("viewer", page_size=25)
+        
+        if not workflows:
+            if st.session_state.get("viewer_search"):
+                st.info("No blog posts match your search.")
+            else:
+                st.info("No blog posts found. Create some blogs first!")
+            return
+        
         selected_blog = st.selectbox(
             "Choose a blog to view:",
             options=range(len(workflows)),
             format_func=lambda x: f"{workflows[x]['topic']} ({workflows[x]['seo_score']}%)"
         )
         
+        workflow_browser_nav("viewer", workflows, total)
+        
         if st.button("🔄 Refresh List"):
             st.rerun()
     
     # Display selected blog
     if selected_blog is not None:
         workflow = workflows[selected_blog]
-        workflow_dir = os.path.join("blog_output", workflow['workflow_id'])
-        summary_file = os.path.join(workflow_dir, "workflow_summary.json")
+        blog_data = load_workflow_summary(workflow['workflow_id'])
         
-        if os.path.exists(summary_file):
-            with open(summary_file, 'r', encoding='utf-8') as f:
-                blog_data = json.load(f)
+        if blog_data is not None:
             
             # Blog header
             st.header(blog_data['final_title'])
@@ -80,32 +83,21 @@ def main():
                 )
             
             with col2:
-                # Create HTML version
-                html_content = f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>{blog_data['final_title']}</title>
-                    <meta name="description" content="{blog_data['final_meta_description']}">
-                </head>
-                <body>
-                    <h1>{blog_data['final_title']}</h1>
-                    {blog_data['final_content'].replace('\n\n', '</p><p>').replace('\n', '<br>')}
-                </body>
-                </html>
-                """
-                
+                # Rendered once per version of the post, then shared by every rerun and session
                 st.download_button(
                     "⬇️ Download HTML",
-                    html_content,
+                    seo_html(workflow['workflow_id']) or "",
                     file_name=f"{blog_data['topic'].replace(' ', '_')}.html",
                     mime="text/html"
                 )
             
             with col3:
                 # Create blog page link
-                blog_page_path = os.path.join(workflow_dir, "blog_page.html")
-                if os.path.exists(blog_page_path):
+                try:
+                    blog_page_path = coordinator.get_artifact(workflow['workflow_id'], "blog_page")
+                except FileNotFoundError:
+                    blog_page_path = None
+                if blog_page_path:
                     st.success("🔗 Blog page available")
                     abs_path = os.path.abspath(blog_page_path)
                     st.caption(f"Open: {abs_path}")
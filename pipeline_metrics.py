@@ -0,0 +1,353 @@
+"""
+Low-overhead timing and memory metrics for blog workflows
+
+The coordinator opens a WorkflowMetrics collector for each workflow run.
+While one is active (tracked in a context variable, so asyncio tasks and
+the worker threads they start each see their own), ``span`` blocks and
+``@timed`` functions add their wall and CPU time under the enclosing span,
+e.g. ``content/_write_trends_section``. Outside a workflow they cost a
+single context variable lookup.
+
+CPU time is the calling thread's (time.thread_time): work a span hands to
+other threads is counted in those threads' spans, not in its own.
+
+Metrics are stored in the workflow summary and sent to any configured
+sinks: a JSON lines file or a Prometheus textfile-collector file.
+cProfile and tracemalloc captures are opt-in per coordinator.
+
+tracemalloc and peak RSS are process-wide. Tracing stays on while any
+workflow asks for it, and a workflow's traced_peak_bytes is the peak
+reached during its run above the traced memory at its start (concurrent
+workflows' allocations included). process_peak_rss_bytes is the peak of
+the whole process so far, not of one workflow.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, List, Optional
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak RSS is reported as None there
+    resource = None
+
+PROFILE_FILENAME = "profile.pstats"
+MEMORY_PROFILE_FILENAME = "memory_profile.txt"
+
+# Allocation sites listed in a memory profile
+MEMORY_PROFILE_LINES = 25
+
+# (collector, current span path) of the running workflow, or None
+_active = ContextVar("pipeline_metrics_active", default=None)
+
+# Workflows currently tracing memory, and whether tracing was started for them
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_started = False
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident set size of this process so far (over its whole life)
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class WorkflowMetrics:
+    """
+    Span timings and bytes written for one workflow run
+    """
+
+    def __init__(self, workflow_id: str, trace_memory: bool = False):
+        self.workflow_id = workflow_id
+        self.trace_memory = trace_memory
+        self.profiler = None
+        self.memory_snapshot = None
+        self.traced_peak_bytes = None
+        # Traced (current, peak) bytes when the workflow started
+        self._traced_start = None
+        # span path -> [calls, wall seconds, cpu seconds]
+        self._spans = {}
+        # file name -> bytes
+        self._bytes_written = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def add_span(self, path: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            totals = self._spans.get(path)
+            if totals is None:
+                totals = self._spans[path] = [0, 0.0, 0.0]
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += cpu
+
+    def add_bytes(self, name: str, size: int) -> None:
+        with self._lock:
+            self._bytes_written[name] = self._bytes_written.get(name, 0) + size
+
+    def to_dict(self) -> Dict:
+        """
+        JSON-ready metrics as of now
+        """
+        with self._lock:
+            spans = {
+                path: {"calls": calls, "wall_ms": round(wall * 1000, 3), "cpu_ms": round(cpu * 1000, 3)}
+                for path, (calls, wall, cpu) in self._spans.items()
+            }
+            bytes_written = dict(self._bytes_written)
+
+        metrics = {
+            "elapsed_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "spans": spans,
+            "bytes_written": bytes_written,
+            "process_peak_rss_bytes": peak_rss_bytes()
+        }
+        if self.trace_memory:
+            metrics["traced_peak_bytes"] = (self.traced_peak_since_start()
+                                            if self.traced_peak_bytes is None else self.traced_peak_bytes)
+        return metrics
+
+    def traced_peak_since_start(self) -> Optional[int]:
+        """
+        Traced peak reached since the workflow started, above its starting usage
+        Falls back to the growth of current usage when the process-wide peak
+        predates the workflow and has not been exceeded since.
+        """
+        if self._traced_start is None or not tracemalloc.is_tracing():
+            return None
+        start_current, start_peak = self._traced_start
+        current, peak = tracemalloc.get_traced_memory()
+        if peak > start_peak:
+            return peak - start_current
+        return max(0, current - start_current)
+
+def _start_tracing() -> None:
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_started = True
+        _tracing_users += 1
+
+def _stop_tracing() -> None:
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        _tracing_users -= 1
+        # Only the last workflow stops tracing, and only if it was started here
+        if _tracing_users == 0 and _tracing_started:
+            tracemalloc.stop()
+            _tracing_started = False
+
+@contextmanager
+def collect(workflow_id: str, profile_cpu: bool = False, trace_memory: bool = False):
+    """
+    Make a new WorkflowMetrics the active collector for the enclosed code
+    profile_cpu runs cProfile on the calling thread; trace_memory runs
+    tracemalloc, which is process-wide, so concurrent workflows share it.
+    """
+    metrics = WorkflowMetrics(workflow_id, trace_memory)
+    if trace_memory:
+        _start_tracing()
+        metrics._traced_start = tracemalloc.get_traced_memory()
+
+    token = _active.set((metrics, ""))
+    if profile_cpu:
+        metrics.profiler = cProfile.Profile()
+        metrics.profiler.enable()
+    try:
+        yield metrics
+    finally:
+        if metrics.profiler is not None:
+            metrics.profiler.disable()
+        _active.reset(token)
+        if trace_memory:
+            try:
+                metrics.traced_peak_bytes = metrics.traced_peak_since_start()
+                metrics.memory_snapshot = tracemalloc.take_snapshot()
+            finally:
+                _stop_tracing()
+
+def current_metrics() -> Optional[WorkflowMetrics]:
+    """
+    Collector of the workflow running in this context, if any
+    """
+    active = _active.get()
+    return active[0] if active is not None else None
+
+@contextmanager
+def span(name: str):
+    """
+    Time the enclosed block as a child of the current span
+    """
+    active = _active.get()
+    if active is None:
+        yield
+        return
+
+    metrics, parent = active
+    path = f"{parent}/{name}" if parent else name
+    token = _active.set((metrics, path))
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    try:
+        yield
+    finally:
+        metrics.add_span(path, time.perf_counter() - wall, time.thread_time() - cpu)
+        _active.reset(token)
+
+def timed(func=None, *, name: Optional[str] = None):
+    """
+    Decorator: time every call as a span named after the function
+    """
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+def record_bytes(name: str, size: int) -> None:
+    """
+    Count bytes written to a file by the current workflow
+    """
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.add_bytes(name, size)
+
+def save_profiles(metrics: WorkflowMetrics, directory: str) -> List[str]:
+    """
+    Write the captured CPU and memory profiles into directory
+    Returns the paths written
+    """
+    paths = []
+    if metrics.profiler is not None:
+        path = os.path.join(directory, PROFILE_FILENAME)
+        metrics.profiler.dump_stats(path)
+        paths.append(path)
+
+    if metrics.memory_snapshot is not None:
+        path = os.path.join(directory, MEMORY_PROFILE_FILENAME)
+        statistics = metrics.memory_snapshot.statistics("lineno")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"Top {MEMORY_PROFILE_LINES} allocation sites for {metrics.workflow_id}\n\n")
+            for stat in statistics[:MEMORY_PROFILE_LINES]:
+                f.write(f"{stat}\n")
+        paths.append(path)
+    return paths
+
+class MetricsSink(ABC):
+    """
+    Receives the metrics of every finished workflow
+    """
+
+    @abstractmethod
+    def emit(self, workflow_id: str, metrics: Dict) -> None:
+        """
+        Record one workflow's metrics (as returned by WorkflowMetrics.to_dict)
+        """
+
+class JsonLinesSink(MetricsSink):
+    """
+    Appends one JSON line per workflow; safe to share between processes
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def emit(self, workflow_id: str, metrics: Dict) -> None:
+        entry = {"time": datetime.now().isoformat(), "workflow_id": workflow_id}
+        entry.update(metrics)
+        line = (json.dumps(entry, separators=(',', ':'), default=str) + "\n").encode('utf-8')
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class PrometheusTextfileSink(MetricsSink):
+    """
+    Running totals in the Prometheus text format, rewritten after each workflow
+    Point node_exporter's textfile collector at the file (named *.prom).
+    Totals are kept per sink, so give each process its own file.
+    """
+
+    def __init__(self, path: str, prefix: str = "blog_"):
+        self.path = path
+        self.prefix = prefix
+        self._workflows = 0
+        self._spans = {}
+        self._bytes_written = {}
+        self._peak_rss = None
+        self._lock = threading.Lock()
+
+    def emit(self, workflow_id: str, metrics: Dict) -> None:
+        with self._lock:
+            self._workflows += 1
+            for path, totals in metrics.get("spans", {}).items():
+                current = self._spans.setdefault(path, [0, 0.0, 0.0])
+                current[0] += totals["calls"]
+                current[1] += totals["wall_ms"] / 1000
+                current[2] += totals["cpu_ms"] / 1000
+            for name, size in metrics.get("bytes_written", {}).items():
+                self._bytes_written[name] = self._bytes_written.get(name, 0) + size
+            if metrics.get("process_peak_rss_bytes") is not None:
+                self._peak_rss = max(self._peak_rss or 0, metrics["process_peak_rss_bytes"])
+
+            text = self.render()
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+
+    def render(self) -> str:
+        prefix = self.prefix
+        lines = [
+            f"# HELP {prefix}workflows_total Workflows completed",
+            f"# TYPE {prefix}workflows_total counter",
+            f"{prefix}workflows_total {self._workflows}"
+        ]
+
+        series = (
+            ("span_calls_total", "Calls per pipeline span", 0),
+            ("span_wall_seconds_total", "Wall time per pipeline span", 1),
+            ("span_cpu_seconds_total", "CPU time per pipeline span", 2)
+        )
+        for metric, description, column in series:
+            lines.append(f"# HELP {prefix}{metric} {description}")
+            lines.append(f"# TYPE {prefix}{metric} counter")
+            for path, totals in sorted(self._spans.items()):
+                lines.append(f'{prefix}{metric}{{span="{_label(path)}"}} {totals[column]:.6g}')
+
+        lines.append(f"# HELP {prefix}bytes_written_total Bytes written per output file name")
+        lines.append(f"# TYPE {prefix}bytes_written_total counter")
+        for name, size in sorted(self._bytes_written.items()):
+            lines.append(f'{prefix}bytes_written_total{{file="{_label(name)}"}} {size}')
+
+        if self._peak_rss is not None:
+            lines.append(f"# HELP {prefix}process_peak_rss_bytes Peak resident set size of the process")
+            lines.append(f"# TYPE {prefix}process_peak_rss_bytes gauge")
+            lines.append(f"{prefix}process_peak_rss_bytes {self._peak_rss}")
+        return "\n".join(lines) + "\n"
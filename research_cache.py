@@ -0,0 +1,218 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+def make_research_key(topic: str, target_audience: str, sources: Iterable[str]) -> str:
+    """
+    Content-addressed cache key for a research request
+    Topic and audience are case/whitespace normalized and sources are
+    order-independent, so equivalent requests share one entry
+    """
+    normalized = {
+        "topic": " ".join(topic.lower().split()),
+        "target_audience": " ".join(target_audience.lower().split()),
+        "sources": sorted(set(sources))
+    }
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResearchCache(ABC):
+    """
+    Base class for research caches; subclasses implement _get, _set and __len__
+    Entries expire after ``ttl`` seconds (None disables expiry) and the
+    least recently used entries are evicted beyond ``max_entries``
+    """
+
+    def __init__(self, ttl: Optional[float] = 3600, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Return a copy of the cached research, or None on miss/expiry
+        """
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store research under key, evicting old entries if needed
+        """
+        with self._lock:
+            self._set(key, value)
+
+    def stats(self) -> Dict:
+        """
+        Hit/miss counters for monitoring
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self)
+        }
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Dict]:
+        """
+        Stored value for key (under the lock), or None if missing or expired
+        """
+
+    @abstractmethod
+    def _set(self, key: str, value: Dict) -> None:
+        """
+        Store value for key (under the lock)
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Number of stored entries
+        """
+
+    def __getstate__(self) -> Dict:
+        # Locks cannot be pickled (e.g. when handed to batch worker processes)
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+class MemoryResearchCache(ResearchCache):
+    """
+    In-process LRU research cache
+    """
+
+    def __init__(self, ttl: Optional[float] = 3600, max_entries: int = 1024):
+        super().__init__(ttl, max_entries)
+        self._entries = OrderedDict()
+
+    def _get(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if self._is_expired(stored_at):
+            del self._entries[key]
+            self.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def _set(self, key: str, value: Dict) -> None:
+        self._entries[key] = (time.time(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict:
+        # Each process keeps its own entries
+        state = super().__getstate__()
+        state["_entries"] = OrderedDict()
+        return state
+
+class DiskResearchCache(ResearchCache):
+    """
+    On-disk research cache shared by every process using the same directory
+    One JSON file per entry; file mtime tracks recency for LRU eviction.
+    With several writer processes ``max_entries`` is a soft bound.
+    """
+
+    def __init__(self, cache_dir: str = "research_cache", ttl: Optional[float] = 86400,
+                 max_entries: int = 10000):
+        super().__init__(ttl, max_entries)
+        self.cache_dir = cache_dir
+        # Entry count since the last directory scan; avoids a scan per write
+        self._entry_count = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._is_expired(entry["stored_at"]):
+            self._remove(path)
+            self.expirations += 1
+            return None
+
+        # Touch the file so eviction sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["value"]
+
+    def _set(self, key: str, value: Dict) -> None:
+        entry = {"stored_at": time.time(), "value": value}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, default=str)
+        os.replace(tmp_path, self._path(key))
+
+        if self._entry_count is None:
+            self._entry_count = len(self._entry_paths())
+        else:
+            self._entry_count += 1
+        if self._entry_count > self.max_entries:
+            self._evict()
+
+    def _entry_paths(self):
+        with os.scandir(self.cache_dir) as it:
+            return [entry for entry in it if entry.name.endswith(".json")]
+
+    def _evict(self) -> None:
+        entries = self._entry_paths()
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:overflow]:
+                self._remove(entry.path)
+                self.evictions += 1
+        self._entry_count = min(len(entries), self.max_entries)
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._entry_paths())
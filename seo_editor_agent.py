@@ -1,15 +1,42 @@
+import asyncio
+import copy
+import hashlib
 import re
-from typing import Dict, List, Optional, Tuple
-from collections import Counter
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from collections import Counter, OrderedDict
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from keyword_matcher import KeywordMatcher
+from text_analysis import TextStats, analyze_text
+from pipeline_metrics import timed
+from blog_logging import get_logger
+
+logger = get_logger("seo_editor")
+
 class SEOEditorAgent:
     """
     SEO Editor Agent for Blog Writing Team
     Optimizes content for search engines and improves overall quality
     """
     
-    def __init__(self):
+    def __init__(self, max_keywords: Optional[int] = None, cache_size: int = 256):
+        # How many target keywords get density/placement analysis (None = all;
+        # the single-pass matcher makes every extra keyword cheap)
+        self.max_keywords = max_keywords
+        # Memoized analysis results keyed on content hash + keyword-set hash,
+        # so re-scoring an unchanged draft does no text work at all
+        self.cache_size = cache_size
+        self._results_cache = OrderedDict()
+        self._stats_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.readability_weights = {
             "sentence_length": 0.3,
             "word_complexity": 0.2,
@@ -23,26 +50,40 @@ class SEOEditorAgent:
         """
         Main optimization function that handles all SEO and quality improvements
         """
-        print(f"Optimizing content for SEO and readability")
+        logger.info("Optimizing content for SEO and readability")
         
         if not target_keywords:
             target_keywords = [kw["keyword"] for kw in research_data.get("keywords", [])]
         
+        # Analyze the draft once; every check below reads the same stats
+        full_text = content_data["full_text"]
+        stats = self._analyze(full_text)
+        text_key = self._hash_text(full_text)
+        # Keyword matching runs first so the score reuses its counts
+        keyword_density = self._memoized(
+            "keyword_density", text_key, target_keywords,
+            lambda: self._optimize_keyword_density(full_text, target_keywords, stats)
+        )
+        seo_score = self.score_content(content_data, target_keywords, stats)
+        
         optimized = {
             "original_content": content_data,
             "seo_optimized_title": self._optimize_title(content_data["title"], target_keywords),
             "optimized_meta_description": self._optimize_meta_description(
                 content_data["meta_description"], target_keywords
             ),
-            "keyword_optimized_content": self._optimize_keyword_density(
-                content_data["full_text"], target_keywords
-            ),
+            "keyword_optimized_content": keyword_density,
             "internal_links": self._suggest_internal_links(content_data["full_text"]),
             "external_links": self._suggest_external_links(research_data),
-            "readability_improvements": self._improve_readability(content_data["full_text"]),
-            "seo_score": self._calculate_seo_score(content_data, target_keywords),
-            "technical_seo": self._check_technical_seo(content_data),
-            "performance_predictions": self._predict_performance(content_data, target_keywords),
+            "readability_improvements": self._memoized(
+                "readability", text_key, [],
+                lambda: self._improve_readability(full_text, stats)
+            ),
+            "seo_score": seo_score,
+            "technical_seo": self._check_technical_seo(content_data, stats),
+            "performance_predictions": self._predict_performance(
+                content_data, target_keywords, stats, seo_score
+            ),
             "final_content": ""
         }
         
@@ -52,6 +93,94 @@ class SEOEditorAgent:
         self.optimized_content = optimized
         return optimized
     
+    def score_content(self, content_data: Dict, keywords: List[str],
+                      stats: Optional[TextStats] = None) -> Dict:
+        """
+        SEO score for a draft, memoized on its content and keyword set
+        Scoring the same draft again (re-optimizing, UI re-renders) is free
+        """
+        content_key = self._hash_text(
+            content_data.get("title", ""),
+            content_data.get("meta_description", ""),
+            str(content_data.get("word_count", 0)),
+            content_data.get("full_text", "")
+        )
+        return self._memoized(
+            "seo_score", content_key, keywords,
+            lambda: self._calculate_seo_score(
+                content_data, keywords,
+                stats or self._analyze(content_data.get("full_text", ""))
+            )
+        )
+    
+    def cache_info(self) -> Dict:
+        """
+        Memoization counters for monitoring
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "entries": len(self._results_cache),
+            "analyzed_texts": len(self._stats_cache)
+        }
+    
+    def _hash_text(self, *parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+    
+    @timed
+    def _analyze(self, text: str) -> TextStats:
+        """
+        Text analysis, reused while the same text stays in the cache
+        """
+        key = self._hash_text(text)
+        with self._cache_lock:
+            stats = self._stats_cache.get(key)
+            if stats is not None:
+                self._stats_cache.move_to_end(key)
+                return stats
+        
+        stats = analyze_text(text)
+        with self._cache_lock:
+            self._stats_cache[key] = stats
+            # Analyses hold the whole text, so keep only a few
+            while len(self._stats_cache) > max(1, self.cache_size // 16):
+                self._stats_cache.popitem(last=False)
+        return stats
+    
+    def _memoized(self, kind: str, content_key: str, keywords: List[str],
+                  compute: Callable[[], Dict]) -> Dict:
+        """
+        Return a cached copy of compute() for (kind, content, keyword set)
+        """
+        key = (kind, content_key, self._hash_text(*keywords), self.max_keywords)
+        with self._cache_lock:
+            cached = self._results_cache.get(key)
+            if cached is not None:
+                self._results_cache.move_to_end(key)
+                self.cache_hits += 1
+                return copy.deepcopy(cached)
+            self.cache_misses += 1
+        
+        result = compute()
+        with self._cache_lock:
+            self._results_cache[key] = copy.deepcopy(result)
+            while len(self._results_cache) > self.cache_size:
+                self._results_cache.popitem(last=False)
+        return result
+    
+    async def aoptimize_content(self, content_data: Dict, research_data: Dict,
+                                target_keywords: Optional[List[str]] = None) -> Dict:
+        """
+        Awaitable version of optimize_content
+        Analysis is CPU-bound, so it runs in a worker thread off the event loop
+        """
+        return await asyncio.to_thread(self.optimize_content, content_data, research_data, target_keywords)
+    
+    @timed
     def _optimize_title(self, title: str, keywords: List[str]) -> Dict:
         """
         Optimize title for SEO while maintaining readability
@@ -87,6 +216,7 @@ class SEOEditorAgent:
             "suggestions": suggestions
         }
     
+    @timed
     def _optimize_meta_description(self, meta_desc: str, keywords: List[str]) -> Dict:
         """
         Optimize meta description for click-through rates
@@ -124,16 +254,25 @@ class SEOEditorAgent:
             "suggestions": suggestions
         }
     
-    def _optimize_keyword_density(self, content: str, keywords: List[str]) -> Dict:
+    @timed
+    def _optimize_keyword_density(self, content: str, keywords: List[str],
+                                  stats: Optional[TextStats] = None) -> Dict:
         """
         Analyze and optimize keyword density
         """
-        word_count = len(content.split())
+        stats = stats or analyze_text(content)
+        word_count = stats.word_count
         keyword_analysis = {}
+        keyword_placement = {}
         
-        for keyword in keywords[:5]:  # Analyze top 5 keywords
+        analyzed = keywords if self.max_keywords is None else keywords[:self.max_keywords]
+        # One automaton pass finds every keyword, its variants and positions
+        hits = stats.match_keywords(analyzed)
+        
+        for keyword in analyzed:
             # Count exact matches and variations
-            exact_count = len(re.findall(rf'\b{re.escape(keyword.lower())}\b', content.lower()))
+            exact_count = stats.count_phrase(keyword)
+            keyword_placement[keyword] = stats.keyword_placement(hits[keyword])
             density = (exact_count / word_count) * 100 if word_count > 0 else 0
             
             # Determine if density is optimal (1-3% for primary, 0.5-1% for secondary)
@@ -156,6 +295,7 @@ class SEOEditorAgent:
         return {
             "total_words": word_count,
             "keyword_analysis": keyword_analysis,
+            "keyword_placement": keyword_placement,
             "suggestions": self._generate_keyword_suggestions(keyword_analysis)
         }
     
@@ -172,6 +312,7 @@ class SEOEditorAgent:
         
         return suggestions
     
+    @timed
     def _suggest_internal_links(self, content: str) -> List[Dict]:
         """
         Suggest internal linking opportunities
@@ -200,6 +341,7 @@ class SEOEditorAgent:
         
         return internal_links
     
+    @timed
     def _suggest_external_links(self, research_data: Dict) -> List[Dict]:
         """
         Suggest high-quality external links to boost authority
@@ -226,21 +368,18 @@ class SEOEditorAgent:
         
         return external_links[:5]  # Limit to 5 suggestions
     
-    def _improve_readability(self, content: str) -> Dict:
+    @timed
+    def _improve_readability(self, content: str, stats: Optional[TextStats] = None) -> Dict:
         """
         Analyze and improve content readability
         """
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        paragraphs = content.split('\n\n')
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
-        
-        words = content.split()
+        stats = stats or analyze_text(content)
         
         # Calculate readability metrics
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
-        avg_paragraph_length = sum(len(p.split()) for p in paragraphs) / len(paragraphs) if paragraphs else 0
+        sentence_words = stats.sentence_word_counts
+        paragraph_words = stats.paragraph_word_counts
+        avg_sentence_length = sum(sentence_words) / len(sentence_words) if sentence_words else 0
+        avg_paragraph_length = sum(paragraph_words) / len(paragraph_words) if paragraph_words else 0
         
         # Count transition words
         transition_words = [
@@ -248,8 +387,8 @@ class SEOEditorAgent:
             "consequently", "meanwhile", "nevertheless", "specifically", "for example",
             "in addition", "as a result", "on the other hand", "in contrast"
         ]
-        transition_count = sum(1 for word in words if word.lower().rstrip('.,!?') in transition_words)
-        transition_ratio = (transition_count / len(words)) * 100 if words else 0
+        transition_count = stats.count_terms(transition_words)
+        transition_ratio = (transition_count / stats.word_count) * 100 if stats.word_count else 0
         
         # Generate readability score (simplified Flesch-like scoring)
         readability_score = self._calculate_readability_score(
@@ -301,10 +440,46 @@ class SEOEditorAgent:
         else:
             return "needs improvement"
     
-    def _calculate_seo_score(self, content_data: Dict, keywords: List[str]) -> Dict:
+    @timed
+    def _calculate_seo_score(self, content_data: Dict, keywords: List[str],
+                             stats: Optional[TextStats] = None) -> Dict:
         """
         Calculate overall SEO score
         """
+        stats = stats or analyze_text(content_data.get("full_text", ""))
+        
+        primary_keyword = keywords[0] if keywords else ""
+        keyword_count = stats.count_phrase(primary_keyword) if primary_keyword else None
+        
+        score_components = self._score_components(
+            *self._title_meta_matches(content_data, [kw.lower() for kw in keywords]),
+            content_data.get("word_count", 0),
+            keyword_count,
+            stats.heading_marker_count
+        )
+        return self._seo_score_result(score_components)
+    
+    def _title_meta_matches(self, content_data: Dict, lowered_keywords: List[str]) -> Tuple[bool, bool, int, bool]:
+        """
+        (primary keywords in title, any keyword in title, meta length, any keyword in meta)
+        """
+        title = content_data.get("title", "").lower()
+        meta = content_data.get("meta_description", "")
+        meta_lower = meta.lower()
+        return (
+            any(kw in title for kw in lowered_keywords[:2]),
+            any(kw in title for kw in lowered_keywords),
+            len(meta),
+            any(kw in meta_lower for kw in lowered_keywords)
+        )
+    
+    def _score_components(self, title_primary: bool, title_any: bool, meta_length: int,
+                          meta_any: bool, word_count: int, keyword_count: Optional[int],
+                          heading_markers: int) -> Dict:
+        """
+        Points per SEO component; keyword_count is None without a primary keyword
+        score_batch applies the same bands to whole arrays
+        """
         score_components = {
             "title_optimization": 0,
             "meta_description": 0,
@@ -314,21 +489,18 @@ class SEOEditorAgent:
         }
         
         # Title optimization (0-25 points)
-        title = content_data.get("title", "")
-        if any(kw.lower() in title.lower() for kw in keywords[:2]):
+        if title_primary:
             score_components["title_optimization"] = 25
-        elif any(kw.lower() in title.lower() for kw in keywords):
+        elif title_any:
             score_components["title_optimization"] = 15
         
         # Meta description (0-20 points)
-        meta = content_data.get("meta_description", "")
-        if 120 <= len(meta) <= 160 and any(kw.lower() in meta.lower() for kw in keywords):
+        if 120 <= meta_length <= 160 and meta_any:
             score_components["meta_description"] = 20
-        elif any(kw.lower() in meta.lower() for kw in keywords):
+        elif meta_any:
             score_components["meta_description"] = 10
         
         # Content length (0-20 points)
-        word_count = content_data.get("word_count", 0)
         if 1500 <= word_count <= 3000:
             score_components["content_length"] = 20
         elif 1000 <= word_count < 1500:
@@ -337,10 +509,7 @@ class SEOEditorAgent:
             score_components["content_length"] = 10
         
         # Keyword usage (0-25 points)
-        content = content_data.get("full_text", "")
-        primary_keyword = keywords[0] if keywords else ""
-        if primary_keyword:
-            keyword_count = len(re.findall(rf'\b{re.escape(primary_keyword.lower())}\b', content.lower()))
+        if keyword_count is not None:
             density = (keyword_count / word_count) * 100 if word_count > 0 else 0
             if 1 <= density <= 3:
                 score_components["keyword_usage"] = 25
@@ -348,11 +517,14 @@ class SEOEditorAgent:
                 score_components["keyword_usage"] = 15
         
         # Headings structure (0-10 points)
-        if content.count("##") >= 3:  # At least 3 H2 headings
+        if heading_markers >= 3:  # At least 3 H2 headings
             score_components["headings_structure"] = 10
-        elif content.count("##") >= 1:
+        elif heading_markers >= 1:
             score_components["headings_structure"] = 5
         
+        return score_components
+    
+    def _seo_score_result(self, score_components: Dict) -> Dict:
         total_score = sum(score_components.values())
         
         return {
@@ -363,6 +535,141 @@ class SEOEditorAgent:
             "grade": self._get_seo_grade(total_score)
         }
     
+    def score_batch(self, posts: Iterable[Dict], keywords: List[str],
+                    vectorized: Optional[bool] = None) -> List[Dict]:
+        """
+        SEO scores of many posts against one keyword set, e.g. to re-score
+        the archive after a keyword-strategy change
+        Each result equals _calculate_seo_score for that post. With NumPy
+        installed the posts are turned into a keyword matrix (one matcher
+        pass per post) and densities, placement flags and scoring bands are
+        computed as array operations; vectorized=False forces the pure
+        Python path, which only scans for the primary keyword
+        """
+        posts = list(posts)
+        if vectorized is None:
+            vectorized = np is not None
+        if vectorized and np is None:
+            raise RuntimeError("Vectorized scoring requires numpy; pass vectorized=False")
+        
+        lowered_keywords = [kw.lower() for kw in keywords]
+        primary_keyword = lowered_keywords[0] if lowered_keywords else ""
+        
+        if vectorized:
+            if not posts:
+                return []
+            components = self._vectorized_components(self.keyword_matrix(posts, keywords),
+                                                     bool(primary_keyword))
+            return [self._seo_score_result(score_components) for score_components in components]
+        
+        # Same whole-word semantics as TextStats.count_phrase
+        primary_pattern = re.compile(rf'\b{re.escape(primary_keyword)}\b') if primary_keyword else None
+        results = []
+        for content_data in posts:
+            full_text = content_data.get("full_text", "")
+            score_components = self._score_components(
+                *self._title_meta_matches(content_data, lowered_keywords),
+                content_data.get("word_count", 0),
+                len(primary_pattern.findall(full_text.lower())) if primary_pattern else None,
+                full_text.count("##"))
+            results.append(self._seo_score_result(score_components))
+        return results
+    
+    def keyword_matrix(self, posts: Iterable[Dict], keywords: List[str]) -> Dict:
+        """
+        Document-term view of many posts against one keyword set (needs NumPy)
+        Rows are posts and columns keywords: "counts" (whole-word matches,
+        found for all keywords in one automaton pass per post), "density"
+        (percent of the post's word_count), and the placement flags
+        "in_title" / "in_meta" as the SEO score checks them. Per-post
+        "word_count", "meta_length" and "heading_markers" come along. Keyword
+        sets are small, so the matrix is kept dense.
+        """
+        if np is None:
+            raise RuntimeError("keyword_matrix requires numpy")
+        posts = list(posts)
+        lowered_keywords = [kw.lower() for kw in keywords]
+        matcher = KeywordMatcher(lowered_keywords, include_variants=False)
+        
+        counts = np.zeros((len(posts), len(lowered_keywords)), dtype=np.int64)
+        in_title = np.zeros(counts.shape, dtype=bool)
+        in_meta = np.zeros(counts.shape, dtype=bool)
+        word_count = np.zeros(len(posts), dtype=np.float64)
+        meta_length = np.zeros(len(posts), dtype=np.int64)
+        heading_markers = np.zeros(len(posts), dtype=np.int64)
+        
+        for row, content_data in enumerate(posts):
+            full_text = content_data.get("full_text", "")
+            hits = matcher.search(full_text.lower())
+            counts[row] = [hits[kw].count for kw in lowered_keywords]
+            title = content_data.get("title", "").lower()
+            meta = content_data.get("meta_description", "")
+            meta_lower = meta.lower()
+            # Substring tests, exactly as _title_meta_matches makes them
+            in_title[row] = [kw in title for kw in lowered_keywords]
+            in_meta[row] = [kw in meta_lower for kw in lowered_keywords]
+            # float64 holds every realistic count exactly, so densities round as in Python
+            word_count[row] = content_data.get("word_count", 0)
+            meta_length[row] = len(meta)
+            heading_markers[row] = full_text.count("##")
+        
+        positive = (word_count > 0)[:, None]
+        density = np.where(positive, counts / np.where(positive, word_count[:, None], 1) * 100, 0.0)
+        return {
+            "keywords": lowered_keywords,
+            "counts": counts,
+            "density": density,
+            "in_title": in_title,
+            "in_meta": in_meta,
+            "word_count": word_count,
+            "meta_length": meta_length,
+            "heading_markers": heading_markers
+        }
+    
+    def _vectorized_components(self, matrix: Dict, has_primary: bool) -> List[Dict]:
+        """
+        _score_components over a keyword_matrix
+        """
+        in_title = matrix["in_title"]
+        title_primary = in_title[:, :2].any(axis=1)
+        title_any = in_title.any(axis=1)
+        meta_any = matrix["in_meta"].any(axis=1)
+        meta_length = matrix["meta_length"]
+        word_count = matrix["word_count"]
+        heading_markers = matrix["heading_markers"]
+        
+        title_points = np.where(title_primary, 25, np.where(title_any, 15, 0))
+        meta_points = np.where((meta_length >= 120) & (meta_length <= 160) & meta_any, 20,
+                               np.where(meta_any, 10, 0))
+        length_points = np.select(
+            [(word_count >= 1500) & (word_count <= 3000),
+             (word_count >= 1000) & (word_count < 1500),
+             word_count >= 3000],
+            [20, 15, 10], 0)
+        
+        if has_primary:
+            density = matrix["density"][:, 0]
+            keyword_points = np.where((density >= 1) & (density <= 3), 25,
+                                      np.where(((density >= 0.5) & (density < 1)) | ((density > 3) & (density <= 4)),
+                                               15, 0))
+        else:
+            keyword_points = np.zeros(len(word_count), dtype=np.int64)
+        
+        heading_points = np.where(heading_markers >= 3, 10, np.where(heading_markers >= 1, 5, 0))
+        
+        return [
+            {
+                "title_optimization": title,
+                "meta_description": meta,
+                "keyword_usage": keyword,
+                "content_length": length,
+                "headings_structure": headings
+            }
+            for title, meta, keyword, length, headings in zip(
+                title_points.tolist(), meta_points.tolist(), keyword_points.tolist(),
+                length_points.tolist(), heading_points.tolist())
+        ]
+    
     def _get_seo_grade(self, score: int) -> str:
         """
         Convert SEO score to letter grade
@@ -378,10 +685,12 @@ class SEOEditorAgent:
         else:
             return "F"
     
-    def _check_technical_seo(self, content_data: Dict) -> Dict:
+    @timed
+    def _check_technical_seo(self, content_data: Dict, stats: Optional[TextStats] = None) -> Dict:
         """
         Check technical SEO elements
         """
+        stats = stats or analyze_text(content_data.get("full_text", ""))
         checks = {
             "title_length": {
                 "status": "pass" if 30 <= len(content_data.get("title", "")) <= 60 else "fail",
@@ -396,8 +705,8 @@ class SEOEditorAgent:
                 "value": content_data.get("word_count", 0)
             },
             "heading_structure": {
-                "status": "pass" if content_data.get("full_text", "").count("##") >= 2 else "fail",
-                "value": content_data.get("full_text", "").count("##")
+                "status": "pass" if stats.heading_marker_count >= 2 else "fail",
+                "value": stats.heading_marker_count
             }
         }
         
@@ -411,12 +720,16 @@ class SEOEditorAgent:
             "score": f"{passed}/{total}"
         }
     
-    def _predict_performance(self, content_data: Dict, keywords: List[str]) -> Dict:
+    @timed
+    def _predict_performance(self, content_data: Dict, keywords: List[str],
+                             stats: Optional[TextStats] = None,
+                             seo_score: Optional[Dict] = None) -> Dict:
         """
         Predict content performance based on optimization factors
         """
-        # Simplified performance prediction
-        seo_score = self._calculate_seo_score(content_data, keywords)["percentage"]
+        # Simplified performance prediction, reusing an already computed score
+        seo_score = seo_score or self.score_content(content_data, keywords, stats)
+        seo_score = seo_score["percentage"]
         
         predictions = {
             "search_ranking_potential": "high" if seo_score >= 80 else "medium" if seo_score >= 60 else "low",
@@ -427,6 +740,7 @@ class SEOEditorAgent:
         
         return predictions
     
+    @timed
     def _apply_all_optimizations(self, original_content: Dict, optimizations: Dict) -> str:
         """
         Apply all optimizations to create the final optimized content
@@ -446,15 +760,17 @@ class SEOEditorAgent:
         
         return optimized_text
     
-    def generate_optimization_report(self) -> str:
+    def generate_optimization_report(self, optimized_content: Optional[Dict] = None) -> str:
         """
         Generate a comprehensive optimization report
+        Uses the given optimize_content result, or the most recent one
         """
-        if not self.optimized_content:
+        optimized_content = optimized_content or self.optimized_content
+        if not optimized_content:
             return "No optimization data available"
         
-        seo_score = self.optimized_content["seo_score"]
-        technical = self.optimized_content["technical_seo"]
+        seo_score = optimized_content["seo_score"]
+        technical = optimized_content["technical_seo"]
         
         report = f"""
 SEO Optimization Report
@@ -465,15 +781,15 @@ Overall SEO Score: {seo_score['percentage']}% (Grade: {seo_score['grade']})
 Technical SEO: {technical['passed']}/{technical['total']} checks passed
 
 Key Improvements Made:
-- Title optimization: {self.optimized_content['seo_optimized_title']['suggestions'][:1]}
-- Meta description: {self.optimized_content['optimized_meta_description']['suggestions'][:1]}
-- Keyword density: {len(self.optimized_content['keyword_optimized_content']['suggestions'])} optimizations
-- Internal links: {len(self.optimized_content['internal_links'])} suggestions
-- Readability: {self.optimized_content['readability_improvements']['readability_score']} score
+- Title optimization: {optimized_content['seo_optimized_title']['suggestions'][:1]}
+- Meta description: {optimized_content['optimized_meta_description']['suggestions'][:1]}
+- Keyword density: {len(optimized_content['keyword_optimized_content']['suggestions'])} optimizations
+- Internal links: {len(optimized_content['internal_links'])} suggestions
+- Readability: {optimized_content['readability_improvements']['readability_score']} score
 
 Performance Predictions:
-- Search ranking potential: {self.optimized_content['performance_predictions']['search_ranking_potential']}
-- Estimated traffic: {self.optimized_content['performance_predictions']['estimated_organic_traffic']}
+- Search ranking potential: {optimized_content['performance_predictions']['search_ranking_potential']}
+- Estimated traffic: {optimized_content['performance_predictions']['estimated_organic_traffic']}
         """
         
         return report.strip()
@@ -483,7 +799,7 @@ Performance Predictions:
         Export the final optimized content
         """
         if not self.optimized_content:
-            print("No optimized content to export")
+            logger.warning("No optimized content to export")
             return
         
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -494,5 +810,5 @@ Performance Predictions:
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write(self.generate_optimization_report())
         
-        print(f"Optimized content exported to {filepath}")
-        print(f"Optimization report exported to {report_path}")
\ No newline at end of file
+        logger.info("Optimized content exported to %s", filepath)
+        logger.info("Optimization report exported to %s", report_path)
\ No newline at end of file
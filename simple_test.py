@@ -4,6 +4,7 @@ Simple test for the multiagent blog writing system
 """
 
 from blog_team_coordinator import BlogTeamCoordinator
+from blog_logging import configure_console_logging
 
 def simple_test():
     print("Testing Multiagent Blog Writing System")
@@ -11,7 +12,7 @@ def simple_test():
     
     try:
         # Initialize coordinator
-        coordinator = BlogTeamCoordinator()
+        coordinator = BlogTeamCoordinator(echo_content=True)
         print("Coordinator initialized successfully")
         
         # Create a simple blog post
@@ -27,7 +28,7 @@ def simple_test():
         print(f"Title: {result['final_title']}")
         print(f"Word Count: {result['word_count']}")
         print(f"SEO Score: {result['seo_score']}%")
-        print(f"Output Directory: blog_output/{result['workflow_id']}/")
+        print(f"Output Directory: {coordinator.workflow_dir(result['workflow_id'])}/")
         
         # The blog content was already printed by the coordinator
         print("\n[Blog content was displayed above during creation]")
@@ -41,6 +42,7 @@ def simple_test():
         return False
 
 if __name__ == "__main__":
+    configure_console_logging()
     success = simple_test()
     if success:
         print("\nTest completed successfully!")
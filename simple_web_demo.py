@@ -4,6 +4,7 @@ Simple demo for web interface - no unicode characters
 """
 
 from blog_team_coordinator import BlogTeamCoordinator
+from blog_logging import configure_console_logging
 import os
 
 def main():
@@ -29,7 +30,7 @@ def main():
     
     # Show blog page link
     workflow_id = result['workflow_id']
-    blog_page_path = os.path.join("blog_output", workflow_id, "blog_page.html")
+    blog_page_path = os.path.join(coordinator.workflow_dir(workflow_id), "blog_page.html")
     
     if os.path.exists(blog_page_path):
         abs_path = os.path.abspath(blog_page_path)
@@ -57,4 +58,5 @@ def main():
     print(f"\nDemo completed! Ready to launch web interface.")
 
 if __name__ == "__main__":
+    configure_console_logging()
     main()
\ No newline at end of file
@@ -1,9 +1,18 @@
 import streamlit as st
 import os
-import json
-from datetime import datetime
-import time
-from blog_team_coordinator import BlogTeamCoordinator
+from app_services import (get_coordinator, get_job_pool, load_workflow_summary, prepare_bundle,
+                          prepare_file, read_text_file, seo_html, workflow_browser,
+                          workflow_browser_nav)
+
+# Status line shown for each step a job's workflow reports
+JOB_STEP_LABELS = {
+    None: "⏳ Waiting for a worker...",
+    "research": "🔍 Researching the topic...",
+    "content": "✍️ Writing content...",
+    "seo": "🔧 Optimizing for SEO...",
+    "export": "💾 Saving files...",
+    "completed": "✅ Blog created successfully!"
+}
 
 # Configure Streamlit page
 st.set_page_config(
@@ -59,156 +68,55 @@ st.markdown("""
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'coordinator' not in st.session_state:
-        st.session_state.coordinator = BlogTeamCoordinator()
-    if 'current_result' not in st.session_state:
-        st.session_state.current_result = None
-    if 'blog_created' not in st.session_state:
-        st.session_state.blog_created = False
+    # Only IDs are kept per session; the coordinator and summaries are shared (app_services)
+    if 'current_workflow_id' not in st.session_state:
+        st.session_state.current_workflow_id = None
+    if 'job_ids' not in st.session_state:
+        st.session_state.job_ids = []
+    if 'prepared_downloads' not in st.session_state:
+        st.session_state.prepared_downloads = set()
 
-def create_blog_page_file(workflow_id, result):
-    """Create a standalone HTML blog page"""
-    blog_dir = os.path.join("blog_output", workflow_id)
-    blog_page_path = os.path.join(blog_dir, "blog_page.html")
-    
-    # Convert markdown content to HTML
-    content_html = result['final_content'].replace('\n\n', '</p><p>')
-    content_html = content_html.replace('\n', '<br>')
-    content_html = content_html.replace('# ', '<h1>').replace('</p><p><h1>', '</p><h1>')
-    content_html = content_html.replace('## ', '<h2>').replace('</p><p><h2>', '</p><h2>')
-    content_html = content_html.replace('### ', '<h3>').replace('</p><p><h3>', '</p><h3>')
-    content_html = content_html.replace('**', '<strong>').replace('**', '</strong>')
-    content_html = f"<p>{content_html}</p>"
-    
-    # Handle headings properly
-    content_html = content_html.replace('<p><h1>', '<h1>').replace('</p><p>', '</p>\n<p>')
-    content_html = content_html.replace('<p><h2>', '<h2>').replace('<p><h3>', '<h3>')
+def prepare_download(download_key):
+    """Load a download on the next run (files are not read until requested)"""
+    st.session_state.prepared_downloads.add(download_key)
+
+def release_download(download_key):
+    """Stop serving a download once it has been taken"""
+    st.session_state.prepared_downloads.discard(download_key)
+
+@st.fragment(run_every=1)
+def show_jobs():
+    """Progress of this session's queued blogs, polled without rerunning the page"""
+    queue = get_job_pool().queue
+    jobs = queue.get_many(st.session_state.job_ids)
     
-    html_template = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{result['final_title']}</title>
-        <meta name="description" content="{result['final_meta_description']}">
-        <meta name="robots" content="index, follow">
+    for job_id in list(st.session_state.job_ids):
+        job = jobs.get(job_id)
+        if job is None:
+            st.session_state.job_ids.remove(job_id)
+            continue
         
-        <!-- Open Graph / Facebook -->
-        <meta property="og:type" content="article">
-        <meta property="og:title" content="{result['final_title']}">
-        <meta property="og:description" content="{result['final_meta_description']}">
+        topic = job['params']['topic']
+        if job['status'] == 'completed':
+            # Show the finished blog in the main area
+            st.session_state.job_ids.remove(job_id)
+            st.session_state.current_workflow_id = job['workflow_id']
+            st.rerun()
         
-        <!-- Twitter -->
-        <meta property="twitter:card" content="summary_large_image">
-        <meta property="twitter:title" content="{result['final_title']}">
-        <meta property="twitter:description" content="{result['final_meta_description']}">
+        if job['status'] == 'failed':
+            st.error(f"❌ Error generating blog \"{topic}\": {job['error']}")
+            if st.button("Dismiss", key=f"dismiss_{job_id}"):
+                st.session_state.job_ids.remove(job_id)
+                st.rerun()
+            continue
         
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 2rem;
-                background-color: #f8f9fa;
-            }}
-            
-            .article-container {{
-                background: white;
-                padding: 3rem;
-                border-radius: 8px;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            }}
-            
-            h1 {{
-                color: #2c3e50;
-                border-bottom: 3px solid #3498db;
-                padding-bottom: 0.5rem;
-                margin-bottom: 2rem;
-            }}
-            
-            h2 {{
-                color: #34495e;
-                margin-top: 2rem;
-                margin-bottom: 1rem;
-                border-left: 4px solid #3498db;
-                padding-left: 1rem;
-            }}
-            
-            h3 {{
-                color: #2c3e50;
-                margin-top: 1.5rem;
-            }}
-            
-            p {{
-                margin-bottom: 1.5rem;
-                text-align: justify;
-            }}
-            
-            strong {{
-                color: #2c3e50;
-                font-weight: 600;
-            }}
-            
-            .meta-info {{
-                background: #ecf0f1;
-                padding: 1rem;
-                border-radius: 4px;
-                margin-bottom: 2rem;
-                font-size: 0.9rem;
-                color: #7f8c8d;
-            }}
-            
-            .meta-info span {{
-                margin-right: 2rem;
-            }}
-            
-            .generated-by {{
-                text-align: center;
-                margin-top: 3rem;
-                padding-top: 2rem;
-                border-top: 1px solid #ecf0f1;
-                color: #95a5a6;
-                font-size: 0.8rem;
-            }}
-            
-            @media (max-width: 768px) {{
-                body {{
-                    padding: 1rem;
-                }}
-                
-                .article-container {{
-                    padding: 1.5rem;
-                }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="article-container">
-            <div class="meta-info">
-                <span><strong>Word Count:</strong> {result['word_count']} words</span>
-                <span><strong>SEO Score:</strong> {result['seo_score']}%</span>
-                <span><strong>Target Audience:</strong> {result['target_audience']}</span>
-                <span><strong>Created:</strong> {datetime.now().strftime('%B %d, %Y')}</span>
-            </div>
-            
-            {content_html}
-            
-            <div class="generated-by">
-                <p>Generated by AI Blog Writing Team<br>
-                Powered by Multi-Agent Content Creation System</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    with open(blog_page_path, 'w', encoding='utf-8') as f:
-        f.write(html_template)
-    
-    return blog_page_path
+        st.write(f"**{topic}**")
+        if job['status'] == 'queued':
+            ahead = queue.position(job_id)
+            st.progress(0, text=f"⏳ Queued ({ahead} ahead)" if ahead else JOB_STEP_LABELS[None])
+        else:
+            fraction = job['completed_steps'] / job['total_steps'] if job['total_steps'] else 0
+            st.progress(fraction, text=JOB_STEP_LABELS.get(job['step'], job['step']))
 
 def main():
     initialize_session_state()
@@ -266,58 +174,25 @@ def main():
                 if custom_keywords:
                     keywords = [kw.strip() for kw in custom_keywords.split(",") if kw.strip()]
                 
-                # Create progress indicators
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                try:
-                    # Update progress
-                    status_text.text("🔍 Starting research phase...")
-                    progress_bar.progress(10)
-                    time.sleep(0.5)
-                    
-                    status_text.text("📊 Gathering trends and data...")
-                    progress_bar.progress(30)
-                    time.sleep(0.5)
-                    
-                    status_text.text("✍️ Writing content...")
-                    progress_bar.progress(60)
-                    time.sleep(0.5)
-                    
-                    status_text.text("🔧 Optimizing for SEO...")
-                    progress_bar.progress(80)
-                    
-                    # Generate the blog
-                    result = st.session_state.coordinator.create_blog_post(
-                        topic=topic,
-                        target_audience=target_audience.lower(),
-                        tone=tone.lower(),
-                        word_count=word_count,
-                        custom_keywords=keywords
-                    )
-                    
-                    progress_bar.progress(100)
-                    status_text.text("✅ Blog created successfully!")
-                    
-                    # Store result in session state
-                    st.session_state.current_result = result
-                    st.session_state.blog_created = True
-                    
-                    # Create blog page file
-                    blog_page_path = create_blog_page_file(result['workflow_id'], result)
-                    
-                    st.success("🎉 Blog generated successfully!")
-                    time.sleep(1)
-                    st.rerun()
-                    
-                except Exception as e:
-                    st.error(f"❌ Error generating blog: {str(e)}")
-                    progress_bar.empty()
-                    status_text.empty()
+                # Generated by a worker process; progress is polled below
+                job_id = get_job_pool().queue.enqueue({
+                    "topic": topic,
+                    "target_audience": target_audience.lower(),
+                    "tone": tone.lower(),
+                    "word_count": word_count,
+                    "custom_keywords": keywords
+                })
+                st.session_state.job_ids.append(job_id)
+        
+        if st.session_state.job_ids:
+            show_jobs()
     
     # Main content area
-    if st.session_state.blog_created and st.session_state.current_result:
-        result = st.session_state.current_result
+    result = None
+    if st.session_state.current_workflow_id:
+        result = load_workflow_summary(st.session_state.current_workflow_id)
+    
+    if result:
         
         # Success message and metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -359,21 +234,10 @@ def main():
                 )
             
             with col2:
-                # Create HTML version for download
-                html_content = f"""
-                <html>
-                <head>
-                    <title>{result['final_title']}</title>
-                    <meta name="description" content="{result['final_meta_description']}">
-                </head>
-                <body>
-                    {result['final_content'].replace('\n', '<br>')}
-                </body>
-                </html>
-                """
+                # Rendered once per version of the post, then shared by every rerun and session
                 st.download_button(
                     "⬇️ Download HTML",
-                    html_content,
+                    seo_html(result['workflow_id']) or "",
                     file_name=f"{result['topic'].replace(' ', '_').lower()}.html",
                     mime="text/html"
                 )
@@ -382,9 +246,13 @@ def main():
             st.subheader("Standalone Blog Page")
             
             # Generate blog page link
-            blog_page_path = os.path.join("blog_output", result['workflow_id'], "blog_page.html")
+            try:
+                # Rendered on first view when the coordinator runs in lazy mode
+                blog_page_path = get_coordinator().get_artifact(result['workflow_id'], "blog_page")
+            except FileNotFoundError:
+                blog_page_path = None
             
-            if os.path.exists(blog_page_path):
+            if blog_page_path:
                 # Get the absolute path for the blog page
                 abs_path = os.path.abspath(blog_page_path)
                 file_url = f"file:///{abs_path.replace(os.sep, '/')}"
@@ -422,9 +290,8 @@ def main():
                 # Show preview
                 st.subheader("📱 Blog Page Preview")
                 
-                # Read and display the HTML content in an iframe-like manner
-                with open(blog_page_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
+                # Display the HTML content in an iframe-like manner (read once per version of the file)
+                html_content = read_text_file(blog_page_path)
                 
                 st.components.v1.html(html_content, height=600, scrolling=True)
             
@@ -474,47 +341,69 @@ def main():
         with tab4:
             st.subheader("📁 Generated Files")
             
-            workflow_dir = os.path.join("blog_output", result['workflow_id'])
+            coordinator = get_coordinator()
+            workflow_id = result['workflow_id']
+            files = coordinator.workflow_files(workflow_id)
             
-            if os.path.exists(workflow_dir):
-                st.success(f"All files saved to: `{workflow_dir}`")
-                
-                # List all files
-                files = os.listdir(workflow_dir)
+            if files:
+                st.success(f"All files saved to: `{coordinator.workflow_dir(workflow_id)}`")
                 
+                # Only names and sizes are listed; a file is read when its download is requested
                 for file in files:
-                    file_path = os.path.join(workflow_dir, file)
-                    file_size = os.path.getsize(file_path)
+                    download_key = f"{workflow_id}/{file['name']}"
                     
                     col1, col2, col3 = st.columns([3, 1, 1])
                     
                     with col1:
-                        st.write(f"📄 {file}")
+                        st.write(f"📄 {file['name']}")
                     
                     with col2:
-                        st.write(f"{file_size:,} bytes")
+                        st.write(f"{file['size']:,} bytes")
                     
                     with col3:
-                        if file.endswith(('.md', '.txt', '.json', '.html')):
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                file_content = f.read()
-                            
-                            st.download_button(
-                                "⬇️",
-                                file_content,
-                                file_name=file,
-                                key=f"download_{file}"
-                            )
+                        if download_key in st.session_state.prepared_downloads:
+                            # Handed over as an open file, like the bundle below
+                            with open(prepare_file(workflow_id, file['name']), 'rb') as download:
+                                st.download_button(
+                                    "⬇️",
+                                    download,
+                                    file_name=file['name'],
+                                    key=f"download_{download_key}",
+                                    on_click=release_download,
+                                    args=(download_key,)
+                                )
+                        else:
+                            st.button("📥", key=f"prepare_{download_key}", help="Prepare download",
+                                      on_click=prepare_download, args=(download_key,))
+                
+                # Whole workflow as one ZIP, streamed to disk when requested
+                st.markdown("---")
+                bundle_key = f"{workflow_id}/bundle.zip"
+                if bundle_key in st.session_state.prepared_downloads:
+                    with open(prepare_bundle(workflow_id), 'rb') as bundle:
+                        st.download_button(
+                            "⬇️ Download ZIP bundle",
+                            bundle,
+                            file_name=f"{workflow_id}.zip",
+                            mime="application/zip",
+                            key=f"download_{bundle_key}",
+                            on_click=release_download,
+                            args=(bundle_key,)
+                        )
+                else:
+                    st.button("📦 Prepare ZIP bundle", key=f"prepare_{bundle_key}",
+                              on_click=prepare_download, args=(bundle_key,))
     
     # Existing workflows section
     st.header("📚 Existing Blog Posts")
     
-    workflows = st.session_state.coordinator.list_workflows()
+    # One page of posts per rerun, searched and sorted in the catalog
+    workflows, total = workflow_browser("browse", page_size=10)
     
     if workflows:
-        st.write(f"Found {len(workflows)} existing blog posts:")
+        st.write(f"Found {total:,} existing blog posts:")
         
-        for i, workflow in enumerate(workflows):
+        for workflow in workflows:
             with st.expander(f"📖 {workflow['topic']} (SEO: {workflow['seo_score']}%)"):
                 col1, col2, col3 = st.columns(3)
                 
@@ -528,18 +417,14 @@ def main():
                     st.write(f"**ID:** {workflow['workflow_id'][:20]}...")
                 
                 with col3:
-                    if st.button(f"View Content", key=f"view_{i}"):
-                        # Load and display this workflow's content
-                        workflow_dir = os.path.join("blog_output", workflow['workflow_id'])
-                        summary_file = os.path.join(workflow_dir, "workflow_summary.json")
-                        
-                        if os.path.exists(summary_file):
-                            with open(summary_file, 'r', encoding='utf-8') as f:
-                                workflow_data = json.load(f)
-                            
-                            st.session_state.current_result = workflow_data
-                            st.session_state.blog_created = True
-                            st.rerun()
+                    if st.button(f"View Content", key=f"view_{workflow['workflow_id']}"):
+                        # Display this workflow's content
+                        st.session_state.current_workflow_id = workflow['workflow_id']
+                        st.rerun()
+        
+        workflow_browser_nav("browse", workflows, total)
+    elif st.session_state.get("browse_search"):
+        st.info("No blog posts match your search.")
     else:
         st.info("No existing blog posts found. Create your first blog using the sidebar!")
     
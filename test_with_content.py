@@ -4,12 +4,13 @@ Test script that shows blog content in the output
 """
 
 from blog_team_coordinator import BlogTeamCoordinator
+from blog_logging import configure_console_logging
 
 def test_with_content_printing():
     print("MULTIAGENT BLOG WRITING SYSTEM - WITH CONTENT OUTPUT")
     print("=" * 60)
     
-    coordinator = BlogTeamCoordinator()
+    coordinator = BlogTeamCoordinator(echo_content=True)
     
     # Create a blog post - content will be printed automatically
     print("\nCreating blog post about 'Web Development Best Practices'...")
@@ -22,7 +23,7 @@ def test_with_content_printing():
         custom_keywords=["web development", "best practices", "coding"]
     )
     
-    print(f"\nWorkflow completed! Files saved to: blog_output/{result['workflow_id']}/")
+    print(f"\nWorkflow completed! Files saved to: {coordinator.workflow_dir(result['workflow_id'])}/")
     
     # You can also print content from existing workflows
     print("\n" + "="*60)
@@ -61,5 +62,6 @@ def test_individual_content_access():
         print("Need at least 2 workflows to demonstrate individual access")
 
 if __name__ == "__main__":
+    configure_console_logging()
     test_with_content_printing()
     test_individual_content_access()
\ No newline at end of file
@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+import pytest
+
+from api_server import ApiServer
+from workflow_catalog import CATALOG_FILENAME, WorkflowCatalog
+
+def exchange(output_dir, requests, max_queue=100):
+    """
+    Start a server without workers, send each (method, path, body) in turn
+    and return (status, headers, body) per request
+    """
+    async def send(port, method, path, body):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        data = body if isinstance(body, bytes) else json.dumps(body).encode() if body is not None else b""
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+                     f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+        raw = await reader.read()
+        writer.close()
+        head, _, payload = raw.partition(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        headers = {name.lower(): value.strip()
+                   for name, _, value in (line.partition(":") for line in header_lines)}
+        return int(status_line.split()[1]), headers, payload
+
+    async def main():
+        server = ApiServer(str(output_dir), start_workers=False, max_queue=max_queue)
+        await server.start("127.0.0.1", 0)
+        try:
+            port = server.addresses[0][1]
+            return [await send(port, *request) for request in requests]
+        finally:
+            await server.stop()
+
+    return asyncio.run(main())
+
+def status_of(output_dir, method, path, body=None):
+    return exchange(output_dir, [(method, path, body)])[0][0]
+
+@pytest.mark.parametrize("body", [
+    b"{not json",
+    ["a", "list"],
+    {},
+    {"topic": ""},
+    {"topic": "x", "word_count": "abc"},
+    {"topic": "x", "word_count": True},
+    {"topic": "x", "word_count": -3},
+    {"topic": "x", "custom_keywords": "notalist"},
+    {"topic": "x", "custom_keywords": ["ok", 3]},
+    {"topic": "x", "colour": "blue"}
+])
+def test_invalid_job_bodies_are_rejected(tmp_path, body):
+    status, _, payload = exchange(tmp_path, [("POST", "/jobs", body)])[0]
+    assert status == 400
+    assert json.loads(payload)["error"]
+
+def test_valid_job_is_queued_and_visible(tmp_path):
+    body = {"topic": "Docker", "word_count": 900, "custom_keywords": ["containers"]}
+    (status, headers, payload), (job_status, _, job) = exchange(
+        tmp_path, [("POST", "/jobs", body), ("GET", "/jobs/1", None)])
+    assert status == 202
+    assert headers["location"] == "/jobs/1"
+    assert json.loads(payload)["job_id"] == 1
+    assert job_status == 200
+    assert json.loads(job)["status"] == "queued"
+
+def test_full_queue_answers_429(tmp_path):
+    responses = exchange(tmp_path, [("POST", "/jobs", {"topic": f"t{n}"}) for n in range(3)],
+                         max_queue=2)
+    assert [status for status, _, _ in responses] == [202, 202, 429]
+    assert int(responses[2][1]["retry-after"]) > 0
+
+@pytest.mark.parametrize("path", [
+    "/jobs/1",
+    "/jobs/9223372036854775807",
+    "/jobs/99999999999999999999999",
+    "/jobs/abc",
+    "/jobs/-1",
+    "/nothing/here",
+    "/workflows/missing",
+    "/workflows/missing/status",
+    "/workflows/missing/artifacts/summary",
+    "/workflows/missing/artifacts/secrets",
+    "/workflows/missing/files/summary.json",
+    "/workflows/missing/bundle.zip",
+    "/workflows/../../etc/passwd",
+    "/workflows/%2e%2e/status"
+])
+def test_unknown_resources_answer_404(tmp_path, path):
+    assert status_of(tmp_path, "GET", path) == 404
+
+def test_wrong_method_answers_405(tmp_path):
+    status, headers, _ = exchange(tmp_path, [("DELETE", "/jobs", None)])[0]
+    assert status == 405
+    assert headers["allow"] == "POST"
+    assert status_of(tmp_path, "POST", "/health") == 405
+
+@pytest.mark.parametrize("query", [
+    "limit=abc",
+    "limit=0",
+    "offset=-1",
+    "sort_by=workflow_id",
+    "after=not-a-cursor",
+    "sort_by=topic&after=WyJzZW9fc2NvcmUiLDEsIngiXQ"
+])
+def test_invalid_listing_queries_answer_400(tmp_path, query):
+    assert status_of(tmp_path, "GET", f"/workflows?{query}") == 400
+
+def test_health_and_empty_listing(tmp_path):
+    (health, _, payload), (listing, _, _) = exchange(
+        tmp_path, [("GET", "/health", None), ("GET", "/workflows", None)])
+    assert health == 200
+    assert json.loads(payload)["status"] == "ok"
+    assert listing == 200
+
+def test_cursor_pages_reach_posts_without_a_score(tmp_path):
+    catalog = WorkflowCatalog(str(tmp_path / CATALOG_FILENAME))
+    catalog.upsert_many({
+        "workflow_id": f"w{index:02d}",
+        "topic": "Docker",
+        "creation_date": "2025-01-01T00:00:00",
+        "seo_score": None if index % 3 == 0 else float(index % 5),
+        "word_count": 600
+    } for index in range(12))
+
+    seen, path = [], "/workflows?sort_by=seo_score&limit=5"
+    while path:
+        status, _, payload = exchange(tmp_path, [("GET", path, None)])[0]
+        assert status == 200
+        page = json.loads(payload)
+        seen += [row["workflow_id"] for row in page["workflows"]]
+        path = f"/workflows?sort_by=seo_score&limit=5&after={page['next']}" if page["next"] else None
+    assert page["total"] == 12
+    assert sorted(seen) == [f"w{index:02d}" for index in range(12)]
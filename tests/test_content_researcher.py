@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from blog_team_coordinator import BlogTeamCoordinator
+from content_researcher_agent import ContentResearcherAgent
+
+SOURCES = [name for name, _, _ in ContentResearcherAgent()._research_sources("x", "general")]
+SOURCE_METHODS = {name: func.__name__ for name, func, _ in
+                  ContentResearcherAgent()._research_sources("x", "general")}
+
+def fail(*args):
+    raise RuntimeError("source down")
+
+def hang(*args):
+    time.sleep(0.5)
+    return []
+
+def broken_coordinator(tmp_path, source, behaviour):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    researcher = coordinator.researcher
+    setattr(researcher, SOURCE_METHODS[source], behaviour)
+    researcher.source_timeouts[source] = 0.05
+    return coordinator
+
+@pytest.mark.parametrize("behaviour", [fail, hang])
+@pytest.mark.parametrize("source", SOURCES)
+def test_workflow_completes_without_any_one_source(tmp_path, source, behaviour):
+    coordinator = broken_coordinator(tmp_path, source, behaviour)
+    result = coordinator.create_blog_post("Docker", word_count=600)
+
+    assert result["final_content"]
+    assert coordinator.get_workflow_status(result["workflow_id"])["status"] == "completed"
+    assert coordinator.incomplete_workflows() == []
+
+@pytest.mark.parametrize("behaviour", [fail, hang])
+@pytest.mark.parametrize("source", SOURCES)
+def test_async_workflow_completes_without_any_one_source(tmp_path, source, behaviour):
+    coordinator = broken_coordinator(tmp_path, source, behaviour)
+    result = asyncio.run(coordinator.acreate_blog_post("Docker", word_count=600))
+
+    assert result["final_content"]
+    assert coordinator.get_workflow_status(result["workflow_id"])["status"] == "completed"
+
+def test_failed_and_overdue_sources_are_reported():
+    researcher = ContentResearcherAgent(source_timeouts={"trends": 0.05})
+    researcher._analyze_trends = hang
+    researcher._gather_statistics = fail
+    research = researcher.research_topic("Docker")
+
+    assert set(research["source_errors"]) == {"trends", "statistics"}
+    assert research["source_errors"]["trends"].startswith("timed out")
+    assert research["trends"] == [] and research["statistics"] == []
+    assert research["keywords"]
+
+def test_threads_can_share_a_researcher_through_timeouts():
+    researcher = ContentResearcherAgent(source_timeouts={"trends": 0.01})
+    researcher._analyze_trends = lambda topic: time.sleep(0.02) or []
+    errors = []
+
+    def run():
+        try:
+            for _ in range(10):
+                researcher.research_topic("Docker")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
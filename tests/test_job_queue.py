@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from blog_team_coordinator import BlogTeamCoordinator
+from job_queue import JOBS_FILENAME, JobQueue, run_job, validate_job_params
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / JOBS_FILENAME), max_attempts=2)
+
+def dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"topic": "  "},
+    {"topic": "x", "unknown": 1},
+    {"topic": "x", "word_count": "abc"},
+    {"topic": "x", "word_count": 0},
+    {"topic": "x", "word_count": True},
+    {"topic": "x", "custom_keywords": "notalist"},
+    {"topic": "x", "custom_keywords": ["ok", 3]},
+    {"topic": "x", "tone": 5},
+])
+def test_invalid_params_are_rejected(queue, params):
+    with pytest.raises(ValueError):
+        queue.enqueue(params)
+    assert queue.counts()["queued"] == 0
+
+def test_valid_params():
+    validate_job_params({"topic": "x", "word_count": 900, "custom_keywords": ["a", "b"],
+                         "tone": "formal", "target_audience": None})
+
+def test_claims_oldest_first(queue):
+    first = queue.enqueue({"topic": "first"})
+    second = queue.enqueue({"topic": "second"})
+    assert queue.queued_count() == 2
+    assert queue.position(second) == 1
+
+    job = queue.claim(os.getpid())
+    assert job["job_id"] == first and job["status"] == "running" and job["attempts"] == 1
+    assert queue.get(first)["worker_pid"] == os.getpid()
+    assert queue.claim(os.getpid())["job_id"] == second
+    assert queue.claim(os.getpid()) is None
+    assert queue.counts() == {"queued": 0, "running": 2, "completed": 0, "failed": 0}
+
+def test_concurrent_claims_never_share_a_job(queue):
+    job_ids = [queue.enqueue({"topic": f"topic {index}"}) for index in range(40)]
+    claimed = []
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            job = queue.claim(os.getpid())
+            if job is None:
+                return
+            with lock:
+                claimed.append(job["job_id"])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == job_ids
+
+def test_orphans_are_requeued_then_failed(queue):
+    job_id = queue.enqueue({"topic": "crashes its worker"})
+    pid = dead_pid()
+
+    queue.claim(pid)
+    assert queue.requeue_orphans() == 1
+    assert queue.get(job_id)["status"] == "queued"
+
+    # Second attempt is the last one allowed
+    assert queue.claim(pid)["attempts"] == 2
+    assert queue.requeue_orphans() == 0
+    job = queue.get(job_id)
+    assert job["status"] == "failed" and "2 attempts" in job["error"]
+
+def test_jobs_of_live_workers_stay_running(queue):
+    job_id = queue.enqueue({"topic": "x"})
+    queue.claim(os.getpid())
+    assert queue.requeue_orphans() == 0
+    assert queue.get(job_id)["status"] == "running"
+
+def test_existing_queues_gain_the_attempts_column(tmp_path):
+    db_path = str(tmp_path / JOBS_FILENAME)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE jobs (job_id INTEGER PRIMARY KEY AUTOINCREMENT, params TEXT NOT NULL, "
+                     "status TEXT NOT NULL, workflow_id TEXT, step TEXT, completed_steps INTEGER NOT NULL "
+                     "DEFAULT 0, total_steps INTEGER, error TEXT, worker_pid INTEGER, enqueued_at TEXT "
+                     "NOT NULL, started_at TEXT, finished_at TEXT)")
+    queue = JobQueue(db_path)
+    queue.enqueue({"topic": "x"})
+    assert queue.claim(os.getpid())["attempts"] == 1
+
+def test_run_job_records_progress_and_result(tmp_path, queue):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    job_id = queue.enqueue({"topic": "Docker", "word_count": 600})
+    run_job(coordinator, queue, queue.claim(os.getpid()))
+
+    job = queue.get(job_id)
+    assert job["status"] == "completed" and job["step"] == "completed"
+    assert job["completed_steps"] == job["total_steps"]
+    assert coordinator.load_workflow_summary(job["workflow_id"]) is not None
+
+def test_run_job_resumes_a_started_workflow(tmp_path, queue, monkeypatch):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    job_id = queue.enqueue({"topic": "Docker", "word_count": 600})
+
+    original = coordinator.seo_editor.optimize_content
+    monkeypatch.setattr(coordinator.seo_editor, "optimize_content",
+                        lambda *args: (_ for _ in ()).throw(RuntimeError("worker died")))
+    run_job(coordinator, queue, queue.claim(os.getpid()))
+    failed = queue.get(job_id)
+    assert failed["status"] == "failed" and failed["workflow_id"]
+
+    # Claimed again (as after a requeue): the same workflow is finished, not restarted
+    monkeypatch.setattr(coordinator.seo_editor, "optimize_content", original)
+    with queue._connect() as conn:
+        conn.execute("UPDATE jobs SET status = 'queued' WHERE job_id = ?", (job_id,))
+    run_job(coordinator, queue, queue.claim(os.getpid()))
+    job = queue.get(job_id)
+    assert job["status"] == "completed" and job["workflow_id"] == failed["workflow_id"]
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+from keyword_matcher import KeywordMatcher, keyword_variants
+from text_analysis import analyze_text
+
+TEXTS = [
+    "Docker makes docker-compose easy. DOCKER! dockers, dockerfile and docker.",
+    "Machine learning: machine-learning, machine  learning and machine learnings.",
+    "aaaa aa aaa aa-aa",
+    "C++ tips: c++, c++11 and (c++) beat c+ and +c++.",
+    "AI, ai-driven AI marketing; ai marketing automation ai_marketing",
+    "",
+]
+
+KEYWORD_SETS = [
+    ["docker", "docker-compose", "dockerfile"],
+    ["machine learning", "learning", "machine-learning"],
+    ["aa", "aaa", "a"],
+    ["c++", "+c", "c++11"],
+    ["ai", "ai marketing", "marketing", "automation", "ai_marketing"],
+]
+
+def findall_count(pattern: str, text: str) -> int:
+    return len(re.findall(rf'\b{re.escape(pattern)}\b', text))
+
+@pytest.mark.parametrize("keywords", KEYWORD_SETS)
+@pytest.mark.parametrize("text", TEXTS)
+def test_counts_match_re_findall(text, keywords):
+    lowered = text.lower()
+    hits = KeywordMatcher(keywords, include_variants=False).search(lowered)
+    for keyword in keywords:
+        assert hits[keyword].count == findall_count(keyword, lowered), keyword
+
+@pytest.mark.parametrize("keywords", KEYWORD_SETS)
+@pytest.mark.parametrize("text", TEXTS)
+def test_positions_match_re_finditer(text, keywords):
+    lowered = text.lower()
+    hits = KeywordMatcher(keywords, include_variants=False).search(lowered)
+    for keyword in keywords:
+        expected = [match.span() for match in re.finditer(rf'\b{re.escape(keyword)}\b', lowered)]
+        assert hits[keyword].positions == expected, keyword
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_variants_match_re_findall(text):
+    lowered = text.lower()
+    keywords = ["docker", "machine learning", "ai marketing"]
+    hits = KeywordMatcher(keywords).search(lowered)
+    for keyword in keywords:
+        expected = sum(findall_count(variant, lowered) for variant in keyword_variants(keyword))
+        assert hits[keyword].variant_count == expected, keyword
+        # Variants never count as exact matches
+        assert hits[keyword].count == findall_count(keyword, lowered)
+
+def test_keyword_variants():
+    assert keyword_variants("Data-Driven") == [
+        "data-drivens", "data-drivenes", "data driven", "data drivens", "data drivenes"]
+    assert "docker" not in keyword_variants("docker")
+
+def test_duplicate_and_empty_keywords():
+    matcher = KeywordMatcher(["docker", "docker", ""])
+    assert matcher.keywords == ["docker", ""]
+    assert matcher.count("docker and docker") == {"docker": 2, "": 0}
+
+def test_text_stats_reuse_matcher_counts():
+    stats = analyze_text("# Docker Guide\n\nDocker runs containers. Use docker daily.")
+    hits = stats.match_keywords(["docker", "containers"])
+    assert stats.count_phrase("docker") == hits["docker"].count == 3
+    assert stats.count_phrase("containers") == 1
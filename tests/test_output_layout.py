@@ -0,0 +1,30 @@
+import os
+
+from output_layout import (LOOKUP_ONLY_LAYOUTS, get_layout, iter_workflow_dirs, migrate,
+                           resolve_workflow_dir)
+from workflow_ids import new_workflow_id
+
+def make_workflow(directory: str) -> None:
+    os.makedirs(directory)
+    with open(os.path.join(directory, "workflow_summary.json"), 'w') as f:
+        f.write("{}")
+
+def test_id_prefix_leaves_cover_about_eight_seconds():
+    workflow_id = new_workflow_id("docker")
+    path = get_layout("id_prefix").path_for("out", workflow_id)
+    assert path == os.path.join("out", workflow_id[:4], workflow_id[4:7], workflow_id)
+
+def test_coarse_leaves_are_found_and_migrated(tmp_path):
+    output_dir = str(tmp_path)
+    layout = get_layout("id_prefix")
+    workflow_ids = [new_workflow_id(f"topic-{index}") for index in range(3)]
+    for workflow_id in workflow_ids:
+        make_workflow(LOOKUP_ONLY_LAYOUTS[0].path_for(output_dir, workflow_id))
+
+    for workflow_id in workflow_ids:
+        found = resolve_workflow_dir(output_dir, workflow_id, layout)
+        assert found == LOOKUP_ONLY_LAYOUTS[0].path_for(output_dir, workflow_id)
+
+    assert migrate(output_dir, "id_prefix")["moved"] == 3
+    assert sorted(path for _, path in iter_workflow_dirs(output_dir)) == \
+        sorted(layout.path_for(output_dir, workflow_id) for workflow_id in workflow_ids)
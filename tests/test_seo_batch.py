@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from content_writer_agent import ContentWriterAgent
+from content_researcher_agent import ContentResearcherAgent
+from seo_editor_agent import SEOEditorAgent, np
+
+KEYWORD_SETS = [
+    [],
+    ["docker"],
+    ["Docker", "containers"],
+    ["ai marketing", "automation", "AI"],
+    ["kubernetes", "docker compose", "devops", "c++"],
+    ["not present anywhere"]
+]
+
+WORDS = ["docker", "Docker", "containers", "ai", "marketing", "AI marketing", "automation",
+         "dockerfile", "kubernetes", "devops", "c++", "compose", "the", "and", "##", "."]
+
+def random_post(rng: random.Random) -> dict:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(0, 400))]
+    return {
+        "title": " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 8))),
+        "meta_description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 40))),
+        "full_text": " ".join(words),
+        "word_count": rng.choice([len(words), rng.randint(0, 3000)])
+    }
+
+@pytest.fixture(scope="module")
+def posts():
+    rng = random.Random(20)
+    posts = [random_post(rng) for _ in range(200)]
+    # Posts as the pipeline writes them, too
+    researcher, writer = ContentResearcherAgent(), ContentWriterAgent()
+    for topic in ("Docker", "AI Marketing"):
+        posts.append(writer.write_blog_post(researcher.research_topic(topic), "conversational", 600))
+    return posts
+
+@pytest.mark.parametrize("vectorized", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(np is None, reason="numpy not installed"))
+])
+@pytest.mark.parametrize("keywords", KEYWORD_SETS)
+def test_batch_scores_equal_per_post_scores(posts, keywords, vectorized):
+    editor = SEOEditorAgent()
+    expected = [editor._calculate_seo_score(post, keywords) for post in posts]
+    assert editor.score_batch(posts, keywords, vectorized=vectorized) == expected
+
+def test_vectorized_scoring_needs_numpy(monkeypatch):
+    monkeypatch.setattr("seo_editor_agent.np", None)
+    assert SEOEditorAgent().score_batch([], ["docker"]) == []
+    with pytest.raises(RuntimeError):
+        SEOEditorAgent().score_batch([], ["docker"], vectorized=True)
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from workflow_catalog import CATALOG_FILENAME, SORT_COLUMNS, WorkflowCatalog
+
+TOPICS = ["Docker", "docker", "Apple", "apple pie", "Kubernetes", "AI Marketing", "ai marketing"]
+
+def summaries(count: int) -> list:
+    # Few distinct values per column, so every page boundary falls inside
+    # ties, and scores and word counts that are missing (NULL)
+    return [{
+        "workflow_id": f"w{index:04d}",
+        "topic": TOPICS[index % len(TOPICS)],
+        "target_audience": "general",
+        "creation_date": f"2025-01-{index % 5 + 1:02d}T00:00:00",
+        "seo_score": [55.0, None, 70.5, 88.0, None][index % 5],
+        "word_count": [500, 750, None, 1000][index % 4]
+    } for index in range(count)]
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = WorkflowCatalog(str(tmp_path / CATALOG_FILENAME))
+    catalog.upsert_many(summaries(53))
+    return catalog
+
+def keyset_pages(catalog, page_size, **query):
+    rows, after = [], None
+    while True:
+        page = catalog.list(limit=page_size, after=after, **query)
+        if not page:
+            return rows
+        assert len(page) <= page_size
+        rows.extend(page)
+        after = page[-1]
+
+@pytest.mark.parametrize("sort_by", list(SORT_COLUMNS))
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("search", [None, "docker", "marketing"])
+def test_keyset_pages_match_the_full_listing(catalog, sort_by, descending, search):
+    query = {"sort_by": sort_by, "descending": descending, "search": search}
+    everything = catalog.list(**query)
+    assert len(everything) == catalog.count(search)
+    assert keyset_pages(catalog, 4, **query) == everything
+    assert keyset_pages(catalog, 10, **query) == everything
+
+@pytest.mark.parametrize("sort_by", list(SORT_COLUMNS))
+def test_keyset_and_offset_pages_agree(catalog, sort_by):
+    after = None
+    for offset in range(0, 53, 7):
+        by_offset = catalog.list(limit=7, offset=offset, sort_by=sort_by)
+        by_keyset = catalog.list(limit=7, sort_by=sort_by, after=after)
+        assert by_keyset == by_offset
+        after = by_keyset[-1]
+
+def test_topic_sort_ignores_case(catalog):
+    topics = [row["topic"] for row in catalog.list(sort_by="topic", descending=False)]
+    assert topics == sorted(topics, key=str.lower)
+
+def test_null_sort_values_sort_first_ascending_and_last_descending(catalog):
+    scores = [row["seo_score"] for row in catalog.list(sort_by="seo_score")]
+    assert scores.count(None) == 21
+    assert scores[-21:] == [None] * 21
+    scores = [row["seo_score"] for row in catalog.list(sort_by="seo_score", descending=False)]
+    assert scores[:21] == [None] * 21
+
+def test_cursor_needs_a_sort_value(catalog):
+    with pytest.raises(ValueError):
+        catalog.list(limit=5, sort_by="seo_score", after={"workflow_id": "w0001"})
+    with pytest.raises(ValueError):
+        catalog.list(sort_by="unknown")
+
+def test_writes_bump_the_version(catalog):
+    version = catalog.version()
+    catalog.upsert(summaries(1)[0])
+    assert catalog.version() > version
+    version = catalog.version()
+    catalog.remove("w0001")
+    assert catalog.version() > version
+    assert catalog.count() == 52
+
+def test_rebuild_skips_malformed_summaries(tmp_path):
+    output_dir = tmp_path / "blog_output"
+    good = summaries(2)
+    contents = {
+        "w0000": json.dumps(good[0]),
+        "w0001": json.dumps(good[1]),
+        "broken_json": "{",
+        "not_a_dict": json.dumps(["a", "list"]),
+        "no_topic": json.dumps({"workflow_id": "no_topic", "creation_date": "2025-01-01T00:00:00"})
+    }
+    for workflow_id, content in contents.items():
+        (output_dir / workflow_id).mkdir(parents=True)
+        (output_dir / workflow_id / "workflow_summary.json").write_text(content)
+
+    catalog = WorkflowCatalog(str(output_dir / CATALOG_FILENAME))
+    assert catalog.rebuild(str(output_dir)) == 2
+    assert sorted(row["workflow_id"] for row in catalog.list()) == ["w0000", "w0001"]
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from workflow_ids import WorkflowIdGenerator, new_workflow_id, parse_workflow_id
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GENERATE = """
+import sys
+from workflow_ids import new_workflow_id
+sys.stdin.readline()
+print("\\n".join(new_workflow_id("same-topic") for _ in range(2000)))
+"""
+
+@pytest.mark.parametrize("node_id", [None, "7"])
+def test_ids_from_concurrent_processes_never_collide(node_id):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    env.pop("BLOG_NODE_ID", None)
+    if node_id is not None:
+        env["BLOG_NODE_ID"] = node_id
+    workers = [subprocess.Popen([sys.executable, "-c", GENERATE], env=env, text=True,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+               for _ in range(4)]
+    # Release every worker at once, so they all generate within the same milliseconds
+    for worker in workers:
+        worker.stdin.write("go\n")
+        worker.stdin.flush()
+    ids = []
+    for worker in workers:
+        output, _ = worker.communicate()
+        assert worker.returncode == 0
+        ids.extend(output.split())
+    assert len(ids) == 8000
+    assert len(set(ids)) == 8000
+
+def test_configured_node_keeps_the_host_in_the_high_bits(monkeypatch):
+    monkeypatch.setenv("BLOG_NODE_ID", "7")
+    _, node, _ = parse_workflow_id(WorkflowIdGenerator().next_id())
+    assert node >> 16 == 7
+    assert node & 0xFFFF == os.getpid() & 0xFFFF
+
+def test_ids_increase_within_a_process():
+    generator = WorkflowIdGenerator(node=1)
+    ids = [generator.next_id() for _ in range(5000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert new_workflow_id("docker").endswith("_docker")
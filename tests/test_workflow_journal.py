@@ -0,0 +1,182 @@
+import asyncio
+import os
+
+import pytest
+
+from blog_team_coordinator import BlogTeamCoordinator
+from workflow_journal import JOURNAL_FILENAME, WorkflowJournal, fcntl
+
+PARAMS = {"topic": "Docker", "word_count": 600}
+
+def journal_path(tmp_path) -> str:
+    return str(tmp_path / JOURNAL_FILENAME)
+
+def test_replay_builds_workflow_states(tmp_path):
+    journal = WorkflowJournal(journal_path(tmp_path))
+    journal.record_start("a", PARAMS)
+    journal.record_phase_start("a", "research")
+    journal.record_phase_done("a", "research", "research_data.json", "abc")
+    journal.record_phase_start("a", "content")
+    journal.record_phase_failed("a", "content", "RuntimeError: boom")
+    journal.record_start("b", {"topic": "Kubernetes"})
+    journal.close()
+
+    # A new journal (another process, a restart) replays the file
+    replayed = WorkflowJournal(journal_path(tmp_path))
+    state = replayed.workflow_state("a")
+    assert state["params"] == PARAMS
+    assert state["phases"] == {"research": {"file": "research_data.json", "sha256": "abc"}}
+    assert state["status"] == "failed" and state["error"] == "RuntimeError: boom"
+    assert replayed.workflow_state("b")["status"] == "in_progress"
+    assert replayed.workflow_state("unknown") is None
+    assert sorted(replayed.incomplete_workflows()) == ["a", "b"]
+
+def test_phase_start_clears_an_earlier_attempt(tmp_path):
+    journal = WorkflowJournal(journal_path(tmp_path))
+    journal.record_start("a", PARAMS)
+    journal.record_phase_done("a", "research", "research_data.json", "old")
+    journal.record_phase_failed("a", "content", "boom")
+    journal.record_phase_start("a", "research")
+    state = journal.workflow_state("a")
+    assert state["phases"] == {} and state["status"] == "in_progress" and state["error"] is None
+
+def test_events_from_other_journals_are_picked_up(tmp_path):
+    reader = WorkflowJournal(journal_path(tmp_path))
+    writer = WorkflowJournal(journal_path(tmp_path))
+    assert reader.incomplete_workflows() == []
+    writer.record_start("a", PARAMS)
+    assert reader.incomplete_workflows() == ["a"]
+    writer.record_done("a")
+    assert reader.incomplete_workflows() == []
+
+def test_finished_workflows_are_forgotten(tmp_path):
+    journal = WorkflowJournal(journal_path(tmp_path))
+    journal.record_start("a", PARAMS)
+    journal.record_done("a")
+    assert journal.workflow_state("a") is None
+    assert journal.incomplete_workflows() == []
+
+def test_torn_and_corrupt_lines_are_skipped(tmp_path):
+    journal = WorkflowJournal(journal_path(tmp_path))
+    journal.record_start("a", PARAMS)
+    journal.close()
+    with open(journal_path(tmp_path), 'ab') as f:
+        f.write(b'not json\n["a list"]\n{"event": "start", "workflow_id": "b", "par')
+
+    replayed = WorkflowJournal(journal_path(tmp_path))
+    assert replayed.incomplete_workflows() == ["a"]
+    assert [entry["workflow_id"] for entry in replayed.entries()] == ["a"]
+
+@pytest.mark.skipif(fcntl is None, reason="compaction needs fcntl")
+def test_compaction_keeps_only_unfinished_workflows(tmp_path):
+    journal = WorkflowJournal(journal_path(tmp_path))
+    other = WorkflowJournal(journal_path(tmp_path))
+    for index in range(20):
+        workflow_id = f"w{index}"
+        journal.record_start(workflow_id, PARAMS)
+        journal.record_phase_done(workflow_id, "research", "research_data.json", "abc")
+        if index % 5:
+            journal.record_done(workflow_id)
+
+    assert journal.compact() == 16 * 3
+    unfinished = ["w0", "w5", "w10", "w15"]
+    assert sorted(journal.incomplete_workflows()) == sorted(unfinished)
+    assert {entry["workflow_id"] for entry in journal.entries()} == set(unfinished)
+
+    # A journal that still had the old file open appends to the new one
+    other.record_start("late", PARAMS)
+    assert "late" in journal.incomplete_workflows()
+    assert sorted(WorkflowJournal(journal_path(tmp_path)).incomplete_workflows()) == sorted(unfinished + ["late"])
+
+@pytest.mark.skipif(fcntl is None, reason="compaction needs fcntl")
+def test_compaction_runs_once_the_file_is_large(tmp_path):
+    journal = WorkflowJournal(journal_path(tmp_path), sync_every=1, compact_size=2000)
+    for index in range(50):
+        journal.record_start(f"w{index}", PARAMS)
+        journal.record_done(f"w{index}")
+    assert os.path.getsize(journal_path(tmp_path)) < 2000
+
+def fail_once(monkeypatch, agent, method):
+    original = getattr(agent, method)
+    calls = []
+
+    def flaky(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise RuntimeError("interrupted")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(agent, method, flaky)
+    return calls
+
+def test_resume_reuses_saved_phases(tmp_path, monkeypatch):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    fail_once(monkeypatch, coordinator.writer, "write_blog_post")
+    with pytest.raises(RuntimeError):
+        coordinator.create_blog_post("Docker", word_count=600)
+
+    # A fresh coordinator (e.g. after a crash) finds the interrupted workflow
+    resumed_coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    [workflow_id] = resumed_coordinator.incomplete_workflows()
+    status = resumed_coordinator.get_workflow_status(workflow_id)
+    assert status["completed_phases"] == ["research"] and status["status"] == "failed"
+
+    research_calls = []
+    monkeypatch.setattr(resumed_coordinator.researcher, "research_topic",
+                        lambda *args: research_calls.append(args))
+    result = resumed_coordinator.resume_workflow(workflow_id)
+    assert research_calls == []
+    assert result["workflow_id"] == workflow_id
+    assert resumed_coordinator.incomplete_workflows() == []
+    assert resumed_coordinator.get_workflow_status(workflow_id)["status"] == "completed"
+    # Finished workflows are answered from their summary
+    assert resumed_coordinator.resume_workflow(workflow_id)["workflow_id"] == workflow_id
+
+def test_resume_reruns_a_damaged_phase(tmp_path, monkeypatch):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    fail_once(monkeypatch, coordinator.seo_editor, "optimize_content")
+    with pytest.raises(RuntimeError):
+        coordinator.create_blog_post("Docker", word_count=600)
+    [workflow_id] = coordinator.incomplete_workflows()
+
+    # Tamper with the saved content record: it and every later phase run again
+    with open(os.path.join(coordinator.workflow_dir(workflow_id), "content_data.json"), 'a') as f:
+        f.write(" ")
+    writer_calls = []
+    original = coordinator.writer.write_blog_post
+    monkeypatch.setattr(coordinator.writer, "write_blog_post",
+                        lambda *args: writer_calls.append(args) or original(*args))
+    coordinator.resume_workflow(workflow_id)
+    assert len(writer_calls) == 1
+    assert coordinator.get_workflow_status(workflow_id)["status"] == "completed"
+
+def test_async_workflows_are_journaled(tmp_path):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+
+    async def run():
+        return await asyncio.gather(*(coordinator.acreate_blog_post(f"Topic {index}", word_count=600)
+                                      for index in range(3)))
+
+    results = asyncio.run(run())
+    assert coordinator.incomplete_workflows() == []
+    for result in results:
+        assert coordinator.get_workflow_status(result["workflow_id"])["status"] == "completed"
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_failed_export_is_journaled_and_resumable(tmp_path, monkeypatch, use_async):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    fail_once(monkeypatch, coordinator, "_export_complete_workflow")
+    with pytest.raises(RuntimeError):
+        if use_async:
+            asyncio.run(coordinator.acreate_blog_post("Docker", word_count=600))
+        else:
+            coordinator.create_blog_post("Docker", word_count=600)
+
+    [workflow_id] = coordinator.incomplete_workflows()
+    status = coordinator.get_workflow_status(workflow_id)
+    assert status["status"] == "failed" and status["error"] == "RuntimeError: interrupted"
+    assert status["completed_phases"] == ["research", "content", "seo"]
+
+    coordinator.resume_workflow(workflow_id)
+    assert coordinator.incomplete_workflows() == []
+    assert coordinator.get_workflow_status(workflow_id)["status"] == "completed"
@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+
+from blog_team_coordinator import BlogTeamCoordinator
+from workflow_pack import (COMPRESS_MIN, FLAG_COMPRESSED, PackReader, convert_tree, encode_pack,
+                           load_pack, read_pack_field, write_pack, zstandard)
+
+RECORD = {
+    "workflow_id": "06gmpbw2web8y2p80000_docker",
+    "topic": "Docker for Beginners",
+    "seo_score": 87.5,
+    "word_count": 1523,
+    "large_int": 2 ** 70,
+    "negative": -42,
+    "published": False,
+    "reviewed": True,
+    "missing": None,
+    "final_content": "# Docker\n\n" + "Containers package apps — ünïcödé too. " * 200,
+    "keywords": [{"keyword": "docker", "density": 1.2}, {"keyword": "containers"}],
+    "metrics": {"spans": {"seo": {"calls": 1}}, "empty": {}},
+}
+
+COMPRESSIONS = [None, "gzip", pytest.param("zstd", marks=pytest.mark.skipif(
+    zstandard is None, reason="zstandard not installed"))]
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_round_trip(tmp_path, compression):
+    path = tmp_path / "record.pack"
+    write_pack(str(path), RECORD, compression)
+    assert load_pack(str(path)) == RECORD
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_single_field_reads(tmp_path, compression):
+    path = tmp_path / "record.pack"
+    write_pack(str(path), RECORD, compression)
+    assert read_pack_field(str(path), "seo_score") == 87.5
+    assert read_pack_field(str(path), "missing", "default") is None
+    assert read_pack_field(str(path), "absent", "default") == "default"
+    with PackReader(str(path)) as reader:
+        assert reader.fields() == list(RECORD)
+        assert "topic" in reader and "absent" not in reader
+        assert reader.read_fields(["topic", "absent"]) == {"topic": RECORD["topic"]}
+
+def test_large_payloads_are_compressed(tmp_path):
+    path = tmp_path / "record.pack"
+    write_pack(str(path), RECORD, "gzip")
+    with PackReader(str(path)) as reader:
+        kind, flags, offset, length = reader._fields["final_content"]
+        assert flags & FLAG_COMPRESSED
+        assert length < len(RECORD["final_content"].encode('utf-8'))
+        # Small fields are stored as they are
+        assert not reader._fields["topic"][1] & FLAG_COMPRESSED
+    assert len(RECORD["topic"]) < COMPRESS_MIN
+
+def test_nested_values_match_json():
+    data = encode_pack({"nested": RECORD["keywords"]}, None)
+    assert json.dumps(RECORD["keywords"], separators=(',', ':')).encode('utf-8') in data
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.pack"
+    path.write_bytes(b"JSON" + b"\0" * 16)
+    with pytest.raises(ValueError):
+        PackReader(str(path))
+
+def test_rejects_unknown_compression():
+    with pytest.raises(ValueError):
+        encode_pack(RECORD, "brotli")
+
+def test_converted_tree_loads_the_same_records(tmp_path):
+    coordinator = BlogTeamCoordinator(output_dir=str(tmp_path))
+    workflow_id = coordinator.create_blog_post("Docker", word_count=600)["workflow_id"]
+    before = {phase: coordinator.load_phase_data(workflow_id, phase) for phase in ("research", "content", "seo")}
+    summary = coordinator.load_workflow_summary(workflow_id)
+
+    stats = convert_tree(str(tmp_path))
+    assert stats["converted"] == 4 and stats["failed"] == 0
+
+    workflow_dir = coordinator.workflow_dir(workflow_id)
+    assert os.path.exists(os.path.join(workflow_dir, "workflow_summary.pack"))
+    assert not os.path.exists(os.path.join(workflow_dir, "workflow_summary.json"))
+    for phase, data in before.items():
+        assert coordinator.load_phase_data(workflow_id, phase) == data
+    assert coordinator.load_workflow_summary(workflow_id) == summary
+    assert coordinator.read_workflow_field(workflow_id, "seo_score") == summary["seo_score"]
@@ -0,0 +1,170 @@
+import re
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from keyword_matcher import KeywordHits, KeywordMatcher
+
+WORD_PATTERN = re.compile(r'\w+')
+SENTENCE_DELIMITER = re.compile(r'[.!?]+')
+PARAGRAPH_DELIMITER = re.compile(r'\n\n')
+HEADING_LINE = re.compile(r'^(#{1,6}) (.*)$', re.MULTILINE)
+
+class TextStats:
+    """
+    Reusable analysis of one document, computed once and shared by every SEO check
+
+    - words: whitespace-separated words (what ``str.split()`` returns)
+    - tokens / term_frequencies: lowercase ``\\w+`` tokens and their counts
+    - sentence_spans / paragraph_spans: (start, end) offsets of non-empty
+      sentences and paragraphs, with matching word counts
+    - headings: (level, heading text, line offset) for each Markdown heading
+    - regions: which part of the post (title, introduction, headings, body)
+      an offset falls in, for keyword placement
+    """
+
+    __slots__ = (
+        "text", "lower", "words", "word_count", "normalized_words",
+        "tokens", "term_frequencies",
+        "sentence_spans", "sentence_word_counts",
+        "paragraph_spans", "paragraph_word_counts",
+        "headings", "heading_marker_count", "_phrase_counts",
+        "_region_starts", "_region_names"
+    )
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+
+        self.words = text.split()
+        self.word_count = len(self.words)
+        # Words as the readability check compares them (case/punctuation folded)
+        self.normalized_words = Counter(word.lower().rstrip('.,!?') for word in self.words)
+
+        self.tokens = WORD_PATTERN.findall(self.lower)
+        self.term_frequencies = Counter(self.tokens)
+
+        self.sentence_spans, self.sentence_word_counts = self._segment(SENTENCE_DELIMITER)
+        self.paragraph_spans, self.paragraph_word_counts = self._segment(PARAGRAPH_DELIMITER)
+
+        self.headings = [
+            (len(match.group(1)), match.group(2).strip(), match.start())
+            for match in HEADING_LINE.finditer(text)
+        ]
+        self.heading_marker_count = text.count("##")
+        self._phrase_counts = {}
+        self._build_regions()
+
+    def _segment(self, delimiter) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """
+        Split the text on delimiter, keeping non-empty (stripped) segments
+        """
+        spans = []
+        word_counts = []
+        start = 0
+        boundaries = [(m.start(), m.end()) for m in delimiter.finditer(self.text)]
+        boundaries.append((len(self.text), len(self.text)))
+
+        for end, next_start in boundaries:
+            segment = self.text[start:end]
+            if segment.strip():
+                spans.append((start, end))
+                word_counts.append(len(segment.split()))
+            start = next_start
+
+        return spans, word_counts
+
+    def _build_regions(self) -> None:
+        """
+        Boundaries of the title line, introduction, heading lines and body
+        """
+        starts = [0]
+        names = ["body"]
+        seen_section = False
+        for level, _, start in self.headings:
+            line_end = self.text.find('\n', start)
+            line_end = len(self.text) if line_end == -1 else line_end
+            if level == 1 and not seen_section:
+                name, after = "title", "introduction"
+            else:
+                seen_section = True
+                name, after = "headings", "body"
+            starts.extend([start, line_end])
+            names.extend([name, after])
+        self._region_starts = starts
+        self._region_names = names
+
+    def region_at(self, offset: int) -> str:
+        """
+        Name of the region (title, introduction, headings, body) containing offset
+        """
+        return self._region_names[bisect_right(self._region_starts, offset) - 1]
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_spans)
+
+    @property
+    def paragraph_count(self) -> int:
+        return len(self.paragraph_spans)
+
+    def count_phrase(self, phrase: str) -> int:
+        """
+        Whole-word, case-insensitive occurrences of phrase
+        Single words are answered from the term frequencies; longer phrases
+        are searched once and memoized
+        """
+        phrase = phrase.lower()
+        if phrase in self._phrase_counts:
+            return self._phrase_counts[phrase]
+
+        if WORD_PATTERN.fullmatch(phrase):
+            count = self.term_frequencies[phrase]
+        else:
+            count = len(re.findall(rf'\b{re.escape(phrase)}\b', self.lower))
+
+        self._phrase_counts[phrase] = count
+        return count
+
+    def match_keywords(self, keywords: List[str], include_variants: bool = True) -> Dict[str, KeywordHits]:
+        """
+        Find every keyword and its variants in one automaton pass
+        Exact counts are remembered so later count_phrase calls are free
+        """
+        hits = KeywordMatcher(keywords, include_variants).search(self.lower)
+        for keyword, keyword_hits in hits.items():
+            if keyword:
+                self._phrase_counts[keyword.lower()] = keyword_hits.count
+        return hits
+
+    def keyword_placement(self, keyword_hits: KeywordHits) -> Dict:
+        """
+        Where a keyword's exact matches fall in the post
+        """
+        placement = {"title": 0, "introduction": 0, "headings": 0, "body": 0}
+        for start, _ in keyword_hits.positions:
+            placement[self.region_at(start)] += 1
+        placement["variant_count"] = keyword_hits.variant_count
+        placement["first_position"] = keyword_hits.positions[0][0] if keyword_hits.positions else None
+        return placement
+
+    def count_terms(self, terms: List[str]) -> int:
+        """
+        Total occurrences of the given (already normalized) words
+        """
+        return sum(self.normalized_words[term] for term in terms)
+
+    def summary(self) -> Dict:
+        return {
+            "word_count": self.word_count,
+            "sentences": self.sentence_count,
+            "paragraphs": self.paragraph_count,
+            "headings": len(self.headings),
+            "unique_terms": len(self.term_frequencies)
+        }
+
+def analyze_text(text: str) -> TextStats:
+    """
+    Analyze a document once; pass the result to every check that needs it
+    """
+    return TextStats(text)
@@ -4,6 +4,8 @@ Demo script to show web interface capabilities and create sample blogs
 """
 
 from blog_team_coordinator import BlogTeamCoordinator
+from blog_logging import configure_console_logging
+from output_layout import get_layout, read_layout_name, resolve_workflow_dir
 import os
 import webbrowser
 import time
@@ -63,7 +65,8 @@ def show_blog_page_links(blogs):
     
     for i, blog in enumerate(blogs, 1):
         workflow_id = blog['workflow_id']
-        blog_page_path = os.path.join("blog_output", workflow_id, "blog_page.html")
+        blog_page_path = os.path.join(resolve_workflow_dir("blog_output", workflow_id,
+                                                   get_layout(read_layout_name("blog_output") or "flat")), "blog_page.html")
         
         if os.path.exists(blog_page_path):
             abs_path = os.path.abspath(blog_page_path)
@@ -146,4 +149,5 @@ def main():
     print("💡 Next step: Run 'python run_app.py' to start the web interface!")
 
 if __name__ == "__main__":
+    configure_console_logging()
     main()
\ No newline at end of file
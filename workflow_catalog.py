@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Persistent index of completed workflows
+
+Listing workflows used to mean opening every workflow_summary.json under
+the output directory. The catalog keeps the listing fields in SQLite,
+updated when a workflow is exported, so listing is an indexed query.
+Every write also bumps a version number, which readers can key caches on.
+
+Rebuild the catalog for an existing output directory with:
+
+    python workflow_catalog.py rebuild blog_output
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import os
+import sqlite3
+import sys
+
+from blog_logging import configure_console_logging, get_logger
+from output_layout import iter_workflow_dirs
+from workflow_pack import PackReader, pack_path
+
+logger = get_logger("catalog")
+
+CATALOG_FILENAME = "catalog.sqlite3"
+
+# Sortable columns and the ORDER BY expression matching their (expression, workflow_id) index
+SORT_COLUMNS = {
+    "creation_date": "creation_date",
+    "seo_score": "seo_score",
+    "word_count": "word_count",
+    "topic": "topic COLLATE NOCASE"
+}
+
+# Right-hand side of each column's keyset comparison; the collation goes on
+# the parameter so the comparison can still seek the index
+KEYSET_PARAMETERS = {"topic": "? COLLATE NOCASE"}
+
+LISTING_FIELDS = ("workflow_id", "topic", "creation_date", "seo_score", "word_count")
+
+# Summary fields stored in the catalog
+CATALOG_FIELDS = ("workflow_id", "topic", "target_audience", "creation_date", "seo_score", "word_count")
+
+UPSERT_SQL = (
+    "INSERT OR REPLACE INTO workflows "
+    "(workflow_id, topic, target_audience, creation_date, seo_score, word_count) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+class WorkflowCatalog:
+    """
+    SQLite-backed catalog of workflow summaries
+    A connection is opened per operation, so one catalog can be shared
+    across threads and several processes can write to the same file.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.created = not os.path.exists(db_path)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS workflows (
+                    workflow_id TEXT PRIMARY KEY,
+                    topic TEXT NOT NULL,
+                    target_audience TEXT,
+                    creation_date TEXT NOT NULL,
+                    seo_score REAL,
+                    word_count INTEGER
+                );
+                DROP INDEX IF EXISTS idx_workflows_creation_date;
+                DROP INDEX IF EXISTS idx_workflows_seo_score;
+                DROP INDEX IF EXISTS idx_workflows_word_count;
+                DROP INDEX IF EXISTS idx_workflows_topic;
+                CREATE INDEX IF NOT EXISTS idx_workflows_creation_date_id ON workflows (creation_date, workflow_id);
+                CREATE INDEX IF NOT EXISTS idx_workflows_seo_score_id ON workflows (seo_score, workflow_id);
+                CREATE INDEX IF NOT EXISTS idx_workflows_word_count_id ON workflows (word_count, workflow_id);
+                CREATE INDEX IF NOT EXISTS idx_workflows_topic_id ON workflows (topic COLLATE NOCASE, workflow_id);
+                CREATE TABLE IF NOT EXISTS catalog_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    version INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO catalog_version (id, version) VALUES (0, 0);
+            """)
+
+    @contextmanager
+    def _connect(self):
+        """
+        Open a connection for one transaction; commits on success
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _bump_version(self, conn: sqlite3.Connection) -> None:
+        conn.execute("UPDATE catalog_version SET version = version + 1")
+
+    def version(self) -> int:
+        """
+        Changes whenever a workflow is added, updated or removed, by any process
+        """
+        with self._connect() as conn:
+            return conn.execute("SELECT version FROM catalog_version").fetchone()[0]
+
+    def _row(self, summary: Dict) -> tuple:
+        """
+        Catalog row of a summary; ValueError if it lacks the listing fields
+        """
+        if not isinstance(summary, dict):
+            raise ValueError("summary is not a JSON object")
+        for field in ("workflow_id", "topic", "creation_date"):
+            if not isinstance(summary.get(field), str):
+                raise ValueError(f"summary has no {field}")
+        for field in ("target_audience", "seo_score", "word_count"):
+            value = summary.get(field)
+            if value is not None and not isinstance(value, (str, int, float)):
+                raise ValueError(f"summary {field} is not a plain value")
+        return (
+            summary["workflow_id"],
+            summary["topic"],
+            summary.get("target_audience"),
+            summary["creation_date"],
+            summary.get("seo_score"),
+            summary.get("word_count")
+        )
+
+    def upsert(self, summary: Dict) -> None:
+        """
+        Add or update one workflow from its summary record
+        """
+        self.upsert_many([summary])
+
+    def upsert_many(self, summaries: Iterable[Dict]) -> int:
+        """
+        Add or update several workflows in a single transaction
+        """
+        rows = [self._row(summary) for summary in summaries]
+        with self._connect() as conn:
+            conn.executemany(UPSERT_SQL, rows)
+            self._bump_version(conn)
+        return len(rows)
+
+    def remove(self, workflow_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM workflows WHERE workflow_id = ?", (workflow_id,))
+            self._bump_version(conn)
+
+    def get(self, workflow_id: str) -> Optional[Dict]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM workflows WHERE workflow_id = ?", (workflow_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def _where(self, search: Optional[str], min_seo_score: Optional[float]):
+        clauses = []
+        params = []
+        if search:
+            clauses.append("topic LIKE ? ESCAPE '\\'")
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        if min_seo_score is not None:
+            clauses.append("seo_score >= ?")
+            params.append(min_seo_score)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _keyset_ranges(self, sort_by: str, descending: bool, after: Dict) -> List[Tuple[str, List]]:
+        """
+        Conditions selecting the rows behind the after row, in listing order
+        SQLite sorts NULLs before every value, so descending they come last.
+        Each condition is a single index range; OR-ing them would turn the
+        seek into a scan from the start of the index.
+        """
+        operator = "<" if descending else ">"
+        value, workflow_id = after[sort_by], after["workflow_id"]
+        if value is None:
+            ranges = [(f"{sort_by} IS NULL AND workflow_id {operator} ?", [workflow_id])]
+            if not descending:
+                ranges.append((f"{sort_by} IS NOT NULL", []))
+            return ranges
+
+        ranges = [(f"({sort_by}, workflow_id) {operator} ({KEYSET_PARAMETERS.get(sort_by, '?')}, ?)",
+                   [value, workflow_id])]
+        if descending:
+            ranges.append((f"{sort_by} IS NULL", []))
+        return ranges
+
+    def list(self, limit: Optional[int] = None, offset: int = 0,
+             sort_by: str = "creation_date", descending: bool = True,
+             search: Optional[str] = None,
+             min_seo_score: Optional[float] = None,
+             after: Optional[Dict] = None) -> List[Dict]:
+        """
+        One page of workflows, sorted and optionally filtered by topic/score
+        after is the last row of the previous page: the page then starts
+        right behind it by an index seek (keyset pagination), so deep pages
+        cost the same as the first, unlike a large offset. It must hold the
+        sort column, which may be None.
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"sort_by must be one of {', '.join(SORT_COLUMNS)}")
+
+        where, params = self._where(search, min_seo_score)
+        direction = "DESC" if descending else "ASC"
+        select = f"SELECT {', '.join(LISTING_FIELDS)} FROM workflows"
+        order = f" ORDER BY {SORT_COLUMNS[sort_by]} {direction}, workflow_id {direction}"
+        if after is None:
+            with self._connect() as conn:
+                return [dict(row) for row in conn.execute(
+                    f"{select}{where}{order} LIMIT ? OFFSET ?",
+                    params + [limit if limit is not None else -1, offset])]
+
+        if sort_by not in after or "workflow_id" not in after:
+            raise ValueError(f"after needs workflow_id and {sort_by} values")
+        wanted = offset + limit if limit is not None else None
+        rows = []
+        with self._connect() as conn:
+            for condition, condition_params in self._keyset_ranges(sort_by, descending, after):
+                if wanted is not None and len(rows) >= wanted:
+                    break
+                query = f"{select}{where} {'AND' if where else 'WHERE'} {condition}{order} LIMIT ?"
+                rows += conn.execute(query, params + condition_params +
+                                     [wanted - len(rows) if wanted is not None else -1])
+        return [dict(row) for row in rows[offset:]]
+
+    def count(self, search: Optional[str] = None,
+              min_seo_score: Optional[float] = None) -> int:
+        where, params = self._where(search, min_seo_score)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM workflows{where}", params).fetchone()[0]
+
+    def _read_summary(self, summary_file: str) -> Optional[Dict]:
+        """
+        Catalog fields of one summary; from a pack file only those fields are decoded
+        """
+        packed_file = pack_path(summary_file)
+        if os.path.isfile(packed_file):
+            with PackReader(packed_file) as reader:
+                return reader.read_fields(CATALOG_FIELDS)
+        if os.path.isfile(summary_file):
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return None
+
+    def rebuild(self, output_dir: str) -> int:
+        """
+        Re-index every workflow summary (JSON or pack file) under output_dir,
+        whatever the directory layout
+        Unreadable or malformed summaries are reported and skipped
+        """
+        rows = []
+        for _, workflow_dir in iter_workflow_dirs(output_dir):
+            summary_file = os.path.join(workflow_dir, "workflow_summary.json")
+            try:
+                summary = self._read_summary(summary_file)
+                if summary is not None:
+                    rows.append(self._row(summary))
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping unreadable summary %s: %s", summary_file, e)
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM workflows")
+            conn.executemany(UPSERT_SQL, rows)
+            self._bump_version(conn)
+        return len(rows)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] != "rebuild":
+        print("Usage: python workflow_catalog.py rebuild [output_dir]")
+        return 1
+
+    configure_console_logging()
+    output_dir = argv[1] if len(argv) > 1 else "blog_output"
+    catalog = WorkflowCatalog(os.path.join(output_dir, CATALOG_FILENAME))
+    indexed = catalog.rebuild(output_dir)
+    print(f"Indexed {indexed} workflows into {catalog.db_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
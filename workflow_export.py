@@ -0,0 +1,111 @@
+"""
+Streamed downloads and zip bundles of workflow files
+
+Nothing here holds a whole file or archive in memory: files are read in
+chunks sized to the file, records are re-encoded as they are written, and
+a bundle is produced as a zip stream (entries with data descriptors, no
+seeking) that can go straight to a socket or a file:
+
+    with open("bundle.zip", "wb") as f:
+        for chunk in coordinator.iter_workflow_bundle(workflow_id):
+            f.write(chunk)
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+import json
+import zipfile
+
+# Bounds of the read size used for streaming a file
+MIN_CHUNK_SIZE = 16 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+
+# Roughly how many reads a file is split into, within the bounds above
+CHUNKS_PER_FILE = 16
+
+def chunk_size_for(size: Optional[int]) -> int:
+    """
+    Read size for streaming a file of the given size
+    Small files go out in one read; large ones in 1 MiB reads
+    """
+    if not size:
+        return MIN_CHUNK_SIZE
+    return max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, size // CHUNKS_PER_FILE))
+
+def iter_file_chunks(path: str, chunk_size: Optional[int] = None,
+                     size: Optional[int] = None) -> Iterator[bytes]:
+    """
+    A file's bytes in chunks (sized with chunk_size_for unless given)
+    """
+    chunk_size = chunk_size or chunk_size_for(size)
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def iter_json_chunks(record: Dict, chunk_size: int = MIN_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    A record as indented JSON (as saved by the coordinator), encoded incrementally
+    """
+    pending = []
+    pending_size = 0
+    for text in json.JSONEncoder(indent=2, default=str).iterencode(record):
+        pending.append(text)
+        pending_size += len(text)
+        if pending_size >= chunk_size:
+            yield "".join(pending).encode('utf-8')
+            pending = []
+            pending_size = 0
+    if pending:
+        yield "".join(pending).encode('utf-8')
+
+class _ZipSink:
+    """
+    Write-only target for ZipFile whose output is drained between writes
+    Having no tell/seek makes ZipFile write a streamable archive.
+    """
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+# (name in the archive, modification time, chunk source, size if known)
+ZipEntry = Tuple[str, datetime, Callable[[], Iterable[bytes]], Optional[int]]
+
+def iter_zip(entries: Iterable[ZipEntry]) -> Iterator[bytes]:
+    """
+    A zip archive of the entries, produced as its bytes are ready
+    Each entry's chunks are only read while that entry is being written.
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, modified, chunks, size in entries:
+            info = zipfile.ZipInfo(name, date_time=modified.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            if size is not None:
+                info.file_size = size
+            with archive.open(info, 'w') as dest:
+                for chunk in chunks():
+                    dest.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            data = sink.drain()
+            if data:
+                yield data
+    data = sink.drain()
+    if data:
+        yield data
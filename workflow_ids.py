@@ -0,0 +1,132 @@
+"""
+Collision-free, time-sortable workflow IDs
+
+An ID is 100 bits written as 20 lowercase Crockford base32 characters:
+
+    48-bit Unix time in ms | 32-bit node | 20-bit sequence
+
+The node identifies the generating process: a hash of host name and PID,
+or the BLOG_NODE_ID environment variable (one number per host) in the high
+16 bits with the PID in the low 16, so IDs from different workers and hosts
+never collide. Within one node the sequence makes IDs strictly
+increasing, even for many IDs per millisecond or a clock that steps back.
+IDs sort by creation time as plain strings.
+
+Where workflow directories live is decided by output_layout.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+
+CROCKFORD_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+ID_LENGTH = 20
+
+TIMESTAMP_BITS = 48
+NODE_BITS = 32
+SEQUENCE_BITS = 20
+NODE_MASK = (1 << NODE_BITS) - 1
+HOST_BITS = 16
+PROCESS_MASK = (1 << (NODE_BITS - HOST_BITS)) - 1
+SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+
+WORKFLOW_ID_PATTERN = re.compile(rf'^([{CROCKFORD_ALPHABET}]{{{ID_LENGTH}}})(?:_|$)')
+
+def encode_base32(value: int, length: int = ID_LENGTH) -> str:
+    chars = []
+    for _ in range(length):
+        chars.append(CROCKFORD_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+def decode_base32(text: str) -> int:
+    value = 0
+    for char in text:
+        value = (value << 5) | CROCKFORD_ALPHABET.index(char)
+    return value
+
+def default_node_id() -> int:
+    """
+    32-bit node for this process: BLOG_NODE_ID and the PID if set, else a
+    hash of host and PID
+    """
+    configured = os.environ.get("BLOG_NODE_ID")
+    if configured:
+        # Every worker on the host shares BLOG_NODE_ID, so the PID keeps them apart
+        host = int(configured) & ((1 << HOST_BITS) - 1)
+        return (host << (NODE_BITS - HOST_BITS)) | (os.getpid() & PROCESS_MASK)
+    seed = f"{socket.gethostname()}:{os.getpid()}".encode('utf-8')
+    return int.from_bytes(hashlib.sha256(seed).digest()[:4], "big")
+
+class WorkflowIdGenerator:
+    """
+    Thread-safe generator of monotonic IDs for one node
+    Without a fixed node, the node is re-derived after a fork so pool
+    workers never share one.
+    """
+
+    def __init__(self, node: Optional[int] = None):
+        self._fixed_node = node
+        self._lock = threading.Lock()
+        self._pid = None
+        self._node = None
+        self._last_ms = -1
+        self._sequence = 0
+
+    def _current_node(self) -> int:
+        if self._fixed_node is not None:
+            return self._fixed_node & NODE_MASK
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._node = default_node_id()
+            self._last_ms = -1
+        return self._node
+
+    def next_id(self) -> str:
+        with self._lock:
+            node = self._current_node()
+            now = time.time_ns() // 1_000_000
+            if now > self._last_ms:
+                self._last_ms = now
+                self._sequence = 0
+            else:
+                # Same millisecond, or the clock stepped back: keep counting
+                self._sequence += 1
+                if self._sequence > SEQUENCE_MASK:
+                    self._last_ms += 1
+                    self._sequence = 0
+            value = (self._last_ms << (NODE_BITS + SEQUENCE_BITS)) | (node << SEQUENCE_BITS) | self._sequence
+        return encode_base32(value)
+
+_generator = WorkflowIdGenerator()
+
+def new_workflow_id(slug: str = "") -> str:
+    """
+    Fresh ID, followed by a readable slug when one is given
+    """
+    unique_id = _generator.next_id()
+    return f"{unique_id}_{slug}" if slug else unique_id
+
+def parse_workflow_id(workflow_id: str) -> Optional[Tuple[int, int, int]]:
+    """
+    (timestamp ms, node, sequence) of a generated ID; None for legacy IDs
+    """
+    match = WORKFLOW_ID_PATTERN.match(workflow_id)
+    if not match:
+        return None
+    value = decode_base32(match.group(1))
+    return (value >> (NODE_BITS + SEQUENCE_BITS),
+            (value >> SEQUENCE_BITS) & NODE_MASK,
+            value & SEQUENCE_MASK)
+
+def workflow_id_created(workflow_id: str) -> Optional[datetime]:
+    """
+    UTC creation time encoded in a generated ID
+    """
+    parsed = parse_workflow_id(workflow_id)
+    return datetime.fromtimestamp(parsed[0] / 1000, timezone.utc) if parsed else None
@@ -0,0 +1,285 @@
+"""
+Append-only journal of workflow progress
+
+Every coordinator appends one JSON line per event to
+``<output_dir>/journal.jsonl``:
+
+- ``start``: a workflow began, with the job parameters needed to resume it
+- ``phase_start`` / ``phase_done``: a phase began / its record was saved,
+  with the record's file name and SHA-256
+- ``phase_failed``: a phase raised; ``done``: the workflow was exported
+
+Lines are written with a single O_APPEND write, so they reach the file
+immediately and several processes can share the journal. fsync is batched
+(every ``sync_every`` events or ``sync_interval`` seconds), which bounds
+what a power loss can drop; a lost event only means a phase is redone on
+resume. Torn or corrupt lines are skipped when reading.
+
+Only unfinished workflows are kept: the in-memory index drops a workflow
+once it is done (its summary is the record from then on), and once the
+file passes ``compact_size`` it is rewritten without finished workflows'
+events. Writers hold a shared lock on ``journal.jsonl.lock`` while
+appending and compaction an exclusive one, so no process appends to a
+replaced file; every process notices the new file and reopens it.
+Compaction needs fcntl, so on Windows the journal only grows.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+import copy
+import json
+import os
+import threading
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory file locks, so the journal is never compacted
+    fcntl = None
+
+JOURNAL_FILENAME = "journal.jsonl"
+
+# Journal size past which finished workflows' events are dropped
+COMPACT_SIZE = 4 * 1024 * 1024
+
+def _sync_and_close(fd: int) -> None:
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class WorkflowJournal:
+    """
+    Journal writer plus an incrementally maintained index of workflow states
+    """
+
+    def __init__(self, path: str, sync_every: int = 64, sync_interval: float = 1.0,
+                 compact_size: int = COMPACT_SIZE):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_size = compact_size
+        self._lock_fd = None
+        if fcntl is not None:
+            self._lock_fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            weakref.finalize(self, os.close, self._lock_fd)
+        self._open()
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        # Size left by the last compaction; the next waits until the file doubles
+        self._compacted_size = 0
+        # Index of unfinished workflows, built from the journal file
+        # (identified by its inode) up to _read_offset
+        self._states = {}
+        self._read_offset = 0
+        self._read_inode = None
+        self.compact(min_size=compact_size)
+
+    def _open(self) -> None:
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._inode = os.fstat(self._fd).st_ino
+        self._finalizer = weakref.finalize(self, _sync_and_close, self._fd)
+
+    def _reopen_if_replaced(self) -> None:
+        """
+        Switch to the current journal file if another journal compacted it
+        """
+        if self._lock_fd is None:
+            return
+        try:
+            replaced = os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            replaced = True
+        if replaced:
+            self._finalizer()
+            self._unsynced = 0
+            self._open()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        if self._lock_fd is None:
+            yield
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def append(self, event: str, workflow_id: str, **fields) -> None:
+        entry = {"time": datetime.now().isoformat(), "event": event, "workflow_id": workflow_id}
+        entry.update(fields)
+        line = (json.dumps(entry, separators=(',', ':'), default=str) + "\n").encode('utf-8')
+
+        compact_due = False
+        with self._lock, self._file_lock(exclusive=False):
+            self._reopen_if_replaced()
+            os.write(self._fd, line)
+            self._unsynced += 1
+            if (self._unsynced >= self.sync_every
+                    or time.monotonic() - self._last_sync >= self.sync_interval):
+                self._sync()
+                compact_due = os.fstat(self._fd).st_size >= self._compact_threshold()
+        if compact_due:
+            self.compact(min_size=self._compact_threshold())
+
+    def _compact_threshold(self) -> int:
+        return max(self.compact_size, 2 * self._compacted_size)
+
+    def compact(self, min_size: int = 0) -> int:
+        """
+        Rewrite the journal without the events of finished workflows
+        Skipped while the file is smaller than min_size; returns the number
+        of events dropped
+        """
+        if self._lock_fd is None:
+            return 0
+        with self._lock, self._file_lock(exclusive=True):
+            self._reopen_if_replaced()
+            if os.fstat(self._fd).st_size < min_size:
+                return 0
+            self._sync()
+
+            lines = []
+            last_event = {}
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    entry = self._parse(line) if line.endswith(b"\n") else None
+                    if entry is not None:
+                        lines.append((entry["workflow_id"], line))
+                        last_event[entry["workflow_id"]] = entry["event"]
+            kept = [line for workflow_id, line in lines if last_event[workflow_id] != "done"]
+
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.writelines(kept)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._reopen_if_replaced()
+            self._compacted_size = sum(len(line) for line in kept)
+            return len(lines) - len(kept)
+
+    def record_start(self, workflow_id: str, params: Dict) -> None:
+        self.append("start", workflow_id, params=params)
+
+    def record_phase_start(self, workflow_id: str, phase: str) -> None:
+        self.append("phase_start", workflow_id, phase=phase)
+
+    def record_phase_done(self, workflow_id: str, phase: str, filename: str, checksum: str) -> None:
+        self.append("phase_done", workflow_id, phase=phase, file=filename, sha256=checksum)
+
+    def record_phase_failed(self, workflow_id: str, phase: str, error: str) -> None:
+        self.append("phase_failed", workflow_id, phase=phase, error=error)
+
+    def record_done(self, workflow_id: str) -> None:
+        self.append("done", workflow_id)
+
+    def sync(self) -> None:
+        """
+        Make every appended event durable now
+        """
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        if self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def entries(self) -> Iterator[Dict]:
+        """
+        Every readable event in the journal, oldest first
+        """
+        with open(self.path, 'rb') as f:
+            for line in f:
+                entry = self._parse(line)
+                if entry is not None:
+                    yield entry
+
+    def _parse(self, line: bytes) -> Optional[Dict]:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(entry, dict) or "event" not in entry or "workflow_id" not in entry:
+            return None
+        return entry
+
+    def _refresh(self) -> None:
+        """
+        Fold events appended since the last read (by any process) into the index
+        """
+        with open(self.path, 'rb') as f:
+            inode = os.fstat(f.fileno()).st_ino
+            if inode != self._read_inode:
+                # Compacted since the last read: index the new file from the start
+                self._states = {}
+                self._read_offset = 0
+                self._read_inode = inode
+            f.seek(self._read_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # A line still being written; read it next time
+                    break
+                self._read_offset += len(line)
+                entry = self._parse(line)
+                if entry is not None:
+                    self._apply(entry)
+
+    def _apply(self, entry: Dict) -> None:
+        workflow_id = entry["workflow_id"]
+        event = entry["event"]
+        if event == "start":
+            self._states[workflow_id] = {
+                "workflow_id": workflow_id,
+                "params": entry.get("params", {}),
+                "phases": {},
+                "status": "in_progress",
+                "error": None,
+                "updated": entry["time"]
+            }
+            return
+
+        state = self._states.get(workflow_id)
+        if state is None:
+            return
+        state["updated"] = entry["time"]
+        if event == "phase_start":
+            state["status"] = "in_progress"
+            state["error"] = None
+            state["phases"].pop(entry["phase"], None)
+        elif event == "phase_done":
+            state["phases"][entry["phase"]] = {"file": entry["file"], "sha256": entry["sha256"]}
+        elif event == "phase_failed":
+            state["status"] = "failed"
+            state["error"] = entry.get("error")
+        elif event == "done":
+            # Finished: the workflow's summary is its record from now on
+            del self._states[workflow_id]
+
+    def workflow_state(self, workflow_id: str) -> Optional[Dict]:
+        """
+        Latest known state of an unfinished workflow: params, saved phases and status
+        None for finished workflows and those that never started under a journal
+        """
+        with self._lock:
+            self._refresh()
+            state = self._states.get(workflow_id)
+            return copy.deepcopy(state) if state else None
+
+    def incomplete_workflows(self) -> List[str]:
+        """
+        Workflows that started but never finished (interrupted or failed)
+        """
+        with self._lock:
+            self._refresh()
+            return list(self._states)
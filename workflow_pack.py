@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Compact binary format for workflow records
+
+A pack file holds one record (a phase's data or a workflow summary) as
+length-prefixed top-level fields behind a small index, so a reader can
+fetch a single field such as ``seo_score`` without decoding the post body:
+
+    magic "WFPK" | version u8 | codec u8 | field count u16
+    per field: name length u16 | name | kind u8 | flags u8 | offset u32 | length u32
+    field payloads
+
+Strings are stored as raw UTF-8, scalars as fixed-width values and nested
+values as compact JSON. Payloads of at least COMPRESS_MIN bytes are
+compressed on their own with the file's codec (gzip, or zstd when the
+zstandard package is installed).
+
+Convert an existing output directory with:
+
+    python workflow_pack.py convert blog_output --compression gzip
+"""
+
+from typing import Dict, Iterator, List, Optional
+import argparse
+import gzip
+import json
+import os
+import struct
+import sys
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from blog_logging import configure_console_logging, get_logger
+
+logger = get_logger("pack")
+
+MAGIC = b"WFPK"
+VERSION = 1
+PACK_SUFFIX = ".pack"
+
+HEADER = struct.Struct("<4sBBH")
+FIELD_ENTRY = struct.Struct("<BBII")
+NAME_LENGTH = struct.Struct("<H")
+
+# Field kinds
+KIND_NONE, KIND_BOOL, KIND_INT, KIND_FLOAT, KIND_STR, KIND_JSON = range(6)
+
+# Field flags
+FLAG_COMPRESSED = 1
+
+CODECS = {None: 0, "gzip": 1, "zstd": 2}
+CODEC_NAMES = {number: name for name, number in CODECS.items()}
+
+# Payloads smaller than this are not worth compressing
+COMPRESS_MIN = 256
+
+# Files converted by the converter: phase records and the workflow summary
+RECORD_FILENAMES = ("research_data.json", "content_data.json", "seo_data.json",
+                    "workflow_summary.json")
+
+def pack_path(json_path: str) -> str:
+    """
+    Pack file that stands in for a JSON record file
+    """
+    root, _ = os.path.splitext(json_path)
+    return root + PACK_SUFFIX
+
+def _compress(codec: int, data: bytes) -> bytes:
+    if codec == CODECS["gzip"]:
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    return zstandard.ZstdCompressor(level=6).compress(data)
+
+def _decompress(codec: int, data: bytes) -> bytes:
+    if codec == CODECS["gzip"]:
+        return gzip.decompress(data)
+    if zstandard is None:
+        raise RuntimeError("This pack file is zstd-compressed; install the zstandard package")
+    return zstandard.ZstdDecompressor().decompress(data)
+
+def _encode_value(value) -> tuple:
+    """
+    (kind, payload bytes) for one top-level field
+    """
+    if value is None:
+        return KIND_NONE, b""
+    if isinstance(value, bool):
+        return KIND_BOOL, bytes([value])
+    if isinstance(value, int) and -2 ** 63 <= value < 2 ** 63:
+        return KIND_INT, struct.pack("<q", value)
+    if isinstance(value, float):
+        return KIND_FLOAT, struct.pack("<d", value)
+    if isinstance(value, str):
+        return KIND_STR, value.encode('utf-8')
+    return KIND_JSON, json.dumps(value, separators=(',', ':'), default=str).encode('utf-8')
+
+def _decode_value(kind: int, payload: bytes):
+    if kind == KIND_NONE:
+        return None
+    if kind == KIND_BOOL:
+        return bool(payload[0])
+    if kind == KIND_INT:
+        return struct.unpack("<q", payload)[0]
+    if kind == KIND_FLOAT:
+        return struct.unpack("<d", payload)[0]
+    if kind == KIND_STR:
+        return payload.decode('utf-8')
+    return json.loads(payload)
+
+def encode_pack(record: Dict, compression: Optional[str] = "gzip") -> bytes:
+    """
+    Serialize a record (a dict with string keys) to pack bytes
+    """
+    if compression not in CODECS:
+        raise ValueError(f"compression must be one of {', '.join(str(name) for name in CODECS)}")
+    if compression == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requires the zstandard package")
+
+    codec = CODECS[compression]
+    index = []
+    payloads = []
+    offset = 0
+    for name, value in record.items():
+        kind, payload = _encode_value(value)
+        flags = 0
+        if codec and len(payload) >= COMPRESS_MIN:
+            compressed = _compress(codec, payload)
+            if len(compressed) < len(payload):
+                payload, flags = compressed, FLAG_COMPRESSED
+        encoded_name = str(name).encode('utf-8')
+        index.append(NAME_LENGTH.pack(len(encoded_name)) + encoded_name
+                     + FIELD_ENTRY.pack(kind, flags, offset, len(payload)))
+        payloads.append(payload)
+        offset += len(payload)
+
+    return b"".join([HEADER.pack(MAGIC, VERSION, codec, len(index))] + index + payloads)
+
+def write_pack(path: str, record: Dict, compression: Optional[str] = "gzip") -> int:
+    """
+    Atomically write a record as a pack file; returns its size in bytes
+    """
+    data = encode_pack(record, compression)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+class PackReader:
+    """
+    Random access to the fields of one pack file
+    Only the header and index are read up front; each field is read and
+    decoded on request.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_index(self) -> None:
+        magic, version, codec, field_count = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} workflow pack file")
+        self.codec = codec
+        self._fields = {}
+        for _ in range(field_count):
+            (name_length,) = NAME_LENGTH.unpack(self._file.read(NAME_LENGTH.size))
+            name = self._file.read(name_length).decode('utf-8')
+            self._fields[name] = FIELD_ENTRY.unpack(self._file.read(FIELD_ENTRY.size))
+        self._data_start = self._file.tell()
+
+    def fields(self) -> List[str]:
+        return list(self._fields)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fields
+
+    def read_field(self, name: str, default=None):
+        """
+        Decode one field without touching the others
+        """
+        if name not in self._fields:
+            return default
+        kind, flags, offset, length = self._fields[name]
+        self._file.seek(self._data_start + offset)
+        payload = self._file.read(length)
+        if flags & FLAG_COMPRESSED:
+            payload = _decompress(self.codec, payload)
+        return _decode_value(kind, payload)
+
+    def read_fields(self, names) -> Dict:
+        return {name: self.read_field(name) for name in names if name in self._fields}
+
+    def read_all(self) -> Dict:
+        return {name: self.read_field(name) for name in self._fields}
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_pack(path: str) -> Dict:
+    """
+    Read a whole record from a pack file
+    """
+    with PackReader(path) as reader:
+        return reader.read_all()
+
+def read_pack_field(path: str, name: str, default=None):
+    """
+    Read a single field (e.g. seo_score) from a pack file
+    """
+    with PackReader(path) as reader:
+        return reader.read_field(name, default)
+
+def iter_record_files(output_dir: str) -> Iterator[str]:
+    """
+    JSON record files (phase data and summaries) anywhere under output_dir
+    """
+    for root, _, filenames in os.walk(output_dir):
+        for filename in sorted(filenames):
+            if filename in RECORD_FILENAMES:
+                yield os.path.join(root, filename)
+
+def convert_tree(output_dir: str, compression: Optional[str] = "gzip",
+                 keep_json: bool = False) -> Dict:
+    """
+    Convert every JSON record under output_dir to a pack file
+    Records are stored as they are on disk, so deduplicated records keep
+    their blob references.
+    """
+    stats = {"converted": 0, "failed": 0, "json_bytes": 0, "pack_bytes": 0}
+    for json_path in iter_record_files(output_dir):
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            pack_bytes = write_pack(pack_path(json_path), record, compression)
+        except (OSError, ValueError) as e:
+            logger.warning("Skipping %s: %s", json_path, e)
+            stats["failed"] += 1
+            continue
+
+        stats["converted"] += 1
+        stats["json_bytes"] += os.path.getsize(json_path)
+        stats["pack_bytes"] += pack_bytes
+        if not keep_json:
+            os.remove(json_path)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Workflow pack files")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert JSON records under a directory")
+    convert.add_argument("output_dir", nargs="?", default="blog_output")
+    convert.add_argument("--compression", choices=["none", "gzip", "zstd"], default="gzip")
+    convert.add_argument("--keep-json", action="store_true",
+                         help="Keep the JSON files next to the pack files")
+
+    show = commands.add_parser("show", help="Print a pack file, or one of its fields")
+    show.add_argument("path")
+    show.add_argument("field", nargs="?")
+
+    args = parser.parse_args(argv)
+    configure_console_logging()
+
+    if args.command == "convert":
+        compression = None if args.compression == "none" else args.compression
+        stats = convert_tree(args.output_dir, compression, args.keep_json)
+        saved = 1 - stats["pack_bytes"] / stats["json_bytes"] if stats["json_bytes"] else 0
+        print(f"Converted {stats['converted']} records ({stats['failed']} failed): "
+              f"{stats['json_bytes']:,} -> {stats['pack_bytes']:,} bytes ({saved:.0%} smaller)")
+        return 1 if stats["failed"] else 0
+
+    with PackReader(args.path) as reader:
+        value = reader.read_field(args.field) if args.field else reader.read_all()
+    print(json.dumps(value, indent=2, default=str))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())